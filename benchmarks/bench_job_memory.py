@@ -0,0 +1,110 @@
+"""
+Memory used by job dictionaries versus compact Job records, plus a check
+that Job records written by JsonlJobWriter read back unchanged
+
+    python -m benchmarks.bench_job_memory            # 100k jobs
+    python -m benchmarks.bench_job_memory --jobs 500000
+"""
+import argparse
+import gc
+import os
+import sys
+import tempfile
+import tracemalloc
+
+from naukri_job import Job
+from naukri_output import JsonlJobWriter, iter_jsonl
+from naukri_parser import parse_job_cards
+from benchmarks.fixtures import results_page
+
+
+def _fresh(value):
+    """A copy of a string that is a separate object, as it is after parsing each page"""
+    return (value + " ")[:-1] if isinstance(value, str) else value
+
+
+def job_dicts(count, templates):
+    """
+    Yield job dictionaries shaped like scraped ones, each with its own string objects
+
+    Args:
+        count (int): Number of jobs
+        templates (list): Parsed fixture jobs to vary
+    """
+    for number in range(count):
+        template = templates[number % len(templates)]
+        job = {key: _fresh(value) for key, value in template.items()}
+        job['skills'] = [_fresh(skill) for skill in template['skills']]
+        job['job_id'] = str(200000000000 + number)
+        job['link'] = f"{template['link'].rsplit('-', 1)[0]}-{job['job_id']}"
+        yield job
+
+
+def measure(build):
+    """
+    Bytes still allocated after building a collection
+
+    Args:
+        build (callable): Returns the collection to measure
+
+    Returns:
+        int: Allocated bytes held by the collection
+    """
+    gc.collect()
+    tracemalloc.start()
+    collection = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del collection
+    return size
+
+
+def check_jsonl_round_trip(templates):
+    """
+    Write a page of Job records with JsonlJobWriter and read it back
+
+    Args:
+        templates (list): Parsed fixture jobs
+
+    Returns:
+        bool: True if every record came back as the same job
+    """
+    records = [Job.from_dict(job) for job in job_dicts(len(templates), templates)]
+    fd, path = tempfile.mkstemp(suffix=".jsonl")
+    os.close(fd)
+    try:
+        with JsonlJobWriter(path) as writer:
+            writer.write_page(records)
+        read_back = [Job.from_dict(job) for job in iter_jsonl(path)]
+    finally:
+        os.remove(path)
+    return read_back == records
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare memory of job dicts and Job records")
+    parser.add_argument("--jobs", type=int, default=100000, help="Number of jobs to hold in memory")
+    args = parser.parse_args(argv)
+
+    templates = [job for page in range(1, 11) for job in parse_job_cards(results_page(page, 20, "https://www.naukri.com"))]
+
+    dict_bytes = measure(lambda: list(job_dicts(args.jobs, templates)))
+    job_bytes = measure(lambda: [Job.from_dict(job) for job in job_dicts(args.jobs, templates)])
+
+    per_100k = 100000 / args.jobs
+    print(f"📦 {args.jobs} jobs")
+    print(f"  dicts: {dict_bytes / 1024 / 1024:.1f} MB ({dict_bytes / args.jobs:.0f} bytes/job)")
+    print(f"  Job:   {job_bytes / 1024 / 1024:.1f} MB ({job_bytes / args.jobs:.0f} bytes/job)")
+    print(f"💾 Saved {(dict_bytes - job_bytes) * per_100k / 1024 / 1024:.1f} MB per 100k jobs "
+          f"({1 - job_bytes / dict_bytes:.0%})")
+
+    if not check_jsonl_round_trip(templates):
+        print("❌ Job records written with JsonlJobWriter did not read back unchanged")
+        return 1
+    print("✅ Job records round-trip through JsonlJobWriter")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
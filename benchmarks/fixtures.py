@@ -0,0 +1,167 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from html import escape
+from urllib.parse import urlsplit
+import threading
+
+from naukri_parser import JOB_CARD_CLASS
+from naukri_pagination import page_number_from_url, page_url
+
+
+SEARCH_SLUG = "python-developer-jobs-in-bangalore"
+
+_COMPANIES = ["Infosys", "Tata Consultancy Services", "Wipro", "Accenture", "Flipkart", "Swiggy", "Zoho"]
+_CITIES = ["Bengaluru", "Hyderabad", "Pune", "Chennai", "Mumbai", "Noida", "Gurugram"]
+_SKILLS = ["Python", "Django", "Flask", "SQL", "AWS", "Docker", "Kubernetes", "REST", "Pandas", "Git"]
+_POSTED = ["Just Now", "1 Day Ago", "3 Days Ago", "7 Days Ago", "30+ Days Ago"]
+
+SEARCH_FORM = """
+<div class="nI-gNb-search-bar">
+  <div class="nI-gNb-sb__main">
+    <div class="nI-gNb-sb__keywords"><input class="suggestor-input" placeholder="Enter keyword / designation / companies"></div>
+    <div class="nI-gNb-sb__expDD"><input id="experienceDD" placeholder="Select experience" readonly></div>
+    <div class="nI-gNb-sb__locations"><input class="suggestor-input" placeholder="Enter location"></div>
+    <button class="nI-gNb-sb__icon-wrapper">Search</button>
+  </div>
+</div>
+"""
+
+
+def job_card(job_number, base_url):
+    """
+    One synthetic results card with the markup of a live Naukri card
+
+    Args:
+        job_number (int): Global job number, used for the job id and to vary fields
+        base_url (str): Server root for the job link
+
+    Returns:
+        str: Card HTML
+    """
+    job_id = f"{100000000000 + job_number}"
+    company = _COMPANIES[job_number % len(_COMPANIES)]
+    city = _CITIES[job_number % len(_CITIES)]
+    low = job_number % 8
+    skills = "".join(
+        f"<li class='dot-gt tag-li '>{skill}</li>"
+        for skill in (_SKILLS[(job_number + offset) % len(_SKILLS)] for offset in range(5))
+    )
+    return f"""
+<div class="{JOB_CARD_CLASS}" data-job-id="{job_id}">
+  <div class="cust-job-tuple layout-wrapper lay-2 sjw__tuple">
+    <div class="row1"><h2><a class="title" href="{base_url}/job-listings-python-developer-{escape(company.lower().replace(' ', '-'))}-{job_id}" title="Python Developer {job_number}">Python Developer {job_number}</a></h2></div>
+    <div class="row2"><span class=" comp-dtls-wrap"><a class="comp-name mw-25" href="{base_url}/{escape(company.lower().replace(' ', '-'))}-jobs-careers-{job_number % 97}">{escape(company)}</a><a class="rating"><span class="main-2">{3.5 + (job_number % 15) / 10:.1f}</span></a></span></div>
+    <div class="row3"><div class="job-details">
+      <span class="exp-wrap"><span class="ni-job-tuple-icon ni-job-tuple-icon-srp-experience exp"><span class="expwdth" title="{low}-{low + 4} Yrs">{low}-{low + 4} Yrs</span></span></span>
+      <span class="loc-wrap ver-line"><span class="ni-job-tuple-icon ni-job-tuple-icon-srp-location loc"><span class="locWdth" title="{city}, Karnataka">{city}, Karnataka</span></span></span>
+    </div></div>
+    <div class="row4"><span class="job-desc ni-job-tuple-icon ni-job-tuple-icon-srp-description">Build and maintain Python services, REST APIs and data pipelines for job {job_number}.</span></div>
+    <div class="row5"><ul class="tags-gt ">{skills}</ul></div>
+    <div class="row6"><span class="job-post-day ">{_POSTED[job_number % len(_POSTED)]}</span></div>
+  </div>
+</div>"""
+
+
+def results_page(page_number, cards_per_page, base_url=""):
+    """
+    A synthetic results page with the search bar, job cards and pagination links
+
+    Args:
+        page_number (int): Page number, starting at 1
+        cards_per_page (int): Number of job cards on the page
+        base_url (str): Server root for links
+
+    Returns:
+        str: Page HTML
+    """
+    first = (page_number - 1) * cards_per_page
+    cards = "".join(job_card(first + i, base_url) for i in range(cards_per_page))
+    first_url = f"{base_url}/{SEARCH_SLUG}"
+    pagination = (
+        f'<div class="styles_pagination__oIvXh">'
+        f'<a class="styles_btn-secondary__2AsIP" href="{page_url(first_url, max(1, page_number - 1))}">Previous</a>'
+        f'<a class="styles_btn-secondary__2AsIP" href="{page_url(first_url, page_number + 1)}">Next</a>'
+        f'</div>'
+    )
+    return (f"<!DOCTYPE html><html><head><title>Python Developer Jobs - Page {page_number}</title></head>"
+            f"<body>{SEARCH_FORM}<div class=\"styles_job-listing-container__OCfZC\">{cards}</div>"
+            f"{pagination}</body></html>")
+
+
+class FixtureServer:
+    """
+    Local stand-in for naukri.com serving synthetic results pages
+
+    /python-developer-jobs-in-bangalore[-N] serves page N; pages past the
+    last one redirect to the first page, as the live site does.
+    """
+
+    def __init__(self, pages=5, cards_per_page=20, host="127.0.0.1", port=0):
+        """
+        Args:
+            pages (int): Number of results pages available
+            cards_per_page (int): Job cards per page
+            host (str): Interface to bind
+            port (int): Port to bind, 0 picks a free one
+        """
+        self.pages = pages
+        self.cards_per_page = cards_per_page
+        self.requests = 0
+        self.server = ThreadingHTTPServer((host, port), self._handler())
+        self.base_url = f"http://{host}:{self.server.server_address[1]}"
+        self.results_url = f"{self.base_url}/{SEARCH_SLUG}"
+        self.thread = None
+        # Rendering is deterministic, so each page is built once
+        self._cache = {}
+
+    def _handler(self):
+        fixture = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                fixture.requests += 1
+                path = urlsplit(self.path).path
+                if path in ("/", ""):
+                    return self._send(200, f"<html><body>{SEARCH_FORM}</body></html>")
+                if not path.lstrip('/').startswith(SEARCH_SLUG):
+                    return self._send(404, "<html><body>Not found</body></html>")
+                page_number = page_number_from_url(self.path)
+                if page_number > fixture.pages:
+                    self.send_response(302)
+                    self.send_header('Location', fixture.results_url)
+                    self.end_headers()
+                    return
+                return self._send(200, fixture.page(page_number))
+
+            def _send(self, status, body):
+                payload = body.encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def page(self, page_number):
+        """HTML of a results page"""
+        if page_number not in self._cache:
+            self._cache[page_number] = results_page(page_number, self.cards_per_page, self.base_url)
+        return self._cache[page_number]
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, name="fixture-server", daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
@@ -0,0 +1,245 @@
+"""
+Offline scraper benchmarks against a local stand-in for naukri.com
+
+Run from the repository root:
+
+    python -m benchmarks.run_benchmarks                  # compare with the saved baseline
+    python -m benchmarks.run_benchmarks --save-baseline  # record a new baseline
+    python -m benchmarks.run_benchmarks --offline        # parser only, no Chrome
+"""
+from contextlib import contextmanager, redirect_stdout
+import argparse
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+
+import psutil
+
+from naukri_parser import parse_job_cards
+from benchmarks.fixtures import FixtureServer
+
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# Metrics where a larger value is better; every other metric should go down
+HIGHER_IS_BETTER = ('cards_per_sec', 'pages_per_sec')
+
+
+class PeakMemory:
+    """
+    Samples the resident memory of this process and its children (chromedriver, Chrome)
+    """
+
+    def __init__(self, interval=0.1):
+        self.interval = interval
+        self.peak_mb = 0.0
+        self.process = psutil.Process()
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self._run, name="rss-sampler", daemon=True)
+
+    def sample(self):
+        processes = [self.process] + self.process.children(recursive=True)
+        total = 0
+        for process in processes:
+            try:
+                total += process.memory_info().rss
+            except psutil.Error:
+                pass
+        self.peak_mb = max(self.peak_mb, total / (1024 * 1024))
+
+    def _run(self):
+        while not self.stop_event.wait(self.interval):
+            self.sample()
+
+    def __enter__(self):
+        self.sample()
+        self.thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop_event.set()
+        self.thread.join()
+        self.sample()
+
+
+class CommandCounter:
+    """
+    Counts WebDriver commands sent by a driver
+    """
+
+    def __init__(self, driver):
+        self.count = 0
+        execute = driver.execute
+
+        def counting_execute(driver_command, params=None):
+            self.count += 1
+            return execute(driver_command, params)
+
+        driver.execute = counting_execute
+
+    def reset(self):
+        self.count = 0
+
+
+@contextmanager
+def phase(results, name, quiet=True):
+    """
+    Time a block and store its wall time under results['phases'][name]
+    """
+    output = io.StringIO() if quiet else sys.stdout
+    start = time.perf_counter()
+    with redirect_stdout(output):
+        yield
+    results['phases'][name] = time.perf_counter() - start
+
+
+def bench_offline(server, results, rounds):
+    """
+    Parse every fixture page with lxml, no browser involved
+    """
+    pages = [server.page(number) for number in range(1, server.pages + 1)]
+    cards = 0
+    with phase(results, 'parse_offline'):
+        for _ in range(rounds):
+            for page_html in pages:
+                cards += len(parse_job_cards(page_html, base_url=server.base_url))
+    seconds = results['phases']['parse_offline']
+    results['metrics']['parse_offline.cards_per_sec'] = cards / seconds if seconds else 0.0
+
+
+def bench_browser(server, results, engines, quiet):
+    """
+    Run the live extraction, pagination and file output paths in headless Chrome
+    """
+    from naukri import NaukriLogin
+
+    with phase(results, 'browser_start', quiet):
+        scraper = NaukriLogin(headless=True)
+    counter = CommandCounter(scraper.driver)
+    try:
+        first_page = server.results_url
+        for engine in engines:
+            scraper.navigate(first_page)
+            counter.reset()
+            name = f'extract_job_listings.{engine}'
+            with phase(results, name, quiet):
+                jobs = scraper.extract_job_listings(max_results=server.cards_per_page, engine=engine)
+            seconds = results['phases'][name]
+            results['metrics'][f'{name}.cards_per_sec'] = len(jobs) / seconds if seconds else 0.0
+            results['metrics'][f'{name}.webdriver_calls_per_card'] = counter.count / max(len(jobs), 1)
+
+        scraper.results_url = first_page
+        counter.reset()
+        with phase(results, 'extract_job_listings_with_pagination', quiet):
+            jobs = scraper.extract_job_listings_with_pagination(
+                max_jobs=server.pages * server.cards_per_page, max_pages=server.pages
+            )
+        seconds = results['phases']['extract_job_listings_with_pagination']
+        pages_visited = -(-len(jobs) // server.cards_per_page)
+        results['metrics']['pagination.cards_per_sec'] = len(jobs) / seconds if seconds else 0.0
+        results['metrics']['pagination.pages_per_sec'] = pages_visited / seconds if seconds else 0.0
+        results['metrics']['pagination.webdriver_calls_per_card'] = counter.count / max(len(jobs), 1)
+
+        # save_jobs_to_file writes timestamped files into the working directory
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as output_dir:
+            os.chdir(output_dir)
+            try:
+                with phase(results, 'save_jobs_to_file', quiet):
+                    scraper.save_jobs_to_file(jobs)
+            finally:
+                os.chdir(cwd)
+    finally:
+        with redirect_stdout(io.StringIO()):
+            scraper.close()
+
+
+def compare(results, baseline, tolerance):
+    """
+    Compare metrics and phase times with a baseline
+
+    Returns:
+        list: Human-readable descriptions of regressions
+    """
+    regressions = []
+    current = dict(results['metrics'], **{f'phase.{name}': value for name, value in results['phases'].items()})
+    previous = dict(baseline['metrics'], **{f'phase.{name}': value for name, value in baseline['phases'].items()})
+    for name, old in previous.items():
+        new = current.get(name)
+        if new is None or not old:
+            continue
+        if name.endswith(HIGHER_IS_BETTER):
+            if new < old * (1 - tolerance):
+                regressions.append(f"{name}: {new:.2f} vs baseline {old:.2f} ({new / old - 1:+.0%})")
+        elif new > old * (1 + tolerance):
+            regressions.append(f"{name}: {new:.2f} vs baseline {old:.2f} ({new / old - 1:+.0%})")
+    return regressions
+
+
+def print_results(results):
+    print("📊 Benchmark results")
+    for name, value in sorted(results['metrics'].items()):
+        print(f"  {name}: {value:.2f}")
+    print("⏱️ Wall time per phase")
+    for name, seconds in results['phases'].items():
+        print(f"  {name}: {seconds:.3f}s")
+    print(f"🧠 Peak RSS: {results['metrics']['peak_rss_mb']:.0f} MB")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Naukri scraper against local fixture pages")
+    parser.add_argument("--pages", type=int, default=5, help="Results pages served by the fixture server")
+    parser.add_argument("--cards-per-page", type=int, default=20, help="Job cards per results page")
+    parser.add_argument("--engines", default="html,js,webdriver", help="Comma-separated extraction engines")
+    parser.add_argument("--rounds", type=int, default=20, help="Repetitions of the offline parse benchmark")
+    parser.add_argument("--offline", action="store_true", help="Only run the parser benchmark, no Chrome")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline file to compare with")
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Allowed relative slowdown before a metric counts as a regression")
+    parser.add_argument("--verbose", action="store_true", help="Show the scraper's own output")
+    args = parser.parse_args(argv)
+
+    results = {'metrics': {}, 'phases': {}, 'config': vars(args).copy()}
+    for key in ('baseline', 'save_baseline', 'tolerance', 'verbose'):
+        results['config'].pop(key)
+
+    with FixtureServer(pages=args.pages, cards_per_page=args.cards_per_page) as server, PeakMemory() as memory:
+        bench_offline(server, results, args.rounds)
+        if not args.offline:
+            bench_browser(server, results, [engine for engine in args.engines.split(",") if engine],
+                          quiet=not args.verbose)
+    results['metrics']['peak_rss_mb'] = memory.peak_mb
+    print_results(results)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"💾 Baseline saved to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("ℹ️ No baseline yet, run with --save-baseline to record one")
+        return 0
+
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    if baseline.get('config') != results['config']:
+        print("⚠️ Baseline was recorded with different settings, comparison may be misleading")
+
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"❌ {len(regressions)} regressions against {args.baseline}:")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+    print(f"✅ No regressions against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,14 +3,35 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
+from naukri_parser import SELECTORS, JOB_CARD_CLASS, clean_text, is_experience_text, is_location_text, parse_job_cards
+from naukri_scripts import EXTRACT_JOBS_SCRIPT
+from naukri_waits import WaitStrategy, ScrapeCancelled
+from naukri_pagination import RESULTS_PER_PAGE, base_results_url, build_search_url, normalize_query, page_number_from_url, page_range, page_url
+from naukri_session import SessionStore, SESSION_CHECK_URL
+from naukri_fetch import FETCH_BACKENDS, BrowserFetcher, HttpFetcher, FetchError
+from naukri_profile import build_chrome_options, enable_request_blocking, PageLoadStats
+from naukri_store import JobStore
+from naukri_output import JsonlJobWriter, output_timestamp, write_summary, write_summary_from_jsonl
+from naukri_details import JobEnricher
+from naukri_cache import CachingFetcher, PageCache
+from naukri_metrics import ScrapeMetrics
+from naukri_selectors import DEFAULT_SELECTOR_FILE, SelectorResolver
+from naukri_job import as_dicts
+from naukri_normalize import Normalizer, parse_salary
+import threading
 import time
 import os
 
 
+# Available strategies for turning a results page into job dictionaries
+EXTRACTION_ENGINES = ("html", "js", "webdriver")
+
+
 class NaukriLogin:
-    def __init__(self, email=None, password=None, headless=False):
+    def __init__(self, email=None, password=None, headless=False, extraction_engine="html", wait_timeouts=None,
+                 session_file=None, fetch_backend="browser", lean=False, job_store=None, stop_event=None,
+                 page_cache=None, metrics_file=None, selector_file=DEFAULT_SELECTOR_FILE, progress_callback=None, normalize=False):
         """
         Initialize the Naukri login automation
 
@@ -18,27 +39,118 @@ class NaukriLogin:
             email (str, optional): Your Naukri email/username
             password (str, optional): Your Naukri password
             headless (bool): Run browser in headless mode (default: False)
+            extraction_engine (str): How result cards are read - "html" parses one
+                page_source snapshot locally, "js" collects every card in a single
+                execute_script call, "webdriver" queries each field live
+            wait_timeouts (dict, optional): Initial timeout in seconds per wait step,
+                see WaitStrategy.DEFAULT_TIMEOUTS
+            session_file (str, optional): Where to persist the logged-in session so
+                later runs can skip the login form
+            fetch_backend (str): How result pages are downloaded - "browser" renders
+                them in Chrome, "http" reuses the browser's cookies to download them
+                over pooled HTTP and parses them offline
+            lean (bool): Use the lean browser profile - eager page loads and no
+                images, fonts, media, trackers, extensions or GPU
+            job_store (str or JobStore, optional): SQLite job store (or its path)
+                that paginated scrapes write into
+            stop_event (threading.Event, optional): Shared event that stops this
+                scraper's work when set; one is created if not given
+            page_cache (str or PageCache, optional): On-disk page cache (or its path)
+                consulted before results and detail pages are downloaded
+            metrics_file (str, optional): JSON file the phase timings and selector
+                hit rates are written to after each search; a Prometheus text
+                file with the same name and a .prom extension is written next to it
+            selector_file (str, optional): Where the learned order of fallback
+                selectors is kept between runs, None to keep it in memory only
+            progress_callback (callable, optional): Called from the scraping thread
+                with (event, data) as pagination progresses, see _emit_progress
+            normalize (bool): Add typed fields (experience_min/max, posted_at,
+                rating_value, cities, salary_min/max) to paginated jobs, see naukri_normalize
         """
+        if extraction_engine not in EXTRACTION_ENGINES:
+            raise ValueError(f"Unknown extraction engine '{extraction_engine}', expected one of {EXTRACTION_ENGINES}")
+        if fetch_backend not in FETCH_BACKENDS:
+            raise ValueError(f"Unknown fetch backend '{fetch_backend}', expected one of {FETCH_BACKENDS}")
+
         self.email = email
         self.password = password
+        self.extraction_engine = extraction_engine
+        self.fetch_backend = fetch_backend
+        self.fetchers = {}
         self.driver = None
         self.wait = None
+        self.waits = None
+        self.results_url = None
+        self.session_store = SessionStore(session_file) if session_file else None
+        self.page_stats = PageLoadStats()
+        self.metrics = ScrapeMetrics()
+        self.metrics_file = metrics_file
+        self.selectors = SelectorResolver(selector_file)
+        self.progress_callback = progress_callback
+        self.normalize = normalize
+        self.stop_event = stop_event or threading.Event()
+        # Only close stores we opened ourselves; a passed-in store may be shared
+        self.owns_job_store = isinstance(job_store, str)
+        self.job_store = JobStore(job_store) if self.owns_job_store else job_store
+        self.owns_page_cache = isinstance(page_cache, str)
+        self.page_cache = PageCache(page_cache) if self.owns_page_cache else page_cache
 
         # Chrome options
-        chrome_options = Options()
-        if headless:
-            chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
+        chrome_options = build_chrome_options(headless=headless, lean=lean)
 
         # Initialize the driver
         # Note: Make sure you have chromedriver installed or use webdriver-manager
         self.driver = webdriver.Chrome(options=chrome_options)
         self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
         self.wait = WebDriverWait(self.driver, 10)
+        self.waits = WaitStrategy(self.driver, wait_timeouts, cancel_event=self.stop_event)
+        if lean:
+            enable_request_blocking(self.driver)
+
+    def stop(self):
+        """
+        Ask the scraper to stop; running waits and pagination loops exit at their next check
+        """
+        self.stop_event.set()
+
+    def is_stopped(self):
+        """
+        Check whether stop() has been called
+
+        Returns:
+            bool: True once the scraper was asked to stop
+        """
+        return self.stop_event.is_set()
+
+    def _emit_progress(self, event, **data):
+        """
+        Report pagination progress to the progress callback, if any
+        
+        Events are "page_started" (page, total, max_jobs), "jobs_extracted" (page,
+        jobs, total), "page_done" (page, total, max_jobs, pages_done,
+        remaining_pages, eta_seconds) and "finished" (total, pages_done, stopped).
+        
+        Args:
+            event (str): Event name
+            **data: Event details
+        """
+        if not self.progress_callback:
+            return
+        try:
+            self.progress_callback(event, data)
+        except Exception as e:
+            print(f"⚠️ Progress callback failed on {event}: {e}")
+
+    def navigate(self, url):
+        """
+        Open a URL, recording download size and load time of the page being left
+        
+        Args:
+            url (str): URL to open
+        """
+        self.page_stats.record(self.driver)
+        with self.metrics.span('page_load'):
+            self.driver.get(url)
 
     def login(self, email=None, password=None):
         """
@@ -54,22 +166,68 @@ class NaukriLogin:
         # Use provided credentials or fall back to instance variables
         login_email = email or self.email
         login_password = password or self.password
+
+        # Reuse a saved session when it is still accepted by the site
+        if self.session_store:
+            with self.metrics.span('session_restore'):
+                restored = self.restore_session(login_email)
+            if restored:
+                return True
         
         if not login_email or not login_password:
             print("❌ Email and password are required for login")
             return False
+
+        with self.metrics.span('login'):
+            logged_in = self._login_with_form(login_email, login_password)
+        if not logged_in:
+            return False
+
+        if self.session_store:
+            self.session_store.save(self.driver, login_email)
+        return True
+
+    def restore_session(self, email=None):
+        """
+        Restore a saved session and check that it is still logged in
+        
+        Args:
+            email (str, optional): Account the session must belong to
+            
+        Returns:
+            bool: True if the restored session is usable
+        """
+        if not self.session_store or not self.session_store.restore(self.driver, email, navigate=self.navigate):
+            return False
+
+        print("🔑 Checking saved session...")
+        self.navigate(SESSION_CHECK_URL)
+        if "login" in self.driver.current_url.lower():
+            print("⚠️ Saved session has expired, logging in again")
+            self.driver.delete_all_cookies()
+            return False
+
+        print("✅ Logged in with saved session")
+        return True
+
+    def _login_with_form(self, login_email, login_password):
+        """
+        Fill in and submit the login form
+        
+        Args:
+            login_email (str): Naukri email/username
+            login_password (str): Naukri password
+            
+        Returns:
+            bool: True if login successful, False otherwise
+        """
         try:
             print("Navigating to Naukri.com...")
-            self.driver.get("https://www.naukri.com/nlogin/login")
+            self.navigate("https://www.naukri.com/nlogin/login")
 
-            # Wait for the page to load
-            time.sleep(2)
-
-            # Find and fill email field
+            # Find and fill email field once the form is rendered
             print("Entering email...")
-            email_field = self.wait.until(
-                EC.presence_of_element_located((By.ID, "usernameField"))
-            )
+            email_field = self.waits.for_element('login', (By.ID, "usernameField"), visible=True)
             email_field.clear()
             email_field.send_keys(login_email)
 
@@ -86,11 +244,15 @@ class NaukriLogin:
             login_button = self.wait.until(
                 EC.element_to_be_clickable((By.XPATH, "//button[@type='submit' and contains(text(), 'Login')]"))
             )
+            login_url = self.driver.current_url
             login_button.click()
 
-            # Wait for login to complete and check for success
+            # Wait for login to complete: either we get redirected or an error shows up
             print("Waiting for login to complete...")
-            time.sleep(3)  # Give some time for the login process
+            try:
+                self.waits.until('login', lambda driver: driver.current_url != login_url or self._visible_login_error())
+            except TimeoutException:
+                print("⚠️ Login page did not settle in time, checking result anyway")
             
             # Check current URL to see if we've been redirected
             current_url = self.driver.current_url
@@ -103,25 +265,10 @@ class NaukriLogin:
             
             # Fallback: Check for error messages
             try:
-                error_selectors = [
-                    (By.CLASS_NAME, "err-msg"),
-                    (By.CLASS_NAME, "error-message"),
-                    (By.CLASS_NAME, "alert-danger"),
-                    (By.XPATH, "//div[contains(@class, 'error')]"),
-                    (By.XPATH, "//span[contains(@class, 'error')]")
-                ]
-                
-                for by, selector in error_selectors:
-                    try:
-                        error_element = self.driver.find_element(by, selector)
-                        if error_element.is_displayed():
-                            error_message = error_element.text.strip()
-                            if error_message:
-                                print(f"❌ Login failed: {error_message}")
-                                return False
-                    except NoSuchElementException:
-                        continue
-                        
+                error_message = self._visible_login_error()
+                if error_message:
+                    print(f"❌ Login failed: {error_message}")
+                    return False
             except Exception as e:
                 print(f"Error checking for error messages: {e}")
             
@@ -150,6 +297,32 @@ class NaukriLogin:
                 pass
             return False
 
+    def _visible_login_error(self):
+        """
+        Look for a visible error message on the login page
+        
+        Returns:
+            str: The error message, or None if no error is shown
+        """
+        error_selectors = [
+            (By.CLASS_NAME, "err-msg"),
+            (By.CLASS_NAME, "error-message"),
+            (By.CLASS_NAME, "alert-danger"),
+            (By.XPATH, "//div[contains(@class, 'error')]"),
+            (By.XPATH, "//span[contains(@class, 'error')]")
+        ]
+        
+        for by, selector in error_selectors:
+            try:
+                error_element = self.driver.find_element(by, selector)
+                if error_element.is_displayed():
+                    error_message = error_element.text.strip()
+                    if error_message:
+                        return error_message
+            except NoSuchElementException:
+                continue
+        return None
+
     def navigate_to_profile(self):
         """
         Navigate to profile page after successful login
@@ -266,7 +439,8 @@ class NaukriLogin:
         except Exception as e:
             print(f"Error finding job search elements: {e}")
 
-    def search_jobs(self, job_title="", location="", experience="2"):
+    def search_jobs(self, job_title="", location="", experience="2", incremental=False, max_jobs=100,
+                    collect=True):
         """
         Complete job search with all parameters
         
@@ -274,31 +448,49 @@ class NaukriLogin:
             job_title (str): Job title to search for
             location (str): Location to search in
             experience (str): Years of experience
+            incremental (bool): Stop paginating at the first page with no jobs new
+                to the job store
+            max_jobs (int): Maximum number of jobs to extract
+            collect (bool): Keep the jobs in memory and return them; turn off to
+                get only the count and keep memory flat, the jobs are in the JSONL
+                file either way
             
         Returns:
-            bool: True if job search was successful
+            tuple: (True, jobs) if the search ran, (False, []) if it failed or was
+                stopped; with collect=False the second item is the number of jobs saved
         """
+        no_jobs = [] if collect else 0
         try:
             print(f"🔍 Entering job title: '{job_title}'")
             
+            # Forget the previous search's results pages
+            self.results_url = None
+
             # Navigate to the main job search page
             print("Navigating to job search page...")
-            self.driver.get("https://www.naukri.com/jobs-in-india")
-            time.sleep(3)
+            form_start = time.perf_counter()
+            self.navigate("https://www.naukri.com/jobs-in-india")
             
             # Click on the search bar to expand it
             try:
-                search_bar = self.driver.find_element(By.CLASS_NAME, "nI-gNb-search-bar")
+                search_bar = self.waits.for_element('search_form', (By.CLASS_NAME, "nI-gNb-search-bar"))
+                try:
+                    # Let the page finish hydrating before interacting with the form
+                    self.waits.for_network_idle()
+                except TimeoutException:
+                    print("⚠️ Page is still loading resources, continuing anyway")
                 print("✅ Found search bar container")
                 
                 # Click on the sb__main element to expand it
                 print("🖱️ Clicking search bar main to expand...")
                 search_main = search_bar.find_element(By.CLASS_NAME, "nI-gNb-sb__main")
                 search_main.click()
-                time.sleep(2)  # Wait for expansion animation
                 
-                # Find keyword input
-                keyword_input = search_bar.find_element(By.XPATH, ".//input[@placeholder='Enter keyword / designation / companies']")
+                # Find keyword input once the expansion animation has revealed it
+                keyword_input = self.waits.for_element(
+                    'search_form', (By.XPATH, "//*[contains(@class, 'nI-gNb-search-bar')]//input[@placeholder='Enter keyword / designation / companies']"),
+                    visible=True
+                )
                 print("✅ Found keyword input")
                 
                 # Enter job title using JavaScript since element might not be interactable
@@ -314,7 +506,6 @@ class NaukriLogin:
                         
                         # Use JavaScript to interact with the element
                         self.driver.execute_script("arguments[0].focus();", keyword_input)
-                        time.sleep(0.5)
                         self.driver.execute_script("arguments[0].value = '';", keyword_input)
                         self.driver.execute_script("arguments[0].value = arguments[1];", keyword_input, job_title)
                         self.driver.execute_script("arguments[0].dispatchEvent(new Event('input', { bubbles: true }));", keyword_input)
@@ -325,16 +516,16 @@ class NaukriLogin:
                 try:
                     experience_dropdown = search_bar.find_element(By.XPATH, ".//span[@class='ni-gnb-icn ni-gnb-icn-expand-more']")
                     experience_dropdown.click()
-                    time.sleep(1)  # Wait for dropdown to open
-                    print("✅ Experience dropdown opened")
                     
-                    # Select experience based on parameter
+                    # Select experience based on parameter once the dropdown has opened
                     exp_value = f"a{experience}" if experience.isdigit() else "a2"
                     exp_title = f"{experience} years" if experience.isdigit() else "2 years"
                     print(f"🖱️ Selecting experience: {exp_title}...")
-                    experience_option = self.driver.find_element(By.XPATH, f"//li[@value='{exp_value}' and @title='{exp_title}']")
+                    experience_option = self.waits.for_element(
+                        'dropdown', (By.XPATH, f"//li[@value='{exp_value}' and @title='{exp_title}']"), clickable=True
+                    )
+                    print("✅ Experience dropdown opened")
                     experience_option.click()
-                    time.sleep(1)
                     print(f"✅ Selected {exp_title} experience")
                     
                 except Exception as e:
@@ -348,10 +539,9 @@ class NaukriLogin:
                     # Clear the default "india, " text using JavaScript
                     print("🗑️ Clearing default location text using JavaScript...")
                     self.driver.execute_script("arguments[0].focus();", location_input)
-                    time.sleep(0.5)
                     self.driver.execute_script("arguments[0].value = '';", location_input)
                     self.driver.execute_script("arguments[0].dispatchEvent(new Event('input', { bubbles: true }));", location_input)
-                    time.sleep(0.5)  # Wait for clear to take effect
+                    self.waits.until('search_form', lambda driver: location_input.get_attribute('value') == '')
                     
                     # Enter new location
                     if location:
@@ -367,171 +557,711 @@ class NaukriLogin:
                 print("🔍 Clicking search button...")
                 try:
                     search_button = search_bar.find_element(By.XPATH, ".//button[@class='nI-gNb-sb__icon-wrapper']")
+                    search_url = self.driver.current_url
                     search_button.click()
-                    time.sleep(3)  # Wait for search results to load
                     print("✅ Search button clicked successfully!")
+                    
+                    # Wait for the results page to replace the search page
+                    self.waits.for_url_change('results', search_url)
+                    self.results_url = base_results_url(self.driver.current_url)
                 except Exception as e:
                     print(f"❌ Error clicking search button: {e}")
                 
+                # The form steps above log and skip failures, so a stop would otherwise go unnoticed
+                if self.is_stopped():
+                    raise ScrapeCancelled("Stopped during the search form")
                 print("✅ Job search completed! All fields filled and search executed.")
+                self.metrics.record_span('search_form', time.perf_counter() - form_start)
                 
                 # Extract job listings with pagination
                 print("📋 Extracting job listings with pagination...")
-                jobs = self.extract_job_listings_with_pagination(max_jobs=100)
-                print(f"✅ Found {len(jobs)} total job listings across all pages")
+                # Jobs are streamed to disk page by page so a crash loses at most one page
+                timestamp = output_timestamp()
+                with JsonlJobWriter(f"naukri_jobs_{timestamp}.jsonl") as writer:
+                    jobs = self.extract_job_listings_with_pagination(max_jobs=max_jobs, incremental=incremental,
+                                                                     writer=writer, collect=collect)
+                print(f"✅ Found {writer.count} total job listings across all pages")
+                self.waits.print_report()
+                self.print_page_load_report()
+                if self.page_cache:
+                    self.page_cache.print_report()
                 
-                # Save jobs to file for analysis
-                if jobs:
-                    self.save_jobs_to_file(jobs)
+                # Summarise the saved jobs for analysis
+                if writer.count:
+                    print(f"💾 Jobs saved to {writer.path}")
+                    with self.metrics.span('file_write'):
+                        summary_filename = write_summary_from_jsonl(writer.path, f"naukri_jobs_summary_{timestamp}.txt")
+                    print(f"📄 Summary saved to {summary_filename}")
+                else:
+                    os.remove(writer.path)
                 
-                return (True, jobs)
+                self.metrics.print_report()
+                self.save_selector_order()
+                if self.metrics_file:
+                    self.export_metrics(self.metrics_file)
                 
+                return (True, jobs if collect else writer.count)
+                
+            except ScrapeCancelled:
+                raise
             except Exception as e:
                 print(f"❌ Error in search bar interaction: {e}")
-                return False
+                return (False, no_jobs)
                 
+        except ScrapeCancelled as e:
+            print(f"🛑 {e}")
+            return (False, no_jobs)
         except Exception as e:
             print(f"❌ Error in search_jobs method: {e}")
-            return False
+            return (False, no_jobs)
+
+    def open_search(self, job_title="", location="", experience=None):
+        """
+        Open the first results page of a search directly by URL, skipping the search form
+        
+        Args:
+            job_title (str): Job title to search for
+            location (str): Location to search in
+            experience (str, optional): Years of experience
+            
+        Returns:
+            bool: True if the results page shows job cards
+        """
+        self.results_url = build_search_url(job_title, location, experience)
+        print(f"🔍 Opening search results: {self.results_url}")
+        if self.fetch_backend == "http":
+            return True
+        self.navigate(self.results_url)
+        return self.wait_for_results()
+
+    def search_many(self, queries, pool=None, **pagination_options):
+        """
+        Run many searches on this already logged-in browser, one after another
+        
+        Results are yielded as each query finishes so callers can process or
+        persist them while the rest of the sweep runs.
+        
+        Args:
+            queries (list): Query specs - dicts with job_title, location, experience
+                and optionally max_jobs, max_pages and name, or
+                (job_title, location, experience) tuples
+            pool (NaukriWorkerPool, optional): Spread the queries across a worker
+                pool's browsers instead of running them here
+            **pagination_options: Extra options for extract_job_listings_with_pagination
+            
+        Yields:
+            dict: 'index', 'query' (normalized spec), 'jobs', 'ok' and 'timings' in seconds
+                for opening the search, paginating and in total
+        """
+        if pool is not None:
+            yield from pool.search_many(queries)
+            return
+
+        queries = [normalize_query(query) for query in queries]
+        sweep_start = time.perf_counter()
+        for index, query in enumerate(queries, 1):
+            print(f"\n🔎 Query {index}/{len(queries)}: {query['name']}")
+            start = time.perf_counter()
+            jobs = []
+            ok = False
+            timings = {}
+            try:
+                self.open_search(query['job_title'], query['location'], query['experience'])
+                timings['open'] = time.perf_counter() - start
+                jobs = self.extract_job_listings_with_pagination(
+                    max_jobs=query['max_jobs'], max_pages=query['max_pages'], **pagination_options
+                )
+                timings['paginate'] = time.perf_counter() - start - timings['open']
+                ok = True
+            except Exception as e:
+                print(f"❌ Query '{query['name']}' failed: {e}")
+            timings['total'] = time.perf_counter() - start
+            print(f"⏱️ Query '{query['name']}': {len(jobs)} jobs in {timings['total']:.1f}s")
+
+            yield {'index': index - 1, 'query': query, 'jobs': jobs, 'ok': ok, 'timings': timings}
+
+        print(f"✅ Finished {len(queries)} queries in {time.perf_counter() - sweep_start:.1f}s")
+
+    def iter_jobs(self, query=None, predicate=None, limit=None, engine=None, backend=None, start_page=1,
+                  max_pages=None):
+        """
+        Yield jobs one at a time, loading the next results page only when more are asked for
+
+        Stopping early costs nothing extra: breaking out of the loop, calling
+        close() on the generator or slicing it with itertools.islice leaves
+        every later page unfetched. When the generator finishes, for whatever
+        reason, the scraper's previous results URL is put back so an earlier
+        search can still be paginated.
+
+        Args:
+            query (dict or tuple, optional): Query spec as for search_many, opened by URL;
+                iterates the search that is already open if not given
+            predicate (callable, optional): Only jobs for which predicate(job) is true are yielded
+            limit (int, optional): Stop after yielding this many jobs, no limit by default
+                (a query's max_jobs is not applied here)
+            engine (str, optional): Extraction engine (browser backend only)
+            backend (str, optional): Fetch backend, "browser" or "http"
+            start_page (int): Page to start from
+            max_pages (int, optional): Maximum number of pages to load, the query's
+                max_pages by default
+
+        Yields:
+            dict: Job dictionaries in page order, without repeats
+        """
+        previous_results_url = self.results_url
+        yielded = 0
+        pages_done = 0
+        seen_job_ids = set()
+        normalizer = Normalizer() if self.normalize else None
+
+        try:
+            if query is not None:
+                query = normalize_query(query)
+                if max_pages is None:
+                    max_pages = query['max_pages']
+                if not self.open_search(query['job_title'], query['location'], query['experience']):
+                    print(f"❌ No results for '{query['name']}'")
+                    return
+            elif not self.results_url:
+                self.results_url = base_results_url(self.driver.current_url)
+
+            for page_number in page_range(start_page, max_pages):
+                if (limit is not None and yielded >= limit) or self.is_stopped():
+                    return
+                # Without a predicate every job counts, so the last page only needs the rest
+                if predicate is None and limit is not None:
+                    max_results = limit - yielded
+                else:
+                    max_results = RESULTS_PER_PAGE
+
+                page_jobs = self.scrape_page(page_number, max_results, engine=engine, backend=backend)
+                if not page_jobs:
+                    return
+                page_job_ids = {job['job_id'] for job in page_jobs if job.get('job_id')}
+                if page_job_ids and page_job_ids <= seen_job_ids:
+                    return
+                if normalizer:
+                    normalizer.normalize_jobs(page_jobs)
+                pages_done += 1
+
+                for job in page_jobs:
+                    job_id = job.get('job_id')
+                    if job_id:
+                        if job_id in seen_job_ids:
+                            continue
+                        seen_job_ids.add(job_id)
+                    if predicate is not None and not predicate(job):
+                        continue
+                    yield job
+                    yielded += 1
+                    if limit is not None and yielded >= limit:
+                        return
+        except ScrapeCancelled:
+            print("🛑 Job iteration stopped")
+        finally:
+            self.results_url = previous_results_url
+            self._emit_progress('finished', total=yielded, pages_done=pages_done, stopped=self.is_stopped())
 
-    def extract_job_listings(self, max_results=20):
+    def extract_job_listings(self, max_results=20, engine=None):
         """
         Extract job listings from the search results page
         
         Args:
             max_results (int): Maximum number of jobs to extract
+            engine (str, optional): Extraction engine for this call, defaults to
+                the one chosen when the scraper was created
             
         Returns:
             list: List of job dictionaries
         """
-        jobs = []
+        engine = engine or self.extraction_engine
+        if engine not in EXTRACTION_ENGINES:
+            print(f"❌ Unknown extraction engine '{engine}'")
+            return []
+
         try:
             # Wait for job listings to load
-            time.sleep(2)
-            
-            # Find all job containers
-            job_containers = self.driver.find_elements(By.CLASS_NAME, "srp-jobtuple-wrapper")
-            print(f"🔍 Found {len(job_containers)} job containers")
-            
-            for i, job_container in enumerate(job_containers[:max_results]):
-                try:
-                    job_data = self.extract_job_details(job_container, i + 1)
-                    if job_data:
-                        jobs.append(job_data)
-                        print(f"✅ Job {i + 1}: {job_data['title']} at {job_data['company']}")
-                except Exception as e:
-                    print(f"❌ Error extracting job {i + 1}: {e}")
-                    continue
-            
+            self.wait_for_results()
+
+            jobs = self._run_extraction_engine(engine, max_results)
+
+            for i, job_data in enumerate(jobs):
+                print(f"✅ Job {i + 1}: {job_data['title']} at {job_data['company']}")
+
             return jobs
             
+        except ScrapeCancelled:
+            raise
         except Exception as e:
             print(f"❌ Error extracting job listings: {e}")
             return []
 
-    def extract_job_listings_with_pagination(self, max_jobs=100):
+    def wait_for_results(self):
+        """
+        Wait until job cards are present on the results page
+        
+        Returns:
+            bool: True if job cards showed up before the timeout
+        """
+        try:
+            self.waits.for_elements('results', (By.CLASS_NAME, JOB_CARD_CLASS))
+            return True
+        except TimeoutException:
+            print("⚠️ No job cards appeared before the timeout")
+            return False
+
+    def _run_extraction_engine(self, engine, max_results):
+        """
+        Dispatch to the extraction engine implementation
+        
+        Args:
+            engine (str): One of EXTRACTION_ENGINES
+            max_results (int): Maximum number of jobs to extract
+            
+        Returns:
+            list: List of job dictionaries
+        """
+        if engine == "html":
+            return self._extract_from_page_source(max_results)
+        if engine == "js":
+            return self._extract_with_script(max_results)
+        return self._extract_with_webdriver(max_results)
+
+    def _extract_with_script(self, max_results):
+        """
+        Collect every job card inside the browser with one execute_script call
+        
+        Args:
+            max_results (int): Maximum number of jobs to extract
+            
+        Returns:
+            list: List of job dictionaries
+        """
+        jobs = self.driver.execute_script(EXTRACT_JOBS_SCRIPT, self.selectors.ordered_selectors(), max_results,
+                                          JOB_CARD_CLASS) or []
+        print(f"🔍 Collected {len(jobs)} job containers in the browser")
+        return jobs
+
+    def _extract_from_page_source(self, max_results):
+        """
+        Grab the page source once and parse every job card locally
+        
+        Args:
+            max_results (int): Maximum number of jobs to extract
+            
+        Returns:
+            list: List of job dictionaries
+        """
+        jobs = parse_job_cards(self.driver.page_source, max_results, base_url=self.driver.current_url,
+                               metrics=self.metrics, resolver=self.selectors)
+        print(f"🔍 Parsed {len(jobs)} job containers from page source")
+        return jobs
+
+    def _extract_with_webdriver(self, max_results):
+        """
+        Query every job card field through live WebDriver calls
+        
+        Args:
+            max_results (int): Maximum number of jobs to extract
+            
+        Returns:
+            list: List of job dictionaries
+        """
+        jobs = []
+
+        # Find all job containers
+        job_containers = self.driver.find_elements(By.CLASS_NAME, JOB_CARD_CLASS)
+        print(f"🔍 Found {len(job_containers)} job containers")
+        
+        for i, job_container in enumerate(job_containers[:max_results]):
+            if self.is_stopped():
+                break
+            try:
+                with self.metrics.span('card_extraction'):
+                    job_data = self.extract_job_details(job_container, i + 1)
+                if job_data:
+                    jobs.append(job_data)
+            except Exception as e:
+                print(f"❌ Error extracting job {i + 1}: {e}")
+                continue
+        
+        return jobs
+
+    def compare_extraction_engines(self, max_results=20, engines=EXTRACTION_ENGINES):
+        """
+        Run several extraction engines on the current page and check they agree
+        
+        Args:
+            max_results (int): Maximum number of jobs to extract per engine
+            engines (tuple): Engines to compare, the first one is the reference
+            
+        Returns:
+            dict: 'match' flag, per-engine 'timings' in seconds, job 'counts'
+                and a list of 'differences' as (engine, job index, field, expected, actual)
+        """
+        results = {}
+        timings = {}
+        for engine in engines:
+            start = time.perf_counter()
+            results[engine] = self._run_extraction_engine(engine, max_results)
+            timings[engine] = time.perf_counter() - start
+
+        reference_engine = engines[0]
+        reference = results[reference_engine]
+        differences = []
+        for engine in engines[1:]:
+            jobs = results[engine]
+            if len(jobs) != len(reference):
+                differences.append((engine, None, 'count', len(reference), len(jobs)))
+            for index, (expected, actual) in enumerate(zip(reference, jobs)):
+                for field in set(expected) | set(actual):
+                    if expected.get(field) != actual.get(field):
+                        differences.append((engine, index, field, expected.get(field), actual.get(field)))
+
+        for engine in engines:
+            print(f"⏱️ {engine}: {len(results[engine])} jobs in {timings[engine] * 1000:.1f} ms")
+        if differences:
+            print(f"❌ Engines disagree on {len(differences)} values (reference: {reference_engine})")
+            for engine, index, field, expected, actual in differences:
+                print(f"  {engine} job {index}: {field} = {actual!r}, expected {expected!r}")
+        else:
+            print(f"✅ All engines produced identical output")
+
+        return {
+            'match': not differences,
+            'timings': timings,
+            'counts': {engine: len(jobs) for engine, jobs in results.items()},
+            'differences': differences
+        }
+
+    def extract_job_listings_with_pagination(self, max_jobs=100, engine=None, max_pages=None, start_page=1,
+                                             backend=None, incremental=False, writer=None, collect=True):
         """
         Extract job listings from multiple pages using pagination
         
+        Pages are addressed directly by URL, so each one is fetched (and retried)
+        independently of the others.
+        
         Args:
             max_jobs (int): Maximum number of jobs to extract
+            engine (str, optional): Extraction engine for this run
+            max_pages (int, optional): Maximum number of pages to visit, no limit by default
+            start_page (int): Page to start from, e.g. to resume an earlier run
+            backend (str, optional): Fetch backend for this run, "browser" or "http"
+            incremental (bool): Stop once a page holds only jobs already in the job store
+            writer (JsonlJobWriter, optional): Receives each page's jobs as soon as
+                they are extracted
+            collect (bool): Keep jobs in memory and return them; turn off together
+                with a writer to keep memory flat on large runs
             
         Returns:
-            list: List of job dictionaries from all pages
+            list: List of job dictionaries from all pages (empty when collect is False)
         """
         all_jobs = []
-        page_number = 1
-        max_pages = 10  # Limit to prevent infinite loops
+        job_count = 0
+        seen_job_ids = set()
+        pages_done = 0
+        started = time.perf_counter()
+        normalizer = Normalizer() if self.normalize else None
         
         try:
-            while len(all_jobs) < max_jobs and page_number <= max_pages:
+            if not self.results_url:
+                self.results_url = base_results_url(self.driver.current_url)
+
+            for page_number in page_range(start_page, max_pages):
+                if self.is_stopped():
+                    print(f"🛑 Stopped before page {page_number}")
+                    break
                 print(f"📄 Extracting jobs from page {page_number}...")
+                self._emit_progress('page_started', page=page_number, total=job_count, max_jobs=max_jobs)
                 
-                # Extract jobs from current page
-                page_jobs = self.extract_job_listings(max_jobs)
+                page_jobs = self.scrape_page(page_number, max_jobs - job_count, engine=engine, backend=backend)
                 
                 if not page_jobs:
                     print(f"❌ No jobs found on page {page_number}, stopping pagination")
                     break
+
+                # Past the last page the site can serve earlier results again
+                page_job_ids = {job['job_id'] for job in page_jobs if job.get('job_id')}
+                if page_job_ids and page_job_ids <= seen_job_ids:
+                    print(f"❌ Page {page_number} only repeats earlier jobs, stopping pagination")
+                    break
+                seen_job_ids.update(page_job_ids)
+                
+                page_jobs = page_jobs[:max_jobs - job_count]
+                if normalizer:
+                    with self.metrics.span('normalize'):
+                        normalizer.normalize_jobs(page_jobs)
+                job_count += len(page_jobs)
+                if collect:
+                    all_jobs.extend(page_jobs)
+                if writer:
+                    with self.metrics.span('file_write'):
+                        writer.write_page(page_jobs)
+                print(f"✅ Page {page_number}: Found {len(page_jobs)} jobs (Total: {job_count})")
+                self._emit_progress('jobs_extracted', page=page_number, jobs=page_jobs, total=job_count)
+
+                if self.job_store:
+                    with self.metrics.span('store_write'):
+                        new_job_ids = self.job_store.save_jobs(page_jobs)
+                    print(f"🗄️ Stored page {page_number}: {len(new_job_ids)} new jobs")
+                    if incremental and page_job_ids and not new_job_ids:
+                        print(f"🛑 Page {page_number} has no new jobs, stopping incremental scrape")
+                        break
                 
-                all_jobs.extend(page_jobs)
-                print(f"✅ Page {page_number}: Found {len(page_jobs)} jobs (Total: {len(all_jobs)})")
+                pages_done += 1
+                jobs_per_page = job_count / pages_done
+                remaining_pages = max(0, -(-(max_jobs - job_count) // jobs_per_page)) if jobs_per_page else 0
+                if max_pages is not None:
+                    remaining_pages = min(remaining_pages, max_pages - (page_number - start_page + 1))
+                self._emit_progress(
+                    'page_done', page=page_number, total=job_count, max_jobs=max_jobs, pages_done=pages_done,
+                    remaining_pages=int(remaining_pages),
+                    eta_seconds=remaining_pages * (time.perf_counter() - started) / pages_done
+                )
                 
                 # Check if we have enough jobs
-                if len(all_jobs) >= max_jobs:
+                if job_count >= max_jobs:
                     print(f"🎯 Reached target of {max_jobs} jobs!")
                     break
-                
-                # Try to navigate to next page
-                ##TODO: Breaking even though pages available after page 4
-                if not self.go_to_next_page():
-                    print(f"❌ No more pages available, stopping at page {page_number}")
-                    break
-                
-                page_number += 1
-                time.sleep(2)  # Wait between page loads
             
-            return all_jobs[:max_jobs]  # Return only the requested number
+            return all_jobs
             
+        except ScrapeCancelled:
+            print("🛑 Pagination stopped")
+            return all_jobs
         except Exception as e:
             print(f"❌ Error in pagination: {e}")
             return all_jobs
+        finally:
+            self._emit_progress('finished', total=job_count, pages_done=pages_done, stopped=self.is_stopped())
 
-    def go_to_next_page(self):
+    def go_to_page(self, page_number):
         """
-        Navigate to the next page of job listings
+        Navigate straight to a results page by its URL
         
+        Args:
+            page_number (int): Page to open, starting at 1
+            
         Returns:
-            bool: True if successfully navigated to next page
+            bool: True if the page was loaded and has job cards
         """
-        try:
-            # Look for pagination elements
-            pagination_selectors = [
-                "//a[contains(@class, 'styles_btn-secondary__2AsIP') and contains(., 'Next')]",
-                "//a[contains(@href, '-2') and contains(@class, 'styles_btn-secondary__2AsIP')]",
-                "//a[contains(., 'Next')]",
-                "//a[contains(@class, 'next')]"
-            ]
-            
-            next_button = None
-            for selector in pagination_selectors:
+        if not self.results_url:
+            print("❌ No search results URL yet, run search_jobs first")
+            return False
+
+        target_url = page_url(self.results_url, page_number)
+        current_url = self.driver.current_url
+        on_target = (base_results_url(current_url) == self.results_url
+                     and page_number_from_url(current_url) == page_number)
+
+        if not on_target:
+            # A card from the page being left; once it is detached the old list cannot be re-read
+            previous_cards = self.driver.find_elements(By.CLASS_NAME, JOB_CARD_CLASS)[:1]
+            print(f"🌐 Opening page {page_number}: {target_url}")
+            self.navigate(target_url)
+            if previous_cards:
                 try:
-                    next_button = self.driver.find_element(By.XPATH, selector)
-                    if next_button.is_enabled() and next_button.is_displayed():
-                        break
-                except:
-                    continue
-            
-            if not next_button:
-                print("❌ Next page button not found")
+                    self.waits.for_staleness('next_page', previous_cards[0])
+                except TimeoutException:
+                    print(f"⚠️ Page {page_number} still shows the previous page's jobs")
+                    return False
+
+            # Out-of-range pages redirect elsewhere instead of returning an empty list
+            if page_number_from_url(self.driver.current_url) != page_number:
+                print(f"❌ Page {page_number} redirected to {self.driver.current_url}")
                 return False
+
+        return self.wait_for_results()
+
+    def get_fetcher(self, backend=None):
+        """
+        Fetcher for a backend, created on first use
+        
+        The HTTP fetcher copies the browser's cookies when it is created, so
+        it should be requested after login. With a page cache, fetchers serve
+        fresh cached pages without touching the network.
+        
+        Args:
+            backend (str, optional): "browser" or "http", defaults to the scraper's backend
             
-            # Check if button is disabled
-            if next_button.get_attribute('disabled'):
-                print("❌ Next page button is disabled")
-                return False
+        Returns:
+            BrowserFetcher or HttpFetcher: Object with fetch(url) -> (final_url, html)
+        """
+        backend = backend or self.fetch_backend
+        if backend not in self.fetchers:
+            if backend == "http":
+                fetcher = HttpFetcher.from_driver(self.driver)
+            else:
+                fetcher = BrowserFetcher(self)
+            self.fetchers[backend] = CachingFetcher(fetcher, self.page_cache) if self.page_cache else fetcher
+        return self.fetchers[backend]
+
+    def _scrape_cached_page(self, page_number, max_results):
+        """
+        Parse a results page from the page cache if a fresh copy is stored
+        
+        Args:
+            page_number (int): Page to look up
+            max_results (int): Maximum number of jobs to extract
             
-            # Store current URL before clicking
-            old_url = self.driver.current_url
+        Returns:
+            list: List of job dictionaries, or None on a cache miss
+        """
+        if not self.page_cache or not self.results_url:
+            return None
+        cached = self.page_cache.get(page_url(self.results_url, page_number))
+        if not cached:
+            return None
+        final_url, page_html = cached
+        jobs = parse_job_cards(page_html, max_results, base_url=final_url)
+        print(f"🗃️ Page {page_number}: {len(jobs)} jobs from cache")
+        return jobs
 
-            # Click next page button
-            print("🖱️ Clicking next page button...")
-            next_button.click()
-            time.sleep(3)  # Wait for page to load
+    def _scrape_page_over_http(self, page_number, max_results):
+        """
+        Download a results page without rendering it and parse its cards offline
+        
+        Args:
+            page_number (int): Page to scrape
+            max_results (int): Maximum number of jobs to extract
+            
+        Returns:
+            list: List of job dictionaries
+        """
+        if not self.results_url:
+            print("❌ No search results URL yet, run search_jobs first")
+            return []
+
+        target_url = page_url(self.results_url, page_number)
+        print(f"🌐 Downloading page {page_number}: {target_url}")
+        with self.metrics.span('page_download'):
+            final_url, page_html = self.get_fetcher("http").fetch(target_url)
+        if page_number_from_url(final_url) != page_number:
+            print(f"❌ Page {page_number} redirected to {final_url}")
+            return []
+
+        jobs = parse_job_cards(page_html, max_results, base_url=final_url, metrics=self.metrics,
+                               resolver=self.selectors)
+        print(f"🔍 Parsed {len(jobs)} job containers from downloaded page")
+        return jobs
+
+    def scrape_page(self, page_number, max_results=20, engine=None, retries=2, backend=None):
+        """
+        Load one results page and extract its jobs, retrying on fetch errors
+        
+        Args:
+            page_number (int): Page to scrape
+            max_results (int): Maximum number of jobs to extract
+            engine (str, optional): Extraction engine for this page (browser backend only)
+            retries (int): Extra attempts after a WebDriver or HTTP error
+            backend (str, optional): Fetch backend for this page
             
-            # Verify we're on a new page by checking if URL changed
-            new_url = self.driver.current_url
-            if new_url != old_url:
-                print(f"✅ Successfully navigated to next page: {new_url}")
+        Returns:
+            list: List of job dictionaries, empty if the page has none
+        """
+        backend = backend or self.fetch_backend
+        for attempt in range(1, retries + 2):
+            if self.is_stopped():
+                return []
+            try:
+                if backend == "http":
+                    return self._scrape_page_over_http(page_number, max_results)
+                cached_jobs = self._scrape_cached_page(page_number, max_results)
+                if cached_jobs is not None:
+                    return cached_jobs
+                if not self.go_to_page(page_number):
+                    return []
+                jobs = self.extract_job_listings(max_results, engine=engine)
+                if self.page_cache and jobs:
+                    self.page_cache.put(page_url(self.results_url, page_number),
+                                        self.driver.current_url, self.driver.page_source)
+                return jobs
+            except (WebDriverException, FetchError) as e:
+                print(f"⚠️ Page {page_number} failed on attempt {attempt}: {e}")
+        print(f"❌ Giving up on page {page_number} after {retries + 1} attempts")
+        return []
+
+    def go_to_next_page(self):
+        """
+        Navigate to the next page of job listings
+        
+        Returns:
+            bool: True if successfully navigated to next page
+        """
+        try:
+            if not self.results_url:
+                self.results_url = base_results_url(self.driver.current_url)
+            next_page = page_number_from_url(self.driver.current_url) + 1
+            if self.go_to_page(next_page):
+                print(f"✅ Successfully navigated to next page: {self.driver.current_url}")
                 return True
-            else:
-                print(f"⚠️ URL didn't change as expected: {new_url}")
-                return False
+            print(f"❌ Page {next_page} is not available")
+            return False
                 
         except Exception as e:
             print(f"❌ Error navigating to next page: {e}")
             return False
 
+    def enrich_jobs(self, jobs, workers=8, max_age_hours=24, backend="http"):
+        """
+        Fill in full description, salary, role and posting details from each job's page
+        
+        Detail pages are downloaded concurrently over HTTP with this browser's
+        cookies. Jobs enriched within max_age_hours (in memory or in the job
+        store) are not fetched again.
+        
+        Args:
+            jobs (list): Job dictionaries, updated in place
+            workers (int): Number of detail pages fetched at once
+            max_age_hours (float): How long an enrichment stays fresh
+            backend (str): "http" for concurrent downloads, "browser" to load the
+                pages one by one in Chrome
+            
+        Returns:
+            int: Number of jobs enriched
+        """
+        enricher = JobEnricher(
+            self.get_fetcher(backend),
+            workers=workers if backend == "http" else 1,
+            job_store=self.job_store,
+            max_age_hours=max_age_hours
+        )
+        enriched = enricher.enrich(jobs)
+        if self.normalize:
+            # Salaries only come from detail pages; the card fields were normalized when scraped
+            for job in jobs:
+                job['salary_min'], job['salary_max'] = parse_salary(job.get('salary'))
+        return enriched
+
+    def _match_selector(self, job_element, field, read, accept=bool):
+        """
+        Try a field's fallback selectors, learned winner first, recording each hit and miss
+        
+        Args:
+            job_element: WebElement containing job data
+            field (str): Key into SELECTORS
+            read (callable): Reads the text from a matched element
+            accept (callable): Check that the text is a usable value
+            
+        Returns:
+            tuple: (element, text) or (None, None) if no selector matched
+        """
+        for selector in self.selectors.candidates(field):
+            start = time.perf_counter()
+            element, text = None, None
+            try:
+                element = job_element.find_element(By.XPATH, selector)
+                text = read(element)
+            except:
+                pass
+            hit = element is not None and accept(text)
+            self.metrics.record_selector(field, selector, hit, time.perf_counter() - start)
+            if hit:
+                self.selectors.record(field, selector)
+                return element, text
+        return None, None
+
     def extract_job_details(self, job_element, job_number):
         """
         Extract details from a single job element with improved selectors
@@ -547,142 +1277,56 @@ class NaukriLogin:
             job_data = {}
             
             # Extract job title and link with multiple selectors
-            title_selectors = [
-                ".//h2/a[@class='title']",
-                ".//h2/a[contains(@class, 'title')]",
-                ".//a[contains(@class, 'title')]",
-                ".//h2//a",
-                ".//a[contains(@href, 'job-listings')]"
-            ]
-            
-            for selector in title_selectors:
-                try:
-                    title_element = job_element.find_element(By.XPATH, selector)
-                    if title_element.text.strip():
-                        job_data['title'] = title_element.text.strip()
-                        job_data['link'] = title_element.get_attribute('href')
-                        break
-                except:
-                    continue
-            
-            if 'title' not in job_data:
+            title_element, title_text = self._match_selector(job_element, 'title', lambda element: clean_text(element.text))
+            if title_element is not None:
+                job_data['title'] = title_text
+                job_data['link'] = title_element.get_attribute('href')
+            else:
                 job_data['title'] = "N/A"
                 job_data['link'] = "N/A"
             
             # Extract company name with multiple selectors
-            company_selectors = [
-                ".//a[@class='comp-name mw-25']",
-                ".//a[contains(@class, 'comp-name')]",
-                ".//span[contains(@class, 'comp-name')]",
-                ".//a[contains(@href, 'company')]"
-            ]
-            
-            for selector in company_selectors:
-                try:
-                    company_element = job_element.find_element(By.XPATH, selector)
-                    if company_element.text.strip():
-                        job_data['company'] = company_element.text.strip()
-                        break
-                except:
-                    continue
-            
-            if 'company' not in job_data:
-                job_data['company'] = "N/A"
+            _, company_text = self._match_selector(job_element, 'company', lambda element: clean_text(element.text))
+            job_data['company'] = company_text or "N/A"
             
             # Extract company rating
             try:
-                rating_element = job_element.find_element(By.XPATH, ".//span[@class='main-2']")
-                job_data['rating'] = rating_element.text.strip()
+                rating_element = job_element.find_element(By.XPATH, SELECTORS['rating'][0])
+                job_data['rating'] = clean_text(rating_element.text)
             except:
                 job_data['rating'] = "N/A"
             
             # Extract experience with multiple selectors
-            exp_selectors = [
-                ".//span[@class='expwdth']",
-                ".//span[contains(@class, 'exp')]",
-                ".//span[contains(@title, 'Yrs')]",
-                ".//span[contains(text(), 'Yrs')]"
-            ]
-            
-            for selector in exp_selectors:
-                try:
-                    exp_element = job_element.find_element(By.XPATH, selector)
-                    exp_text = exp_element.get_attribute('title') or exp_element.text.strip()
-                    if exp_text and ('yr' in exp_text.lower() or 'exp' in exp_text.lower()):
-                        job_data['experience'] = exp_text
-                        break
-                except:
-                    continue
-            
-            if 'experience' not in job_data:
-                job_data['experience'] = "N/A"
+            _, exp_text = self._match_selector(
+                job_element, 'experience',
+                lambda element: clean_text(element.get_attribute('title')) or clean_text(element.text),
+                accept=is_experience_text
+            )
+            job_data['experience'] = exp_text or "N/A"
             
             # Extract location with multiple selectors
-            loc_selectors = [
-                ".//span[@class='locWdth']",
-                ".//span[contains(@class, 'loc')]",
-                ".//span[contains(@title, ',')]"
-            ]
-            
-            for selector in loc_selectors:
-                try:
-                    loc_element = job_element.find_element(By.XPATH, selector)
-                    loc_text = loc_element.get_attribute('title') or loc_element.text.strip()
-                    if loc_text and len(loc_text) > 2:
-                        job_data['location'] = loc_text
-                        break
-                except:
-                    continue
-            
-            if 'location' not in job_data:
-                job_data['location'] = "N/A"
+            _, loc_text = self._match_selector(
+                job_element, 'location',
+                lambda element: clean_text(element.get_attribute('title')) or clean_text(element.text),
+                accept=is_location_text
+            )
+            job_data['location'] = loc_text or "N/A"
             
             # Extract job description
-            desc_selectors = [
-                ".//span[@class='job-desc ni-job-tuple-icon ni-job-tuple-icon-srp-description']",
-                ".//span[contains(@class, 'job-desc')]",
-                ".//div[contains(@class, 'description')]",
-                ".//span[contains(@class, 'description')]"
-            ]
-            
-            for selector in desc_selectors:
-                try:
-                    desc_element = job_element.find_element(By.XPATH, selector)
-                    if desc_element.text.strip():
-                        job_data['description'] = desc_element.text.strip()
-                        break
-                except:
-                    continue
-            
-            if 'description' not in job_data:
-                job_data['description'] = "N/A"
+            _, desc_text = self._match_selector(job_element, 'description', lambda element: clean_text(element.text))
+            job_data['description'] = desc_text or "N/A"
             
             # Extract skills/tags
             try:
-                skill_elements = job_element.find_elements(By.XPATH, ".//li[@class='dot-gt tag-li ']")
-                job_data['skills'] = [skill.text.strip() for skill in skill_elements if skill.text.strip()]
+                skill_elements = job_element.find_elements(By.XPATH, SELECTORS['skills'][0])
+                skill_texts = [clean_text(skill.text) for skill in skill_elements]
+                job_data['skills'] = [text for text in skill_texts if text]
             except:
                 job_data['skills'] = []
             
             # Extract posted date
-            date_selectors = [
-                ".//span[@class='job-post-day ']",
-                ".//span[contains(@class, 'job-post-day')]",
-                ".//span[contains(text(), 'days ago')]",
-                ".//span[contains(text(), 'day ago')]"
-            ]
-            
-            for selector in date_selectors:
-                try:
-                    date_element = job_element.find_element(By.XPATH, selector)
-                    if date_element.text.strip():
-                        job_data['posted_date'] = date_element.text.strip()
-                        break
-                except:
-                    continue
-            
-            if 'posted_date' not in job_data:
-                job_data['posted_date'] = "N/A"
+            _, date_text = self._match_selector(job_element, 'posted_date', lambda element: clean_text(element.text))
+            job_data['posted_date'] = date_text or "N/A"
             
             # Extract job ID
             try:
@@ -704,53 +1348,82 @@ class NaukriLogin:
         Save extracted jobs to a JSON file for analysis
         
         Args:
-            jobs (list): List of job dictionaries
+            jobs (list): List of job dictionaries or Job records
             filename (str): Output filename
         """
         try:
             import json
-            from datetime import datetime
             
             # Add timestamp to filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = output_timestamp()
             filename = f"naukri_jobs_{timestamp}.json"
             
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(jobs, f, indent=2, ensure_ascii=False)
+            with self.metrics.span('file_write'):
+                with open(filename, 'w', encoding='utf-8') as f:
+                    json.dump(as_dicts(jobs), f, indent=2, ensure_ascii=False)
             
             print(f"💾 Jobs saved to {filename}")
             
             # Also create a simple text summary
             summary_filename = f"naukri_jobs_summary_{timestamp}.txt"
-            with open(summary_filename, 'w', encoding='utf-8') as f:
-                f.write("NAUKRI JOB SEARCH RESULTS\n")
-                f.write("=" * 50 + "\n\n")
-                
-                for i, job in enumerate(jobs, 1):
-                    f.write(f"Job {i}:\n")
-                    f.write(f"  Title: {job.get('title', 'N/A')}\n")
-                    f.write(f"  Company: {job.get('company', 'N/A')}\n")
-                    f.write(f"  Experience: {job.get('experience', 'N/A')}\n")
-                    f.write(f"  Location: {job.get('location', 'N/A')}\n")
-                    f.write(f"  Rating: {job.get('rating', 'N/A')}\n")
-                    f.write(f"  Posted: {job.get('posted_date', 'N/A')}\n")
-                    f.write(f"  Skills: {', '.join(job.get('skills', []))}\n")
-                    f.write(f"  Link: {job.get('link', 'N/A')}\n")
-                    f.write(f"  Job ID: {job.get('job_id', 'N/A')}\n")
-                    f.write("-" * 30 + "\n\n")
+            with self.metrics.span('file_write'):
+                write_summary(jobs, summary_filename)
             
             print(f"📄 Summary saved to {summary_filename}")
             
         except Exception as e:
             print(f"❌ Error saving jobs to file: {e}")
 
+    def export_metrics(self, json_path, prometheus_path=None):
+        """
+        Write phase timings and selector hit rates to a JSON report and a Prometheus text file
+        
+        Args:
+            json_path (str): JSON report file
+            prometheus_path (str, optional): Prometheus text file, defaults to
+                json_path with a .prom extension
+        """
+        prometheus_path = prometheus_path or os.path.splitext(json_path)[0] + ".prom"
+        self.metrics.write_json(json_path)
+        self.metrics.write_prometheus(prometheus_path)
+        print(f"📈 Metrics saved to {json_path} and {prometheus_path}")
+
+    def save_selector_order(self):
+        """
+        Save the learned selector order; a failed write only costs the learned order
+        """
+        try:
+            self.selectors.save()
+        except OSError as e:
+            print(f"⚠️ Could not save selector order to {self.selectors.path}: {e}")
+
+    def print_page_load_report(self):
+        """
+        Print bytes downloaded and page load times for this run so far
+        """
+        # The page currently open is only recorded once we navigate away from it
+        self.page_stats.print_report(self.page_stats.snapshot(self.driver))
+
     def close(self):
         """
         Close the browser
         """
-        if self.driver:
-            self.driver.quit()
-            print("🔒 Browser closed")
+        for fetcher in self.fetchers.values():
+            fetcher.close()
+        self.fetchers = {}
+        if self.job_store and self.owns_job_store:
+            self.job_store.close()
+            self.job_store = None
+        if self.page_cache and self.owns_page_cache:
+            self.page_cache.close()
+            self.page_cache = None
+        try:
+            if self.driver:
+                self.driver.quit()
+                print("🔒 Browser closed")
+        finally:
+            # After quitting, so a failed write cannot leave Chrome running
+            self.save_selector_order()
 
 
 def main():
@@ -784,7 +1457,7 @@ def main():
             print("\n" + "="*50)
             print("TESTING SIMPLE JOB TITLE ENTRY")
             print("="*50)
-            success = naukri.search_jobs("Python Developer", "Bangalore", "2")
+            success, _ = naukri.search_jobs("Python Developer", "Bangalore", "2")
             
             if success:
                 print("✅ Job title entered successfully!")
@@ -0,0 +1,346 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from naukri import NaukriLogin
+from naukri_details import JobEnricher
+from naukri_fetch import HttpFetcher
+from naukri_pagination import build_search_url, normalize_query
+from naukri_waits import ScrapeCancelled
+import asyncio
+import functools
+import threading
+
+
+class AsyncScrapeOrchestrator:
+    """
+    Runs login, search, page fetch, detail fetch and persist steps as coroutines
+
+    Blocking Selenium, HTTP and disk calls run in a thread pool so the stages
+    overlap, while a bounded semaphore per resource (browsers, HTTP
+    connections, disk writers) caps how much of each is used at once.
+
+    cancel() stops in-flight work rather than just skipping the next phase:
+    pending coroutines are cancelled and the shared stop event makes every
+    running browser wait or pagination loop bail out at its next poll.
+    """
+
+    def __init__(self, email, password, browsers=2, http_connections=8, disk_writers=1,
+                 job_store=None, writer=None, **scraper_options):
+        """
+        Args:
+            email (str): Naukri email/username
+            password (str): Naukri password
+            browsers (int): Maximum number of Chrome instances
+            http_connections (int): Maximum concurrent HTTP detail fetches
+            disk_writers (int): Maximum concurrent persist operations
+            job_store (JobStore, optional): Store that pages are persisted into
+            writer (JsonlJobWriter, optional): Stream that pages are persisted into
+            **scraper_options: Extra keyword arguments for each NaukriLogin
+        """
+        self.email = email
+        self.password = password
+        self.browsers = browsers
+        self.job_store = job_store
+        self.writer = writer
+        self.scraper_options = dict(scraper_options, headless=scraper_options.get('headless', True))
+
+        self.browser_slots = asyncio.Semaphore(browsers)
+        self.http_slots = asyncio.Semaphore(http_connections)
+        self.disk_slots = asyncio.Semaphore(disk_writers)
+
+        self.executor = ThreadPoolExecutor(max_workers=browsers + http_connections + disk_writers,
+                                           thread_name_prefix="naukri-async")
+        self.stop_event = threading.Event()
+        self.idle_scrapers = []
+        self.all_scrapers = []
+        self.http_fetcher = None
+        self.http_lock = asyncio.Lock()
+        self.retiring = set()
+        self.tasks = set()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def _blocking(self, function, *args, **kwargs):
+        """Run a blocking call in the thread pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(function, *args, **kwargs))
+
+    def _check_cancelled(self):
+        if self.stop_event.is_set():
+            raise ScrapeCancelled("Scrape cancelled")
+
+    async def login(self):
+        """
+        Start a browser and log in
+
+        Returns:
+            NaukriLogin: Logged-in scraper
+
+        Raises:
+            RuntimeError: If the login failed
+            ScrapeCancelled: If cancel() was called
+        """
+        self._check_cancelled()
+        scraper = await self._blocking(NaukriLogin, self.email, self.password,
+                                       stop_event=self.stop_event, **self.scraper_options)
+        self.all_scrapers.append(scraper)
+        if not await self._blocking(scraper.login):
+            raise RuntimeError("Login failed")
+        return scraper
+
+    async def _retire(self, scraper):
+        """Close a browser that may still be in use by an executor thread"""
+        self.all_scrapers.remove(scraper)
+        future = asyncio.ensure_future(self._blocking(scraper.close))
+        self.retiring.add(future)
+        future.add_done_callback(self.retiring.discard)
+        try:
+            # Shielded so a second cancel cannot leave Chrome running
+            await asyncio.shield(future)
+        except Exception as e:
+            print(f"⚠️ Could not close browser: {e}")
+
+    @asynccontextmanager
+    async def browser(self):
+        """
+        Borrow a logged-in browser, starting one if none is idle
+
+        A browser whose borrower failed or was cancelled is closed instead of
+        going back to the pool, since the thread that was driving it may still
+        be running.
+
+        Yields:
+            NaukriLogin: Scraper reserved for the caller
+        """
+        async with self.browser_slots:
+            scraper = self.idle_scrapers.pop() if self.idle_scrapers else await self.login()
+            try:
+                yield scraper
+            except BaseException:
+                await self._retire(scraper)
+                raise
+            self.idle_scrapers.append(scraper)
+
+    async def search(self, query):
+        """
+        Open a search's first results page
+
+        Args:
+            query (dict or tuple): Query spec, see naukri_pagination.normalize_query
+
+        Returns:
+            str: URL of the first results page
+        """
+        query = normalize_query(query)
+        async with self.browser() as scraper:
+            self._check_cancelled()
+            await self._blocking(scraper.open_search, query['job_title'], query['location'], query['experience'])
+            return scraper.results_url
+
+    async def fetch_page(self, results_url, page_number, max_results=20):
+        """
+        Fetch and extract one results page
+
+        Args:
+            results_url (str): First results page of the search
+            page_number (int): Page to fetch
+            max_results (int): Maximum number of jobs to extract
+
+        Returns:
+            list: Job dictionaries
+        """
+        async with self.browser() as scraper:
+            self._check_cancelled()
+            scraper.results_url = results_url
+            return await self._blocking(scraper.scrape_page, page_number, max_results)
+
+    async def _http(self):
+        """HTTP fetcher sharing a logged-in browser's cookies, created on first use"""
+        if self.http_fetcher is None:
+            # Concurrent fetches would otherwise each borrow (and maybe log in) a browser
+            async with self.http_lock:
+                if self.http_fetcher is None:
+                    async with self.browser() as scraper:
+                        self.http_fetcher = await self._blocking(HttpFetcher.from_driver, scraper.driver)
+        return self.http_fetcher
+
+    async def fetch_detail(self, url):
+        """
+        Download a job detail page over HTTP with the logged-in session's cookies
+
+        Args:
+            url (str): Job detail page URL
+
+        Returns:
+            str: Page HTML
+        """
+        fetcher = await self._http()
+        async with self.http_slots:
+            self._check_cancelled()
+            _, page_html = await self._blocking(fetcher.fetch, url)
+            return page_html
+
+    async def enrich(self, jobs):
+        """
+        Fetch every job's detail page concurrently and merge the details in place
+
+        Uses JobEnricher for each job, so recently enriched jobs are skipped and
+        enriched ones are stamped and written back to the job store.
+
+        Args:
+            jobs (list): Job dictionaries
+
+        Returns:
+            int: Number of jobs enriched
+        """
+        enricher = JobEnricher(await self._http(), workers=1, job_store=self.job_store)
+        pending = await self._blocking(enricher.needs_enrichment, jobs)
+
+        async def enrich_one(job):
+            async with self.http_slots:
+                self._check_cancelled()
+                return await self._blocking(enricher.enrich_one, job)
+
+        results = await asyncio.gather(*(enrich_one(job) for job in pending))
+        enriched = [job for job, ok in zip(pending, results) if ok]
+        if self.job_store is not None and enriched:
+            async with self.disk_slots:
+                await self._blocking(self.job_store.save_enrichment, enriched)
+        return len(enriched)
+
+    async def persist(self, jobs):
+        """
+        Write a page of jobs to the job store and output stream
+
+        Args:
+            jobs (list): Job dictionaries
+        """
+        if not jobs or (self.job_store is None and self.writer is None):
+            return
+        async with self.disk_slots:
+            if self.job_store is not None:
+                await self._blocking(self.job_store.save_jobs, jobs)
+            if self.writer is not None:
+                await self._blocking(self.writer.write_page, jobs)
+
+    async def scrape_query(self, query):
+        """
+        Scrape every page of one search, fetching several pages at once
+
+        Pages are requested in windows as wide as the browser limit and each
+        page is persisted as soon as it arrives.
+
+        Args:
+            query (dict or tuple): Query spec, see naukri_pagination.normalize_query
+
+        Returns:
+            list: Job dictionaries in page order
+        """
+        query = normalize_query(query)
+        results_url = build_search_url(query['job_title'], query['location'], query['experience'])
+        max_jobs = query['max_jobs']
+        max_pages = query['max_pages']
+
+        jobs = []
+        persist_tasks = []
+        page_number = 1
+        while len(jobs) < max_jobs and (max_pages is None or page_number <= max_pages):
+            self._check_cancelled()
+            last_page = page_number + self.browsers - 1
+            if max_pages is not None:
+                last_page = min(last_page, max_pages)
+            window = list(range(page_number, last_page + 1))
+            pages = await asyncio.gather(*(self.fetch_page(results_url, number, max_jobs) for number in window))
+
+            for page_jobs in pages:
+                if not page_jobs:
+                    break
+                page_jobs = page_jobs[:max_jobs - len(jobs)]
+                jobs.extend(page_jobs)
+                persist_tasks.append(asyncio.ensure_future(self.persist(page_jobs)))
+            if any(not page_jobs for page_jobs in pages):
+                break
+            page_number = window[-1] + 1
+
+        await asyncio.gather(*persist_tasks)
+        print(f"✅ Query '{query['name']}': {len(jobs)} jobs")
+        return jobs
+
+    async def run(self, queries):
+        """
+        Scrape several queries concurrently
+
+        Args:
+            queries (list): Query specs
+
+        Returns:
+            list: One job list per query, None for queries that failed or were cancelled
+        """
+        tasks = [asyncio.ensure_future(self.scrape_query(query)) for query in queries]
+        self.tasks.update(tasks)
+        try:
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            self.tasks.difference_update(tasks)
+
+        output = []
+        for query, result in zip(queries, results):
+            if isinstance(result, (ScrapeCancelled, asyncio.CancelledError)):
+                print(f"🛑 Query '{normalize_query(query)['name']}' was cancelled")
+                output.append(None)
+            elif isinstance(result, BaseException):
+                print(f"❌ Query '{normalize_query(query)['name']}' did not finish: {result!r}")
+                output.append(None)
+            else:
+                output.append(result)
+        return output
+
+    def cancel(self):
+        """
+        Stop all work: cancel pending coroutines and interrupt running browser calls
+
+        Safe to call from any thread.
+        """
+        self.stop_event.set()
+        for task in list(self.tasks):
+            loop = task.get_loop()
+            loop.call_soon_threadsafe(task.cancel)
+        print("🛑 Cancelling scrape...")
+
+    async def close(self):
+        """
+        Close every browser and HTTP client and shut the thread pool down
+        """
+        if self.retiring:
+            await asyncio.gather(*self.retiring, return_exceptions=True)
+        for scraper in self.all_scrapers:
+            await self._blocking(scraper.close)
+        self.all_scrapers = []
+        self.idle_scrapers = []
+        if self.http_fetcher is not None:
+            self.http_fetcher.close()
+            self.http_fetcher = None
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+def run_queries(email, password, queries, **options):
+    """
+    Scrape queries concurrently from synchronous code
+
+    Args:
+        email (str): Naukri email/username
+        password (str): Naukri password
+        queries (list): Query specs
+        **options: AsyncScrapeOrchestrator options
+
+    Returns:
+        list: One job list per query
+    """
+    async def main():
+        async with AsyncScrapeOrchestrator(email, password, **options) as orchestrator:
+            return await orchestrator.run(queries)
+
+    return asyncio.run(main())
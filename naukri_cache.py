@@ -0,0 +1,330 @@
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from naukri_fetch import FetchError
+import hashlib
+import sqlite3
+import threading
+import time
+import zlib
+
+
+DEFAULT_CACHE_FILE = "naukri_cache.db"
+
+# Seconds a cached page stays fresh, per page type. Results pages change as
+# jobs are posted; a job's own page rarely does.
+DEFAULT_TTLS = {
+    'results': 15 * 60,
+    'detail': 7 * 24 * 3600
+}
+
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+
+# Query parameters that don't change the page content
+_IGNORED_PARAMS = {'src', 'sid', 'xp', 'px', 'utm_source', 'utm_medium', 'utm_campaign', 'utm_content', 'utm_term'}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    page_type TEXT NOT NULL,
+    final_url TEXT NOT NULL,
+    body BLOB NOT NULL,
+    etag TEXT,
+    fetched_at REAL NOT NULL,
+    last_access REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_pages_last_access ON pages(last_access);
+"""
+
+
+def normalize_url(url):
+    """
+    Canonical form of a URL for cache lookups
+
+    Scheme and host are lowercased, the fragment, trailing slash and tracking
+    parameters are dropped and the remaining query parameters are sorted.
+
+    Args:
+        url (str): Page URL
+
+    Returns:
+        str: Normalized URL
+    """
+    parts = urlsplit(url.strip())
+    query = sorted((key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+                   if key not in _IGNORED_PARAMS)
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(query), ''))
+
+
+def cache_key(url):
+    """Content-addressed key of a URL: the SHA-256 of its normalized form"""
+    return hashlib.sha256(normalize_url(url).encode('utf-8')).hexdigest()
+
+
+def page_type(url):
+    """
+    Classify a URL as a job detail page or a results page
+
+    Args:
+        url (str): Page URL
+
+    Returns:
+        str: "detail" or "results"
+    """
+    return 'detail' if '/job-listings-' in urlsplit(url).path else 'results'
+
+
+class PageCache:
+    """
+    SQLite cache of downloaded pages with per-page-type TTLs and an LRU size cap
+
+    Bodies are stored zlib-compressed together with the final URL, ETag and
+    fetch time. Expired entries are kept until evicted so their ETag can be
+    used to revalidate them. Safe to share between threads.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_FILE, ttls=None, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Args:
+            path (str): Database file, ":memory:" for a throwaway cache
+            ttls (dict, optional): Seconds a page stays fresh per page type,
+                see DEFAULT_TTLS
+            max_bytes (int): Compressed size above which the least recently
+                used pages are evicted
+        """
+        self.path = path
+        self.ttls = dict(DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.evictions = 0
+
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        with self.lock, self.connection:
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def lookup(self, url):
+        """
+        Cached entry for a URL whether or not it is still fresh
+
+        Args:
+            url (str): Page URL
+
+        Returns:
+            dict: final_url, html, etag, fetched_at and fresh, or None if not cached
+        """
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT final_url, body, etag, fetched_at, page_type FROM pages WHERE key = ?", (cache_key(url),)
+            ).fetchone()
+        if not row:
+            return None
+        final_url, body, etag, fetched_at, kind = row
+        return {
+            'final_url': final_url,
+            'html': zlib.decompress(body).decode('utf-8'),
+            'etag': etag,
+            'fetched_at': fetched_at,
+            'fresh': time.time() - fetched_at < self.ttls.get(kind, 0)
+        }
+
+    def get(self, url):
+        """
+        Fresh cached copy of a page, counting the hit or miss
+
+        Args:
+            url (str): Page URL
+
+        Returns:
+            tuple: (final URL, page HTML), or None on a miss
+        """
+        return self.serve(url, self.lookup(url))
+
+    def serve(self, url, entry):
+        """
+        Count an entry from lookup() as a hit or miss, for callers that also need stale entries
+
+        Args:
+            url (str): Page URL the entry was looked up for
+            entry (dict): Result of lookup(url), None if not cached
+
+        Returns:
+            tuple: (final URL, page HTML) if the entry is fresh, None otherwise
+        """
+        with self.lock:
+            if not entry or not entry['fresh']:
+                self.misses += 1
+                return None
+            self.hits += 1
+        self.touch(url)
+        return entry['final_url'], entry['html']
+
+    def put(self, url, final_url, page_html, etag=None):
+        """
+        Store a downloaded page and evict old pages if the cache is over its size cap
+
+        Args:
+            url (str): Requested URL
+            final_url (str): URL after redirects
+            page_html (str): Page HTML
+            etag (str, optional): ETag the server sent with the page
+        """
+        body = zlib.compress(page_html.encode('utf-8'), 6)
+        now = time.time()
+        with self.lock, self.connection:
+            self.connection.execute("""
+                INSERT OR REPLACE INTO pages (key, url, page_type, final_url, body, etag, fetched_at, last_access, size)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (cache_key(url), normalize_url(url), page_type(url), final_url, body, etag, now, now, len(body)))
+        self.evict()
+
+    def touch(self, url, refetched=False):
+        """
+        Mark a page as recently used, and as freshly fetched after revalidation
+
+        Args:
+            url (str): Page URL
+            refetched (bool): The server confirmed the cached copy is current
+        """
+        now = time.time()
+        with self.lock, self.connection:
+            if refetched:
+                self.connection.execute("UPDATE pages SET last_access = ?, fetched_at = ? WHERE key = ?",
+                                        (now, now, cache_key(url)))
+            else:
+                self.connection.execute("UPDATE pages SET last_access = ? WHERE key = ?", (now, cache_key(url)))
+
+    def evict(self):
+        """
+        Drop least recently used pages until the cache fits in max_bytes
+
+        Returns:
+            int: Number of pages evicted
+        """
+        with self.lock, self.connection:
+            total = self.connection.execute("SELECT COALESCE(SUM(size), 0) FROM pages").fetchone()[0]
+            if total <= self.max_bytes:
+                return 0
+            evicted = []
+            for key, size in self.connection.execute("SELECT key, size FROM pages ORDER BY last_access").fetchall():
+                if total <= self.max_bytes:
+                    break
+                evicted.append((key,))
+                total -= size
+            self.connection.executemany("DELETE FROM pages WHERE key = ?", evicted)
+            self.evictions += len(evicted)
+        return len(evicted)
+
+    def clear(self):
+        """
+        Remove every cached page
+        """
+        with self.lock, self.connection:
+            self.connection.execute("DELETE FROM pages")
+
+    def stats(self):
+        """
+        Cache counters and size
+
+        Returns:
+            dict: hits, misses, revalidated, evictions, pages, bytes and hit_rate
+        """
+        with self.lock:
+            pages, size = self.connection.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM pages").fetchone()
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'revalidated': self.revalidated,
+            'evictions': self.evictions,
+            'pages': pages,
+            'bytes': size,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+    def print_report(self):
+        """
+        Print cache hits, misses and size
+        """
+        stats = self.stats()
+        if not stats['hits'] and not stats['misses']:
+            return
+        print(f"🗃️ Page cache: {stats['hits']} hits, {stats['misses']} misses ({stats['hit_rate']:.0%}), "
+              f"{stats['revalidated']} revalidated, {stats['pages']} pages / {stats['bytes'] / 1024 / 1024:.1f} MB")
+
+    def close(self):
+        """
+        Close the database connection
+        """
+        with self.lock:
+            self.connection.close()
+
+
+class CachingFetcher:
+    """
+    Wraps a fetcher so pages are served from a PageCache when fresh
+
+    Expired pages with an ETag are revalidated with If-None-Match when the
+    wrapped fetcher can send raw requests (HttpFetcher); a 304 reply renews
+    the cached copy without downloading it again.
+    """
+
+    def __init__(self, fetcher, cache):
+        """
+        Args:
+            fetcher: BrowserFetcher or HttpFetcher that does the actual downloads
+            cache (PageCache): Cache to consult first
+        """
+        self.fetcher = fetcher
+        self.cache = cache
+        self.name = fetcher.name
+
+    def fetch(self, url):
+        """
+        Return a page from the cache or download and cache it
+
+        Args:
+            url (str): Page URL
+
+        Returns:
+            tuple: (final URL after redirects, page HTML)
+        """
+        # One lookup serves both the freshness check and revalidation
+        entry = self.cache.lookup(url)
+        cached = self.cache.serve(url, entry)
+        if cached:
+            return cached
+
+        if not hasattr(self.fetcher, 'request'):
+            final_url, page_html = self.fetcher.fetch(url)
+            self.cache.put(url, final_url, page_html)
+            return final_url, page_html
+
+        headers = {'If-None-Match': entry['etag']} if entry and entry['etag'] else None
+        response = self.fetcher.request(url, headers=headers)
+        if response.status_code == 304 and entry:
+            with self.cache.lock:
+                self.cache.revalidated += 1
+            self.cache.touch(url, refetched=True)
+            return entry['final_url'], entry['html']
+        if response.status_code >= 400:
+            raise FetchError(f"Could not fetch {url}: HTTP {response.status_code}")
+
+        final_url = str(response.url)
+        self.cache.put(url, final_url, response.text, etag=response.headers.get('ETag'))
+        return final_url, response.text
+
+    def close(self):
+        self.fetcher.close()
@@ -0,0 +1,234 @@
+from concurrent.futures import ThreadPoolExecutor
+from lxml import etree, html as lxml_html
+from naukri_parser import clean_text
+import json
+import time
+
+
+# Fields filled in from a job's detail page
+DETAIL_FIELDS = ('full_description', 'salary', 'role', 'role_category', 'industry', 'department',
+                 'employment_type', 'posted_on', 'openings', 'applicants')
+
+# Labelled rows in the "Role / Industry Type / Department ..." block of the JD page
+_LABELLED_FIELDS = {
+    'role': "Role",
+    'role_category': "Role Category",
+    'industry': "Industry Type",
+    'department': "Department",
+    'employment_type': "Employment Type"
+}
+
+# Key stats in the job header: "Posted: 3 days ago", "Openings: 2", "Applicants: 100+"
+_STAT_FIELDS = {
+    'posted_on': "Posted",
+    'openings': "Openings",
+    'applicants': "Applicants"
+}
+
+DETAIL_SELECTORS = {
+    'full_description': [
+        "//section[contains(@class, 'job-desc')]//div[contains(@class, 'dang-inner-html')]",
+        "//div[contains(@class, 'dang-inner-html')]",
+        "//section[contains(@class, 'job-desc')]"
+    ],
+    'salary': [
+        "//div[contains(@class, 'salary')]//span",
+        "//span[contains(@class, 'salary')]"
+    ]
+}
+
+_COMPILED = {
+    field: [etree.XPath(selector) for selector in selectors]
+    for field, selectors in DETAIL_SELECTORS.items()
+}
+_LABEL_XPATH = etree.XPath(
+    "//*[self::label or self::span][starts-with(normalize-space(.), $label)]/following-sibling::*[1]"
+)
+_JSON_LD_XPATH = etree.XPath("//script[@type='application/ld+json']/text()")
+
+
+def _job_posting_json(document):
+    """
+    Find the schema.org JobPosting object embedded in the page, if any
+
+    Returns:
+        dict: JobPosting data or an empty dict
+    """
+    for script in _JSON_LD_XPATH(document):
+        try:
+            data = json.loads(script)
+        except ValueError:
+            continue
+        for item in data if isinstance(data, list) else [data]:
+            if isinstance(item, dict) and item.get('@type') == 'JobPosting':
+                return item
+    return {}
+
+
+def _salary_from_json(posting):
+    salary = posting.get('baseSalary')
+    if not isinstance(salary, dict):
+        return None
+    value = salary.get('value') or {}
+    if not isinstance(value, dict):
+        return clean_text(str(value)) or None
+    low, high = value.get('minValue'), value.get('maxValue')
+    if low is None and high is None:
+        return None
+    unit = value.get('unitText', '')
+    return clean_text(f"{salary.get('currency', '')} {low}-{high} {unit}")
+
+
+def parse_job_detail(page_html):
+    """
+    Extract the full description and metadata from a job detail page
+
+    The embedded JobPosting JSON-LD is used first and the visible page is
+    read for anything it lacks.
+
+    Args:
+        page_html (str): HTML of a job detail page
+
+    Returns:
+        dict: Detail fields that were found (see DETAIL_FIELDS)
+    """
+    if not page_html or not page_html.strip():
+        return {}
+
+    document = lxml_html.fromstring(page_html)
+    posting = _job_posting_json(document)
+    details = {}
+
+    if posting.get('description'):
+        details['full_description'] = clean_text(lxml_html.fromstring(posting['description']).text_content())
+    salary = _salary_from_json(posting)
+    if salary:
+        details['salary'] = salary
+    if posting.get('industry'):
+        details['industry'] = clean_text(str(posting['industry']))
+    if posting.get('employmentType'):
+        employment_type = posting['employmentType']
+        details['employment_type'] = clean_text(", ".join(employment_type) if isinstance(employment_type, list)
+                                                else str(employment_type))
+    if posting.get('occupationalCategory'):
+        details['role_category'] = clean_text(str(posting['occupationalCategory']))
+    if posting.get('datePosted'):
+        details['posted_on'] = posting['datePosted']
+
+    for field, compiled_selectors in _COMPILED.items():
+        if field in details:
+            continue
+        for compiled in compiled_selectors:
+            matches = compiled(document)
+            text = clean_text(matches[0].text_content()) if matches else ""
+            if text:
+                details[field] = text
+                break
+
+    for field, label in list(_LABELLED_FIELDS.items()) + list(_STAT_FIELDS.items()):
+        if field in details:
+            continue
+        matches = _LABEL_XPATH(document, label=f"{label}:")
+        text = clean_text(matches[0].text_content()) if matches else ""
+        if text:
+            details[field] = text
+
+    return details
+
+
+class JobEnricher:
+    """
+    Fills in job records from their detail pages, several pages at a time
+    """
+
+    def __init__(self, fetcher, workers=8, job_store=None, max_age_hours=24):
+        """
+        Args:
+            fetcher: Object with fetch(url) -> (final_url, html); must be thread-safe
+                when workers > 1 (HttpFetcher is, BrowserFetcher is not)
+            workers (int): Number of detail pages fetched at once
+            job_store (JobStore, optional): Used to skip and record enriched jobs
+            max_age_hours (float): Jobs enriched more recently than this are skipped
+        """
+        self.fetcher = fetcher
+        self.workers = workers
+        self.job_store = job_store
+        self.max_age_hours = max_age_hours
+
+    def needs_enrichment(self, jobs):
+        """
+        Jobs that have a link and no recent enrichment
+
+        Args:
+            jobs (list): Job dictionaries
+
+        Returns:
+            list: Jobs to enrich
+        """
+        cutoff = time.time() - self.max_age_hours * 3600
+        candidates = [
+            job for job in jobs
+            if job.get('link') not in (None, '', 'N/A') and (job.get('enriched_at') or 0) < cutoff
+        ]
+
+        if self.job_store:
+            recent = self.job_store.recently_enriched_job_ids(
+                (job.get('job_id') for job in candidates), cutoff
+            )
+            # Reuse the stored details instead of fetching the page again
+            for job in candidates:
+                if job.get('job_id') in recent:
+                    stored = self.job_store.get_job(job['job_id']) or {}
+                    job.update({field: stored[field] for field in DETAIL_FIELDS + ('enriched_at',) if field in stored})
+            candidates = [job for job in candidates if job.get('job_id') not in recent]
+        return candidates
+
+    def enrich_one(self, job):
+        """
+        Fetch, parse and merge one job's detail page
+
+        Returns:
+            bool: True if the job was enriched
+        """
+        try:
+            _, page_html = self.fetcher.fetch(job['link'])
+        except Exception as e:
+            print(f"⚠️ Could not fetch details for {job.get('job_id')}: {e}")
+            return False
+
+        details = parse_job_detail(page_html)
+        if not details:
+            return False
+        job.update(details)
+        job['enriched_at'] = time.time()
+        return True
+
+    def enrich(self, jobs):
+        """
+        Enrich jobs in place from their detail pages
+
+        Args:
+            jobs (list): Job dictionaries
+
+        Returns:
+            int: Number of jobs enriched
+        """
+        pending = self.needs_enrichment(jobs)
+        skipped = len(jobs) - len(pending)
+        print(f"📑 Enriching {len(pending)} jobs with {self.workers} workers ({skipped} skipped)")
+        if not pending:
+            return 0
+
+        start = time.perf_counter()
+        if self.workers > 1:
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="naukri-details") as executor:
+                results = list(executor.map(self.enrich_one, pending))
+        else:
+            results = [self.enrich_one(job) for job in pending]
+
+        enriched = [job for job, ok in zip(pending, results) if ok]
+        if self.job_store and enriched:
+            self.job_store.save_enrichment(enriched)
+
+        print(f"✅ Enriched {len(enriched)}/{len(pending)} jobs in {time.perf_counter() - start:.1f}s")
+        return len(enriched)
@@ -0,0 +1,250 @@
+from naukri_details import DETAIL_FIELDS
+from naukri_job import JOB_FIELDS, NORMALIZED_FIELDS, Job
+from naukri_output import output_timestamp
+import gzip
+import json
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+
+PARQUET_AVAILABLE = pa is not None
+
+EXPORT_FORMATS = ("parquet", "ndjson")
+
+# Column-chunked NDJSON: every line holds one batch as {"rows": n, "<column>": [values...]}
+NDJSON_SUFFIX = ".cols.jsonl.gz"
+PARQUET_SUFFIX = ".parquet"
+
+DEFAULT_BATCH_SIZE = 5000
+
+# Card, detail page and normalized fields, so enriched or normalized jobs export whole
+EXPORT_COLUMNS = JOB_FIELDS + DETAIL_FIELDS + ('enriched_at',) + NORMALIZED_FIELDS
+
+_LIST_COLUMNS = ('skills', 'cities')
+
+# Typed columns and the Python type their values are stored as
+_NUMERIC_COLUMNS = {
+    'enriched_at': float,
+    'experience_min': int,
+    'experience_max': int,
+    'posted_at': float,
+    'rating_value': float,
+    'salary_min': int,
+    'salary_max': int
+}
+
+
+def export_format_for(path):
+    """
+    Pick the export format from a file name
+
+    Args:
+        path (str): Output or input file
+
+    Returns:
+        str: "parquet" or "ndjson"
+    """
+    return "parquet" if path.endswith(PARQUET_SUFFIX) else "ndjson"
+
+
+def _column_value(job, column):
+    value = job.get(column)
+    if column == 'skills':
+        return list(value or ())
+    if value is None:
+        return None
+    if column in _LIST_COLUMNS:
+        return list(value)
+    if column in _NUMERIC_COLUMNS:
+        return _NUMERIC_COLUMNS[column](value)
+    return str(value)
+
+
+def _arrow_type(column):
+    if column in _LIST_COLUMNS:
+        return pa.list_(pa.string())
+    if column in _NUMERIC_COLUMNS:
+        return pa.int64() if _NUMERIC_COLUMNS[column] is int else pa.float64()
+    return pa.string()
+
+
+class ColumnarJobWriter:
+    """
+    Writes jobs column by column in batches, for datasets too large for JSON
+
+    Writes Parquet (one row group per batch) when pyarrow is installed and
+    gzip-compressed column-chunked NDJSON otherwise. Has the same
+    write_page/close interface as JsonlJobWriter, so it can be handed to
+    extract_job_listings_with_pagination to export pages as they arrive.
+    """
+
+    def __init__(self, path=None, columns=EXPORT_COLUMNS, batch_size=DEFAULT_BATCH_SIZE, export_format=None):
+        """
+        Args:
+            path (str, optional): Output file, defaults to naukri_jobs_<timestamp> with
+                a .parquet or .cols.jsonl.gz extension
+            columns (tuple): Job fields to export; by default the card fields plus
+                the detail page and normalized fields, which are empty for jobs
+                that were not enriched or normalized. Skills and cities are stored
+                as lists, normalized numbers and timestamps as numbers
+            batch_size (int): Rows buffered before a batch is written
+            export_format (str, optional): "parquet" or "ndjson", chosen from the
+                path (or pyarrow availability when there is no path) by default
+
+        Raises:
+            RuntimeError: If Parquet is requested and pyarrow is not installed
+        """
+        if export_format is None:
+            if path:
+                export_format = export_format_for(path)
+            else:
+                export_format = "parquet" if PARQUET_AVAILABLE else "ndjson"
+        if export_format not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown export format '{export_format}', expected one of {EXPORT_FORMATS}")
+        if export_format == "parquet" and not PARQUET_AVAILABLE:
+            raise RuntimeError("Parquet export needs pyarrow (pip install pyarrow)")
+
+        suffix = PARQUET_SUFFIX if export_format == "parquet" else NDJSON_SUFFIX
+        self.path = path or f"naukri_jobs_{output_timestamp()}{suffix}"
+        self.export_format = export_format
+        self.columns = tuple(columns)
+        self.batch_size = batch_size
+        self.buffer = {column: [] for column in self.columns}
+        self.buffered = 0
+        self.count = 0
+
+        if export_format == "parquet":
+            fields = [pa.field(column, _arrow_type(column)) for column in self.columns]
+            self.schema = pa.schema(fields)
+            self.file = pq.ParquetWriter(self.path, self.schema, compression='zstd')
+        else:
+            self.schema = None
+            self.file = gzip.open(self.path, 'at', encoding='utf-8')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write_page(self, jobs):
+        """
+        Buffer a page of jobs, writing a batch whenever batch_size rows are buffered
+
+        Args:
+            jobs (list): Job dictionaries or Job records
+        """
+        for job in jobs:
+            for column in self.columns:
+                self.buffer[column].append(_column_value(job, column))
+            self.buffered += 1
+            if self.buffered >= self.batch_size:
+                self.flush()
+
+    def flush(self):
+        """
+        Write the buffered rows as one batch
+        """
+        if not self.buffered:
+            return
+        if self.export_format == "parquet":
+            self.file.write_table(pa.table(self.buffer, schema=self.schema))
+        else:
+            self.file.write(json.dumps(dict(rows=self.buffered, **self.buffer), ensure_ascii=False) + "\n")
+            self.file.flush()
+        self.count += self.buffered
+        self.buffer = {column: [] for column in self.columns}
+        self.buffered = 0
+
+    def close(self):
+        """
+        Write any remaining rows and finish the file
+        """
+        if self.file is None:
+            return
+        self.flush()
+        self.file.close()
+        self.file = None
+
+
+def export_jobs(jobs, path=None, **options):
+    """
+    Export a job list in columnar form
+
+    Args:
+        jobs (iterable): Job dictionaries or Job records
+        path (str, optional): Output file, see ColumnarJobWriter
+        **options: Extra ColumnarJobWriter options
+
+    Returns:
+        str: Output filename
+    """
+    with ColumnarJobWriter(path, **options) as writer:
+        writer.write_page(jobs)
+    return writer.path
+
+
+def _ndjson_batches(path):
+    """Yield the batches of a column-chunked NDJSON file, stopping at a truncated tail"""
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        try:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    # A batch cut short by a crash mid-write
+                    continue
+        except (EOFError, gzip.BadGzipFile):
+            print(f"⚠️ {path} ends with an incomplete batch, reading what was written before it")
+
+
+def read_columns(path, columns=None):
+    """
+    Read an export back as whole columns, without building a dict per row
+
+    Args:
+        path (str): File written by ColumnarJobWriter
+        columns (list, optional): Columns to load, all by default
+
+    Returns:
+        dict: Column name -> list of values
+    """
+    if export_format_for(path) == "parquet":
+        if not PARQUET_AVAILABLE:
+            raise RuntimeError("Reading Parquet needs pyarrow (pip install pyarrow)")
+        return pq.read_table(path, columns=columns).to_pydict()
+
+    result = None
+    for batch in _ndjson_batches(path):
+        if result is None:
+            names = columns or [key for key in batch if key != 'rows']
+            result = {name: [] for name in names}
+        for name in result:
+            result[name].extend(batch.get(name) or [None] * batch['rows'])
+    return result or {name: [] for name in (columns or EXPORT_COLUMNS)}
+
+
+def iter_exported_jobs(path, as_records=False):
+    """
+    Read an export back one job at a time
+
+    Empty columns other than the card fields are left out of each job, so jobs
+    that were never enriched or normalized come back as they were written.
+
+    Args:
+        path (str): File written by ColumnarJobWriter
+        as_records (bool): Yield compact Job records instead of dictionaries
+
+    Yields:
+        dict or Job: One job per row
+    """
+    columns = read_columns(path)
+    names = list(columns)
+    for values in zip(*(columns[name] for name in names)):
+        job = {name: value for name, value in zip(names, values) if value is not None or name in JOB_FIELDS}
+        yield Job.from_dict(job) if as_records else job
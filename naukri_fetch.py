@@ -0,0 +1,156 @@
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import h2  # noqa: F401  (httpx only speaks HTTP/2 when h2 is installed)
+    HTTP2_AVAILABLE = httpx is not None
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+FETCH_BACKENDS = ("browser", "http")
+
+_NETWORK_ERRORS = (requests.RequestException,) + ((httpx.HTTPError,) if httpx is not None else ())
+
+DEFAULT_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9'
+}
+
+
+class FetchError(Exception):
+    """Raised when a page could not be downloaded"""
+
+
+class BrowserFetcher:
+    """
+    Fetches pages by loading them in the scraper's Chrome instance
+    """
+
+    name = "browser"
+
+    def __init__(self, scraper):
+        """
+        Args:
+            scraper (NaukriLogin): Scraper whose browser does the loading
+        """
+        self.scraper = scraper
+
+    def fetch(self, url):
+        """
+        Load a page and return its rendered HTML
+
+        Args:
+            url (str): Page URL
+
+        Returns:
+            tuple: (final URL after redirects, page HTML)
+        """
+        self.scraper.navigate(url)
+        driver = self.scraper.driver
+        return driver.current_url, driver.page_source
+
+    def close(self):
+        pass
+
+
+class HttpFetcher:
+    """
+    Downloads pages directly over pooled HTTP connections using a browser's cookies
+
+    Uses httpx with HTTP/2 when it is installed and falls back to a
+    keep-alive requests session otherwise.
+    """
+
+    name = "http"
+
+    def __init__(self, cookies=None, user_agent=None, pool_size=10, timeout=20, http2=True):
+        """
+        Args:
+            cookies (list, optional): Cookie dicts as returned by driver.get_cookies()
+            user_agent (str, optional): User-Agent to send, ideally the browser's own
+            pool_size (int): Maximum number of kept-alive connections
+            timeout (float): Request timeout in seconds
+            http2 (bool): Use HTTP/2 when httpx and h2 are available
+        """
+        self.timeout = timeout
+        headers = dict(DEFAULT_HEADERS)
+        if user_agent:
+            headers['User-Agent'] = user_agent
+
+        if httpx is not None:
+            limits = httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+            self.client = httpx.Client(http2=http2 and HTTP2_AVAILABLE, headers=headers, limits=limits,
+                                       timeout=timeout, follow_redirects=True)
+        else:
+            self.client = requests.Session()
+            self.client.headers.update(headers)
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            self.client.mount("https://", adapter)
+            self.client.mount("http://", adapter)
+
+        for cookie in cookies or []:
+            self.client.cookies.set(cookie['name'], cookie['value'],
+                                    domain=cookie.get('domain', ''), path=cookie.get('path', '/'))
+
+    @classmethod
+    def from_driver(cls, driver, **kwargs):
+        """
+        Build a fetcher that shares a logged-in browser's cookies and User-Agent
+
+        Args:
+            driver: Selenium WebDriver with an authenticated session
+            **kwargs: Extra HttpFetcher options
+
+        Returns:
+            HttpFetcher: Fetcher carrying the browser's session
+        """
+        user_agent = driver.execute_script("return navigator.userAgent")
+        return cls(cookies=driver.get_cookies(), user_agent=user_agent, **kwargs)
+
+    def request(self, url, headers=None):
+        """
+        Send a GET request
+
+        Args:
+            url (str): Page URL
+            headers (dict, optional): Extra request headers
+
+        Returns:
+            Response object from the underlying client
+
+        Raises:
+            FetchError: On network errors
+        """
+        try:
+            if httpx is not None:
+                return self.client.get(url, headers=headers)
+            return self.client.get(url, headers=headers, timeout=self.timeout)
+        except _NETWORK_ERRORS as e:
+            raise FetchError(f"Could not fetch {url}: {e}") from e
+
+    def fetch(self, url):
+        """
+        Download a page
+
+        Args:
+            url (str): Page URL
+
+        Returns:
+            tuple: (final URL after redirects, page HTML)
+
+        Raises:
+            FetchError: On network errors or non-success status codes
+        """
+        response = self.request(url)
+        if response.status_code >= 400:
+            raise FetchError(f"Could not fetch {url}: HTTP {response.status_code}")
+        return str(response.url), response.text
+
+    def close(self):
+        self.client.close()
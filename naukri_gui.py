@@ -1,12 +1,20 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import threading
+import queue
 import csv
 from datetime import datetime
 import os
 from naukri import NaukriLogin
+from naukri_session import DEFAULT_SESSION_FILE
+from naukri_export import PARQUET_AVAILABLE, NDJSON_SUFFIX, PARQUET_SUFFIX, export_jobs
+from naukri_results_view import VirtualJobTable
+from naukri_index import JobIndex
 from PIL import Image, ImageTk
 
+# Queued UI calls run per Tk tick, the same bound the results table uses for rows
+UI_CALLS_PER_TICK = 2000
+
 class NaukriJobScraperGUI:
     def __init__(self, root):
         self.root = root
@@ -37,7 +45,16 @@ class NaukriJobScraperGUI:
         self.is_running = False
         self.scraped_jobs = []
         
+        # Logged-in scraper kept alive between searches
+        self.scraper = None
+        self.scraper_email = None
+        
+        # Tk is not thread-safe, so the scraping thread hands UI updates over through this queue
+        self.ui_calls = queue.Queue()
+        
         self.setup_ui()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.root.after(50, self.process_ui_calls)
         
     def setup_ui(self):
         # Main frame
@@ -119,34 +136,30 @@ class NaukriJobScraperGUI:
         self.progress_label = ttk.Label(progress_frame, textvariable=self.progress_var)
         self.progress_label.grid(row=0, column=0, sticky=(tk.W, tk.E))
         
-        self.progress_bar = ttk.Progressbar(progress_frame, mode='indeterminate')
+        self.progress_bar = ttk.Progressbar(progress_frame, mode='determinate', maximum=100)
         self.progress_bar.grid(row=1, column=0, sticky=(tk.W, tk.E), pady=(10, 0))
         
         # Results Section
         results_frame = ttk.LabelFrame(main_frame, text="Results", padding="10")
         results_frame.grid(row=5, column=0, columnspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 10))
         results_frame.columnconfigure(0, weight=1)
-        results_frame.rowconfigure(0, weight=1)
+        results_frame.rowconfigure(1, weight=1)
         main_frame.rowconfigure(5, weight=1)
         
-        # Create Treeview for results
-        columns = ('Job Title', 'Company', 'Experience', 'Location', 'Rating', 'Posted Date', 'Job ID')
-        self.tree = ttk.Treeview(results_frame, columns=columns, show='headings', height=10)
-        
-        # Define headings
-        for col in columns:
-            self.tree.heading(col, text=col)
-            self.tree.column(col, width=120, minwidth=80)
-        
-        # Add scrollbars
-        v_scrollbar = ttk.Scrollbar(results_frame, orient=tk.VERTICAL, command=self.tree.yview)
-        h_scrollbar = ttk.Scrollbar(results_frame, orient=tk.HORIZONTAL, command=self.tree.xview)
-        self.tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
-        
-        # Grid the treeview and scrollbars
-        self.tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        v_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
-        h_scrollbar.grid(row=1, column=0, sticky=(tk.W, tk.E))
+        # Filter box, e.g. "skill:python city:pune -intern exp:3"
+        filter_frame = ttk.Frame(results_frame)
+        filter_frame.grid(row=0, column=0, sticky=(tk.W, tk.E), pady=(0, 5))
+        filter_frame.columnconfigure(1, weight=1)
+        ttk.Label(filter_frame, text="Filter:").grid(row=0, column=0, sticky=tk.W, padx=(0, 5))
+        self.filter_var = tk.StringVar()
+        self.filter_after_id = None
+        ttk.Entry(filter_frame, textvariable=self.filter_var).grid(row=0, column=1, sticky=(tk.W, tk.E))
+        self.filter_var.trace_add('write', self.on_filter_changed)
+        
+        # Virtualized results table; only the rows on screen exist as Treeview items
+        self.results_table = VirtualJobTable(results_frame, index=JobIndex())
+        self.results_table.frame.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        ttk.Label(filter_frame, textvariable=self.results_table.count_var).grid(row=0, column=2, padx=(10, 0))
         
         # Status bar
         self.status_var = tk.StringVar(value="Ready")
@@ -162,7 +175,11 @@ class NaukriJobScraperGUI:
         self.start_button.config(state='disabled')
         self.stop_button.config(state='normal')
         self.export_button.config(state='disabled')
-        self.progress_bar.start()
+        self.progress_bar.config(value=0)
+        
+        # Rows are streamed in page by page as the scrape runs
+        self.scraped_jobs = []
+        self.results_table.clear()
         
         # Start scraping in a separate thread
         thread = threading.Thread(target=self.scrape_jobs)
@@ -170,12 +187,12 @@ class NaukriJobScraperGUI:
         thread.start()
         
     def stop_scraping(self):
-        """Stop the scraping process"""
+        """Stop the scraping process; pagination stops within the current page"""
         self.is_running = False
-        self.update_progress("Stopping...")
-        self.start_button.config(state='normal')
+        if self.scraper:
+            self.scraper.stop()
+        self.update_progress("Stopping after the current page...")
         self.stop_button.config(state='disabled')
-        self.progress_bar.stop()
         
     def validate_inputs(self):
         """Validate user inputs"""
@@ -203,20 +220,8 @@ class NaukriJobScraperGUI:
     def scrape_jobs(self):
         """Main scraping function"""
         try:
-            self.update_progress("Initializing browser...")
-            self.update_status("Starting scraper...")
-            
-            # Initialize scraper
-            scraper = NaukriLogin()
-            
-            if not self.is_running:
-                return
-                
-            self.update_progress("Logging in to Naukri...")
-            if not scraper.login(self.email_var.get(), self.password_var.get()):
-                self.update_progress("Login failed!")
-                self.update_status("Login failed - check credentials")
-                messagebox.showerror("Error", "Login failed. Please check your credentials.")
+            scraper = self.get_scraper()
+            if not scraper:
                 return
                 
             if not self.is_running:
@@ -225,88 +230,158 @@ class NaukriJobScraperGUI:
             self.update_progress("Searching for jobs...")
             self.update_status("Searching jobs...")
             
-            # Perform job search
-            # if scraper.search_jobs(self.job_title_var.get()):
-            #     self.update_progress("Extracting job details...")
-            #     self.update_status("Extracting job details...")
-                
-            #     # Extract jobs with pagination
-            #     jobs = scraper.extract_job_listings_with_pagination(
-            #         max_jobs=int(self.max_jobs_var.get())
-                    
-            #     )
-            #     if jobs:
-            #         self.scraped_jobs = jobs
-            #         self.populate_results(jobs)
-            #         self.update_progress(f"Successfully scraped {len(jobs)} jobs!")
-            #         self.update_status(f"Scraped {len(jobs)} jobs successfully")
-            #         self.export_button.config(state='normal')
-            #         messagebox.showinfo("Success", f"Successfully scraped {len(jobs)} jobs!")
-            #     else:
-            #         self.update_progress("No jobs found")
-            #         self.update_status("No jobs found")
-            #         messagebox.showwarning("Warning", "No jobs found for the given criteria")
-            # else:
-            #     self.update_progress("Job search failed")
-            #     self.update_status("Job search failed")
-            #     messagebox.showerror("Error", "Job search failed")
-
             self.update_progress("Extracting job details...")
             self.update_status("Extracting job details...")
-            job_result = scraper.search_jobs(self.job_title_var.get(), self.location_var.get(), self.experience_var.get())
+            # The browser is reused, so clear a stop request left over from the previous search
+            scraper.stop_event.clear()
+            scraper.progress_callback = self.on_progress
+            job_result = scraper.search_jobs(self.job_title_var.get(), self.location_var.get(), self.experience_var.get(),
+                                             max_jobs=int(self.max_jobs_var.get()), collect=False)
             
             if job_result[0]:
                 
                 
-                # Extract jobs with pagination
-                jobs = job_result[1]
-                if jobs:
-                    self.scraped_jobs = jobs
-                    self.populate_results(jobs)
-                    self.update_progress(f"Successfully scraped {len(jobs)} jobs!")
-                    self.update_status(f"Scraped {len(jobs)} jobs successfully")
-                    self.export_button.config(state='normal')
-                    messagebox.showinfo("Success", f"Successfully scraped {len(jobs)} jobs!")
+                # Rows were already added page by page through on_progress
+                job_count = job_result[1]
+                stopped = scraper.is_stopped()
+                if job_count:
+                    message = (f"Stopped after {job_count} jobs" if stopped
+                               else f"Successfully scraped {job_count} jobs!")
+                    self.update_progress(message)
+                    self.update_status(f"Scraped {job_count} jobs" + (" (stopped)" if stopped else " successfully"))
+                    self.run_on_ui(self.export_button.config, {'state': 'normal'})
+                    if not stopped:
+                        self.run_on_ui(messagebox.showinfo, "Success", message)
+                elif stopped:
+                    self.update_progress("Scraping stopped")
+                    self.update_status("Stopped")
                 else:
                     self.update_progress("No jobs found")
                     self.update_status("No jobs found")
-                    messagebox.showwarning("Warning", "No jobs found for the given criteria")
+                    self.run_on_ui(messagebox.showwarning, "Warning", "No jobs found for the given criteria")
+            elif scraper.is_stopped():
+                self.update_progress("Scraping stopped")
+                self.update_status("Stopped")
             else:
                 self.update_progress("Job search failed")
                 self.update_status("Job search failed")
-                messagebox.showerror("Error", "Job search failed")
+                self.run_on_ui(messagebox.showerror, "Error", "Job search failed")
 
                 
         except Exception as e:
             self.update_progress(f"Error: {str(e)}")
             self.update_status(f"Error: {str(e)}")
-            messagebox.showerror("Error", f"An error occurred: {str(e)}")
+            self.run_on_ui(messagebox.showerror, "Error", f"An error occurred: {str(e)}")
         finally:
             self.is_running = False
-            self.start_button.config(state='normal')
-            self.stop_button.config(state='disabled')
-            self.progress_bar.stop()
+            self.run_on_ui(self.start_button.config, {'state': 'normal'})
+            self.run_on_ui(self.stop_button.config, {'state': 'disabled'})
             
-    def populate_results(self, jobs):
-        """Populate the results treeview"""
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+    def on_progress(self, event, data):
+        """Progress callback from the scraper; runs on the scraping thread"""
+        self.run_on_ui(self.handle_progress, event, data)
+        
+    def handle_progress(self, event, data):
+        """Show pagination progress and stream each page's jobs into the table"""
+        if event == 'page_started':
+            self.progress_var.set(f"Scraping page {data['page']}... ({data['total']}/{data['max_jobs']} jobs)")
+        elif event == 'jobs_extracted':
+            self.scraped_jobs.extend(data['jobs'])
+            self.results_table.add_jobs(data['jobs'])
+            self.export_button.config(state='normal')
+        elif event == 'page_done':
+            self.progress_bar.config(value=min(100, 100 * data['total'] / max(data['max_jobs'], 1)))
+            remaining = ""
+            if data['total'] < data['max_jobs'] and data['remaining_pages']:
+                remaining = f", ~{data['remaining_pages']} pages (~{data['eta_seconds']:.0f}s) left"
+            self.progress_var.set(f"Page {data['page']} done: {data['total']}/{data['max_jobs']} jobs{remaining}")
+            
+    def on_filter_changed(self, *_):
+        """Re-filter the results shortly after the user stops typing"""
+        if self.filter_after_id:
+            self.root.after_cancel(self.filter_after_id)
+        self.filter_after_id = self.root.after(200, self.apply_filter)
+        
+    def apply_filter(self):
+        """Show only the results matching the filter box"""
+        self.filter_after_id = None
+        self.results_table.set_filter(self.filter_var.get())
+        
+    def run_on_ui(self, function, *args):
+        """Run a function on the Tk thread; safe to call from any thread"""
+        if threading.current_thread() is threading.main_thread():
+            function(*args)
+        else:
+            self.ui_calls.put((function, args))
             
-        # Add jobs to treeview
-        for job in jobs:
-            self.tree.insert('', 'end', values=(
-                job.get('title', 'N/A'),
-                job.get('company', 'N/A'),
-                job.get('experience', 'N/A'),
-                job.get('location', 'N/A'),
-                job.get('rating', 'N/A'),
-                job.get('posted_date', 'N/A'),
-                job.get('job_id', 'N/A')
-            ))
+    def process_ui_calls(self):
+        """Run UI updates queued by the scraping thread, leaving the rest of a burst for later ticks"""
+        for _ in range(UI_CALLS_PER_TICK):
+            try:
+                function, args = self.ui_calls.get_nowait()
+            except queue.Empty:
+                break
+            function(*args)
+        self.root.after(50, self.process_ui_calls)
+            
+    def get_scraper(self):
+        """Reuse the logged-in browser from the previous search, or start and log in a new one"""
+        email = self.email_var.get()
+        if self.scraper and self.scraper_email == email:
+            try:
+                # Cheap liveness check; raises if the browser was closed
+                self.scraper.driver.current_url
+                self.update_progress("Reusing logged-in browser...")
+                return self.scraper
+            except Exception:
+                self.close_scraper()
+        else:
+            self.close_scraper()
+        
+        self.update_progress("Initializing browser...")
+        self.update_status("Starting scraper...")
+        
+        # Initialize scraper
+        scraper = NaukriLogin(session_file=DEFAULT_SESSION_FILE, normalize=True)
+        
+        if not self.is_running:
+            scraper.close()
+            return None
+            
+        self.update_progress("Logging in to Naukri...")
+        if not scraper.login(email, self.password_var.get()):
+            scraper.close()
+            self.update_progress("Login failed!")
+            self.update_status("Login failed - check credentials")
+            self.run_on_ui(messagebox.showerror, "Error", "Login failed. Please check your credentials.")
+            return None
+        
+        self.scraper = scraper
+        self.scraper_email = email
+        return scraper
+        
+    def close_scraper(self):
+        """Close the kept-alive browser, if any"""
+        if self.scraper:
+            try:
+                self.scraper.close()
+            except Exception:
+                pass
+        self.scraper = None
+        self.scraper_email = None
+        
+    def on_close(self):
+        """Close the browser along with the window"""
+        self.is_running = False
+        self.close_scraper()
+        self.root.destroy()
+            
+    def populate_results(self, jobs):
+        """Replace the results table's rows; safe to call from the scraping thread"""
+        self.results_table.set_jobs(jobs)
             
     def export_to_csv(self):
-        """Export scraped jobs to CSV file"""
+        """Export scraped jobs to CSV, or to a columnar file for large result sets"""
         if not self.scraped_jobs:
             messagebox.showwarning("Warning", "No jobs to export")
             return
@@ -315,33 +390,34 @@ class NaukriJobScraperGUI:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         default_filename = f"naukri_jobs_{timestamp}.csv"
         
+        filetypes = [("CSV files", "*.csv"), ("Compressed columnar JSON", f"*{NDJSON_SUFFIX}")]
+        if PARQUET_AVAILABLE:
+            filetypes.insert(1, ("Parquet files", f"*{PARQUET_SUFFIX}"))
         filename = filedialog.asksaveasfilename(
             defaultextension=".csv",
-            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
+            filetypes=filetypes + [("All files", "*.*")],
             initialfile=default_filename
         )
         
         if filename:
             try:
+                if filename.endswith((PARQUET_SUFFIX, NDJSON_SUFFIX)):
+                    export_jobs(self.scraped_jobs, filename)
+                    messagebox.showinfo("Success", f"Jobs exported successfully to {filename}")
+                    self.update_status(f"Exported to {os.path.basename(filename)}")
+                    return
+
                 with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                    fieldnames = ['Job Title', 'Company', 'Experience', 'Location', 'Rating', 
-                                 'Posted Date', 'Skills', 'Description', 'Job Link', 'Job ID']
-                    writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                    
-                    writer.writeheader()
-                    for job in self.scraped_jobs:
-                        writer.writerow({
-                            'Job Title': job.get('title', ''),
-                            'Company': job.get('company', ''),
-                            'Experience': job.get('experience', ''),
-                            'Location': job.get('location', ''),
-                            'Rating': job.get('rating', ''),
-                            'Posted Date': job.get('posted_date', ''),
-                            'Skills': ', '.join(job.get('skills', [])),
-                            'Description': job.get('description', ''),
-                            'Job Link': job.get('link', ''),
-                            'Job ID': job.get('job_id', '')
-                        })
+                    writer = csv.writer(csvfile)
+                    writer.writerow(['Job Title', 'Company', 'Experience', 'Location', 'Rating',
+                                     'Posted Date', 'Skills', 'Description', 'Job Link', 'Job ID'])
+                    writer.writerows(
+                        (job.get('title', ''), job.get('company', ''), job.get('experience', ''),
+                         job.get('location', ''), job.get('rating', ''), job.get('posted_date', ''),
+                         ', '.join(job.get('skills', [])), job.get('description', ''),
+                         job.get('link', ''), job.get('job_id', ''))
+                        for job in self.scraped_jobs
+                    )
                         
                 messagebox.showinfo("Success", f"Jobs exported successfully to {filename}")
                 self.update_status(f"Exported to {os.path.basename(filename)}")
@@ -352,21 +428,18 @@ class NaukriJobScraperGUI:
     def clear_results(self):
         """Clear all results"""
         self.scraped_jobs = []
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self.results_table.clear()
         self.export_button.config(state='disabled')
         self.update_progress("Results cleared")
         self.update_status("Ready")
         
     def update_progress(self, message):
-        """Update progress message"""
-        self.progress_var.set(message)
-        self.root.update_idletasks()
+        """Update progress message; safe to call from any thread"""
+        self.run_on_ui(self.progress_var.set, message)
         
     def update_status(self, message):
-        """Update status bar"""
-        self.status_var.set(message)
-        self.root.update_idletasks()
+        """Update status bar; safe to call from any thread"""
+        self.run_on_ui(self.status_var.set, message)
 
 def main():
     root = tk.Tk()
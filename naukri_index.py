@@ -0,0 +1,477 @@
+from naukri_normalize import CITY_ALIASES, parse_experience, parse_posted_date
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from functools import lru_cache
+from heapq import merge
+from itertools import compress
+import re
+import time
+
+
+# Job fields that are tokenized into the inverted index
+INDEXED_FIELDS = ('title', 'skills', 'company', 'location', 'description')
+
+# Names accepted before a colon in queries, e.g. "skill:python" or "city:pune"
+FIELD_ALIASES = {
+    'title': 'title',
+    'skill': 'skills',
+    'skills': 'skills',
+    'company': 'company',
+    'location': 'location',
+    'city': 'location',
+    'description': 'description',
+    'desc': 'description'
+}
+
+# Keeps "c++", "c#", "node.js" and ".net" together as single tokens
+_TOKEN = re.compile(r'[a-z0-9.+#]*[a-z0-9+#]')
+_EXPERIENCE_FILTER = re.compile(r'^(\d+)(?:-(\d+))?$')
+
+# Turns the '0'/'1' digits of bin() into zero and non-zero bytes for itertools.compress
+_BIT_DIGITS = bytes.maketrans(b'01', b'\x00\x01')
+_NONZERO_BYTE = re.compile(rb'[^\x00]')
+
+# Set bit positions of every byte value, for sparse bitmaps
+_BYTE_BITS = tuple(tuple(bit for bit in range(8) if value >> bit & 1) for value in range(256))
+
+# Posting lists at least this long keep a cached bitmap
+_CACHE_MIN_POSTINGS = 64
+
+# Range bitmaps kept per numeric index before the cache starts over
+_MAX_CACHED_RANGES = 256
+
+_DAY = 86400
+
+
+def _city_spellings(aliases):
+    """Every one-word spelling of a city, keyed by each of those spellings"""
+    groups = {}
+    for alias, canonical in aliases.items():
+        groups.setdefault(canonical.lower(), {canonical.lower()}).add(alias)
+    spellings = {}
+    for names in groups.values():
+        single = tuple(sorted(name for name in names if ' ' not in name))
+        for name in single:
+            spellings[name] = single
+    return spellings
+
+
+# "bengaluru" -> ("bangalore", "bengaluru"), so a location term matches every spelling
+_CITY_SPELLINGS = _city_spellings(CITY_ALIASES)
+
+
+def tokenize(text):
+    """
+    Split text into lowercase index tokens
+
+    Args:
+        text (str): Field value
+
+    Returns:
+        list: Tokens in order of appearance, repeats included
+    """
+    if not text or text == 'N/A':
+        return []
+    return _TOKEN.findall(text.lower())
+
+
+@lru_cache(maxsize=65536)
+def _cached_tokens(text):
+    """Distinct tokens of a company, location or skill value; these repeat across thousands of jobs"""
+    return frozenset(tokenize(text))
+
+
+def _bits(ids):
+    """Bitmap (as an int) with the bit of every id set; ids must be ascending"""
+    if not ids:
+        return 0
+    base = ids[0]
+    buffer = bytearray(((ids[-1] - base) >> 3) + 1)
+    for doc_id in ids:
+        offset = doc_id - base
+        buffer[offset >> 3] |= 1 << (offset & 7)
+    return int.from_bytes(buffer, 'little') << base
+
+
+def bitmap_ids(bitmap, offset=0):
+    """
+    Ascending ids of the bits set in a bitmap
+
+    Args:
+        bitmap (int): Bitmap, e.g. from JobIndex.search_bitmap
+        offset (int): Added to every id, for bitmaps that were shifted right
+
+    Returns:
+        list: Ids of the set bits
+    """
+    if not bitmap:
+        return []
+    data = bitmap.to_bytes((bitmap.bit_length() + 7) >> 3, 'little')
+    if (len(data) - data.count(0)) * 8 < len(data):
+        # Sparse: let the regex engine skip the empty bytes
+        ids = []
+        for match in _NONZERO_BYTE.finditer(data):
+            base = offset + (match.start() << 3)
+            ids.extend(base + bit for bit in _BYTE_BITS[data[match.start()]])
+        return ids
+    # Dense: bin() and compress() run in C, unlike a loop over the bits
+    digits = bin(bitmap)[:1:-1].encode('ascii').translate(_BIT_DIGITS)
+    return list(compress(range(offset, offset + len(digits)), digits))
+
+
+def _cached_bitmap(cache, key, postings):
+    """Bitmap of a posting list, extending its cached bitmap with the postings added since"""
+    if len(postings) < _CACHE_MIN_POSTINGS:
+        return _bits(postings)
+    bitmap, covered = cache.get(key, (0, 0))
+    if covered < len(postings):
+        bitmap |= _bits(postings[covered:])
+        cache[key] = (bitmap, len(postings))
+    return bitmap
+
+
+class NumericIndex:
+    """
+    Job ids grouped by a whole-number value (years, days), for range lookups
+
+    Each distinct value has a posting list and the values are kept sorted,
+    so a range is found with bisect and answered by OR-ing the bitmaps of
+    the values inside it. Range bitmaps are cached and jobs added later are
+    OR-ed in when the range is next asked for, so adding a job never
+    invalidates anything.
+    """
+
+    def __init__(self):
+        self.postings = {}
+        self.keys = []
+        # Value of every job by id, NaN where the job has none
+        self.values = array('d')
+        self.bitmaps = {}
+        self.ranges = {}
+
+    def __len__(self):
+        return len(self.values)
+
+    def add(self, doc_id, value):
+        """
+        Args:
+            doc_id (int): Job id in the JobIndex; ids must be added in order
+            value (float): Value to index, None to leave the job out of every range
+        """
+        self.values.append(float('nan') if value is None else value)
+        if value is None:
+            return
+        postings = self.postings.get(value)
+        if postings is None:
+            postings = self.postings[value] = array('I')
+            insort(self.keys, value)
+        postings.append(doc_id)
+
+    def bitmap_between(self, low=None, high=None):
+        """
+        Bitmap of the jobs whose value is within [low, high]
+
+        Args:
+            low (float, optional): Smallest value, unbounded if not given
+            high (float, optional): Largest value, unbounded if not given
+
+        Returns:
+            int: Bitmap with bit i set when job i is in range
+        """
+        cached = self.ranges.get((low, high))
+        if cached is None:
+            start = 0 if low is None else bisect_left(self.keys, low)
+            end = len(self.keys) if high is None else bisect_right(self.keys, high)
+            bitmap = 0
+            for value in self.keys[start:end]:
+                bitmap |= _cached_bitmap(self.bitmaps, value, self.postings[value])
+        else:
+            bitmap, covered = cached
+            if covered < len(self.values):
+                lowest = float('-inf') if low is None else low
+                highest = float('inf') if high is None else high
+                values = self.values
+                # NaN fails both comparisons, so jobs without a value stay out
+                bitmap |= _bits([doc_id for doc_id in range(covered, len(values))
+                                 if lowest <= values[doc_id] <= highest])
+        if len(self.ranges) >= _MAX_CACHED_RANGES:
+            self.ranges.clear()
+        self.ranges[low, high] = (bitmap, len(self.values))
+        return bitmap
+
+    def clear(self):
+        self.postings = {}
+        self.keys = []
+        self.values = array('d')
+        self.bitmaps = {}
+        self.ranges = {}
+
+
+class JobIndex:
+    """
+    In-memory inverted index for searching and filtering scraped jobs
+
+    Every token of a job's title, skills, company, location and description
+    gets a posting list of job ids. Common tokens also keep their posting
+    list as a bitmap (a Python int with one bit per job), so AND, OR and NOT
+    over hundreds of thousands of jobs are single big-int operations.
+    Experience (in years) and posting date (in days) get numeric indexes
+    whose ranges are bitmaps too. Jobs can be added at any time without
+    rebuilding anything; ids are the order in which jobs were added.
+
+    Queries are whitespace-separated terms that must all match:
+        python django          both tokens, in any indexed field
+        skill:python city:pune a token in one field
+        py*                    any token starting with "py"
+        python OR java         either term
+        -intern / NOT intern   exclude a term
+        exp:3 / exp:2-5        experience range overlaps the years given
+        days:7                 posted within the last 7 days, counting whole days
+    """
+
+    def __init__(self, jobs=(), scraped_at=None):
+        """
+        Args:
+            jobs (iterable, optional): Jobs to index straight away
+            scraped_at (float, optional): Unix time relative posting dates are
+                counted from, the time each job is added by default
+        """
+        self.scraped_at = scraped_at
+        self.jobs = []
+        # Field -> token -> ascending job ids
+        self.postings = {field: {} for field in INDEXED_FIELDS}
+        # Field -> sorted tokens, for prefix queries; new tokens wait in new_tokens
+        self.vocabulary = {field: [] for field in INDEXED_FIELDS}
+        self.new_tokens = {field: [] for field in INDEXED_FIELDS}
+        self.bitmaps = {}
+        self.experience_min = NumericIndex()
+        # Open-ended ranges such as "5+ Yrs" are stored with an infinite maximum
+        self.experience_max = NumericIndex()
+        self.posted_day = NumericIndex()
+        self.add_many(jobs)
+
+    def __len__(self):
+        return len(self.jobs)
+
+    def add(self, job):
+        """
+        Index one job
+
+        Args:
+            job (dict or Job): Job to index
+
+        Returns:
+            int: The job's id
+        """
+        doc_id = len(self.jobs)
+        self.jobs.append(job)
+
+        for field in INDEXED_FIELDS:
+            value = job.get(field)
+            if field == 'skills':
+                tokens = set()
+                for skill in value or ():
+                    tokens |= _cached_tokens(skill)
+            elif field == 'description':
+                tokens = set(tokenize(value))
+            elif field == 'location' and job.get('cities'):
+                # Canonical names too, so "Bangalore" and "Bengaluru" jobs share a token
+                tokens = set(_cached_tokens(value or ''))
+                for city in job.get('cities'):
+                    tokens |= _cached_tokens(city)
+            else:
+                tokens = _cached_tokens(value or '')
+            field_postings = self.postings[field]
+            for token in tokens:
+                postings = field_postings.get(token)
+                if postings is None:
+                    postings = field_postings[token] = array('I')
+                    self.new_tokens[field].append(token)
+                postings.append(doc_id)
+
+        low, high = job.get('experience_min'), job.get('experience_max')
+        if low is None:
+            low, high = parse_experience(job.get('experience'))
+        self.experience_min.add(doc_id, low)
+        self.experience_max.add(doc_id, None if low is None else float('inf') if high is None else high)
+        posted_at = job.get('posted_at')
+        if posted_at is None:
+            posted_at = parse_posted_date(job.get('posted_date'), self.scraped_at or time.time())
+        self.posted_day.add(doc_id, None if posted_at is None else posted_at // _DAY)
+        return doc_id
+
+    def add_many(self, jobs):
+        """
+        Index several jobs
+
+        Args:
+            jobs (iterable): Jobs to index
+
+        Returns:
+            range: Ids given to the jobs
+        """
+        first = len(self.jobs)
+        for job in jobs:
+            self.add(job)
+        return range(first, len(self.jobs))
+
+    def clear(self):
+        """
+        Drop every job from the index
+        """
+        self.jobs = []
+        self.postings = {field: {} for field in INDEXED_FIELDS}
+        self.vocabulary = {field: [] for field in INDEXED_FIELDS}
+        self.new_tokens = {field: [] for field in INDEXED_FIELDS}
+        self.bitmaps = {}
+        self.experience_min.clear()
+        self.experience_max.clear()
+        self.posted_day.clear()
+
+    def _term_bitmap(self, field, token):
+        """Bitmap of one field's token, extending its cached bitmap with new postings"""
+        postings = self.postings[field].get(token)
+        if not postings:
+            return 0
+        return _cached_bitmap(self.bitmaps, (field, token), postings)
+
+    def _tokens_with_prefix(self, field, prefix):
+        """Indexed tokens of a field starting with prefix"""
+        if self.new_tokens[field]:
+            self.vocabulary[field] = list(merge(self.vocabulary[field], sorted(self.new_tokens[field])))
+            self.new_tokens[field] = []
+        vocabulary = self.vocabulary[field]
+        start = bisect_left(vocabulary, prefix)
+        end = bisect_left(vocabulary, prefix + '\uffff', start)
+        return vocabulary[start:end]
+
+    def _match_term(self, term):
+        """Bitmap of the jobs matching one query term"""
+        fields = INDEXED_FIELDS
+        if ':' in term:
+            name, value = term.split(':', 1)
+            if name in FIELD_ALIASES:
+                fields = (FIELD_ALIASES[name],)
+                term = value
+
+        prefix = term.endswith('*')
+        tokens = tokenize(term.rstrip('*'))
+        if not tokens:
+            return None
+
+        result = None
+        for position, token in enumerate(tokens):
+            matched = 0
+            for field in fields:
+                if prefix and position == len(tokens) - 1:
+                    for prefixed in self._tokens_with_prefix(field, token):
+                        matched |= self._term_bitmap(field, prefixed)
+                elif field == 'location' and token in _CITY_SPELLINGS:
+                    for spelling in _CITY_SPELLINGS[token]:
+                        matched |= self._term_bitmap(field, spelling)
+                else:
+                    matched |= self._term_bitmap(field, token)
+            result = matched if result is None else result & matched
+        return result
+
+    def _match_filter(self, term, now):
+        """Bitmap of an exp: or days: filter term, or None if the term is not one"""
+        name, _, value = term.partition(':')
+        if name in ('exp', 'experience'):
+            match = _EXPERIENCE_FILTER.match(value)
+            if match:
+                low = int(match.group(1))
+                high = int(match.group(2)) if match.group(2) else low
+                # Ranges overlap when the job's minimum is at most high and its maximum at least low
+                return self.experience_min.bitmap_between(None, high) & self.experience_max.bitmap_between(low, None)
+        elif name == 'days' and value.isdigit():
+            return self.posted_day.bitmap_between((now - int(value) * _DAY) // _DAY, None)
+        return None
+
+    def search_bitmap(self, query, now=None):
+        """
+        Evaluate a query to a bitmap of matching job ids
+
+        Args:
+            query (str): Query, see the class docstring
+            now (float, optional): Unix time days: filters count back from
+
+        Returns:
+            int: Bitmap with bit i set when job i matches
+        """
+        now = time.time() if now is None else now
+        result = (1 << len(self.jobs)) - 1
+        excluded = 0
+        group = None
+        negate_next = False
+        join_next = False
+
+        words = query.split()
+        for word in words:
+            if word == 'OR':
+                join_next = group is not None
+                continue
+            if word == 'NOT':
+                negate_next = True
+                continue
+            negate = negate_next or (word.startswith('-') and len(word) > 1)
+            negate_next = False
+            term = word.lstrip('-').lower() if negate else word.lower()
+
+            matched = self._match_filter(term, now)
+            if matched is None:
+                matched = self._match_term(term)
+            if matched is None:
+                continue
+
+            if negate:
+                excluded |= matched
+            elif join_next:
+                group |= matched
+            else:
+                if group is not None:
+                    result &= group
+                group = matched
+            join_next = False
+
+        if group is not None:
+            result &= group
+        return result & ~excluded
+
+    def search(self, query, start=0, now=None):
+        """
+        Ids of the jobs matching a query
+
+        Args:
+            query (str): Query, see the class docstring; an empty query matches every job
+            start (int): Only return ids from this one on, e.g. for jobs added since the last search
+            now (float, optional): Unix time days: filters count back from
+
+        Returns:
+            list: Matching job ids in the order the jobs were added
+        """
+        return bitmap_ids(self.search_bitmap(query, now) >> start, start)
+
+    def count(self, query, now=None):
+        """
+        Number of jobs matching a query, without listing them
+
+        Args:
+            query (str): Query, see the class docstring
+
+        Returns:
+            int: Match count
+        """
+        return bin(self.search_bitmap(query, now)).count('1')
+
+    def find(self, query, now=None):
+        """
+        Jobs matching a query
+
+        Args:
+            query (str): Query, see the class docstring
+
+        Returns:
+            list: Matching jobs in the order they were added
+        """
+        return [self.jobs[doc_id] for doc_id in self.search(query, now=now)]
@@ -0,0 +1,146 @@
+import sys
+
+
+# Card fields in the order the job dictionaries have always used
+JOB_FIELDS = ('title', 'link', 'company', 'rating', 'experience', 'location',
+              'description', 'skills', 'posted_date', 'job_id')
+
+# Fields with few distinct values across many jobs, stored as interned strings
+# so every job from the same company or city shares one string object
+INTERNED_FIELDS = ('company', 'rating', 'experience', 'location', 'posted_date')
+
+# Typed fields added by the normalization stage (see naukri_normalize)
+NORMALIZED_FIELDS = ('experience_min', 'experience_max', 'posted_at', 'rating_value', 'cities',
+                     'salary_min', 'salary_max')
+
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class Job:
+    """
+    Compact record for one job, for holding large numbers of jobs in memory
+
+    Uses __slots__ instead of a per-job dict, interns the repetitive fields
+    (company, rating, experience, location, posted date and skills) and keeps
+    skills as a tuple. Normalized fields have their own slots and are None
+    until the normalization stage fills them in; other fields outside the
+    card (e.g. detail enrichment) are kept in an 'extra' dict that only
+    exists when needed.
+
+    Job.get() mirrors dict.get(), so code that reads job dictionaries with
+    .get() (write_summary, the GUI's CSV export) works on Job objects as is.
+    """
+
+    __slots__ = JOB_FIELDS + NORMALIZED_FIELDS + ('extra',)
+
+    def __init__(self, title="N/A", link="N/A", company="N/A", rating="N/A", experience="N/A",
+                 location="N/A", description="N/A", skills=(), posted_date="N/A", job_id=None, extra=None,
+                 experience_min=None, experience_max=None, posted_at=None, rating_value=None, cities=None,
+                 salary_min=None, salary_max=None):
+        self.title = title
+        self.link = link
+        self.company = _intern(company)
+        self.rating = _intern(rating)
+        self.experience = _intern(experience)
+        self.location = _intern(location)
+        self.description = description
+        self.skills = tuple(_intern(skill) for skill in skills or ())
+        self.posted_date = _intern(posted_date)
+        self.job_id = job_id
+        self.extra = extra or None
+        self.experience_min = experience_min
+        self.experience_max = experience_max
+        self.posted_at = posted_at
+        self.rating_value = rating_value
+        self.cities = None if cities is None else tuple(_intern(city) for city in cities)
+        self.salary_min = salary_min
+        self.salary_max = salary_max
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Build a Job from a job dictionary
+
+        Args:
+            data (dict): Job dictionary as produced by the extraction engines
+
+        Returns:
+            Job: Compact record
+        """
+        extra = {key: value for key, value in data.items() if key not in JOB_FIELDS + NORMALIZED_FIELDS}
+        fields = {field: data[field] for field in JOB_FIELDS + NORMALIZED_FIELDS if field in data}
+        return cls(**fields, extra=extra)
+
+    def to_dict(self):
+        """
+        Convert back to the job dictionary shape used by save_jobs_to_file and the GUI
+
+        Returns:
+            dict: Job dictionary with skills as a list, and normalized fields once they are set
+        """
+        data = {
+            'title': self.title,
+            'link': self.link,
+            'company': self.company,
+            'rating': self.rating,
+            'experience': self.experience,
+            'location': self.location,
+            'description': self.description,
+            'skills': list(self.skills),
+            'posted_date': self.posted_date,
+            'job_id': self.job_id
+        }
+        for field in NORMALIZED_FIELDS:
+            value = getattr(self, field)
+            if value is not None:
+                data[field] = list(value) if field == 'cities' else value
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def get(self, key, default=None):
+        """Read a field like dict.get(); skills and cities come back as tuples"""
+        if key in JOB_FIELDS:
+            return getattr(self, key)
+        if key in NORMALIZED_FIELDS:
+            value = getattr(self, key)
+            return default if value is None else value
+        if self.extra:
+            return self.extra.get(key, default)
+        return default
+
+    def __eq__(self, other):
+        if not isinstance(other, Job):
+            return NotImplemented
+        return all(getattr(self, field) == getattr(other, field) for field in self.__slots__)
+
+    def __repr__(self):
+        return f"Job(job_id={self.job_id!r}, title={self.title!r}, company={self.company!r})"
+
+
+def jobs_from_dicts(jobs):
+    """
+    Convert job dictionaries to Job records
+
+    Args:
+        jobs (iterable): Job dictionaries
+
+    Returns:
+        list: Job records
+    """
+    return [Job.from_dict(job) for job in jobs]
+
+
+def as_dicts(jobs):
+    """
+    Job dictionaries for a mix of Job records and dictionaries
+
+    Args:
+        jobs (iterable): Job records or dictionaries
+
+    Returns:
+        list: Job dictionaries
+    """
+    return [job.to_dict() if isinstance(job, Job) else job for job in jobs]
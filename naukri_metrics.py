@@ -0,0 +1,181 @@
+from contextlib import contextmanager
+import json
+import os
+import threading
+import time
+
+
+def _escape_label(value):
+    """Escape a Prometheus label value"""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _write_atomically(path, text):
+    """Write a file so readers never see it half-written"""
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(temp_path, path)
+
+
+class ScrapeMetrics:
+    """
+    Timed spans and selector hit rates for one scraper
+
+    Spans are named phases (login, search_form, page_load, card_extraction,
+    file_write, ...) aggregated into count, total and max seconds. Every
+    attempt to match a field's fallback selector is recorded as a hit or a
+    miss together with the time it took, so slow or dead selectors stand out.
+    Safe to share between threads.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.spans = {}
+        self.selectors = {}
+        self.started = time.time()
+
+    @contextmanager
+    def span(self, name):
+        """
+        Time a block of code under a span name
+
+        Args:
+            name (str): Span name
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_span(name, time.perf_counter() - start)
+
+    def record_span(self, name, seconds):
+        """
+        Record one timed occurrence of a span
+
+        Args:
+            name (str): Span name
+            seconds (float): Duration
+        """
+        with self.lock:
+            stats = self.spans.setdefault(name, {'count': 0, 'total': 0.0, 'max': 0.0})
+            stats['count'] += 1
+            stats['total'] += seconds
+            stats['max'] = max(stats['max'], seconds)
+
+    def record_selector(self, field, selector, hit, seconds):
+        """
+        Record one attempt to match a fallback selector
+
+        Args:
+            field (str): Job field the selector belongs to
+            selector (str): XPath that was tried
+            hit (bool): Whether it produced an accepted value
+            seconds (float): Time the attempt took
+        """
+        with self.lock:
+            stats = self.selectors.setdefault((field, selector), {
+                'hits': 0, 'misses': 0, 'hit_seconds': 0.0, 'miss_seconds': 0.0
+            })
+            if hit:
+                stats['hits'] += 1
+                stats['hit_seconds'] += seconds
+            else:
+                stats['misses'] += 1
+                stats['miss_seconds'] += seconds
+
+    def report(self):
+        """
+        Snapshot of every span and selector
+
+        Returns:
+            dict: spans (name -> count, total, max, average) and selectors
+                (field -> list of per-selector hits, misses, hit_rate and seconds)
+        """
+        with self.lock:
+            spans = {
+                name: dict(stats, average=stats['total'] / stats['count'])
+                for name, stats in self.spans.items()
+            }
+            selectors = {}
+            for (field, selector), stats in self.selectors.items():
+                attempts = stats['hits'] + stats['misses']
+                selectors.setdefault(field, []).append(
+                    dict(stats, selector=selector, hit_rate=stats['hits'] / attempts if attempts else 0.0)
+                )
+        return {
+            'started': self.started,
+            'generated': time.time(),
+            'spans': spans,
+            'selectors': selectors
+        }
+
+    def write_json(self, path):
+        """
+        Write the report as JSON
+
+        Args:
+            path (str): Output file
+        """
+        _write_atomically(path, json.dumps(self.report(), indent=2))
+
+    def prometheus_text(self):
+        """
+        Render the metrics in the Prometheus text exposition format
+
+        Returns:
+            str: Metrics text
+        """
+        report = self.report()
+        lines = [
+            "# HELP naukri_span_seconds_total Time spent in each scraper phase",
+            "# TYPE naukri_span_seconds_total counter"
+        ]
+        for name, stats in sorted(report['spans'].items()):
+            lines.append(f'naukri_span_seconds_total{{span="{_escape_label(name)}"}} {stats["total"]:.6f}')
+        lines += ["# HELP naukri_span_count_total Number of times each phase ran",
+                  "# TYPE naukri_span_count_total counter"]
+        for name, stats in sorted(report['spans'].items()):
+            lines.append(f'naukri_span_count_total{{span="{_escape_label(name)}"}} {stats["count"]}')
+        lines += ["# HELP naukri_span_max_seconds Longest single run of each phase",
+                  "# TYPE naukri_span_max_seconds gauge"]
+        for name, stats in sorted(report['spans'].items()):
+            lines.append(f'naukri_span_max_seconds{{span="{_escape_label(name)}"}} {stats["max"]:.6f}')
+
+        selector_metrics = [
+            ('naukri_selector_hits_total', 'hits', "Selector attempts that matched", "{}"),
+            ('naukri_selector_misses_total', 'misses', "Selector attempts that did not match", "{}"),
+            ('naukri_selector_miss_seconds_total', 'miss_seconds', "Time spent on selector misses", "{:.6f}")
+        ]
+        for metric, key, help_text, value_format in selector_metrics:
+            lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} counter"]
+            for field, selectors in sorted(report['selectors'].items()):
+                for stats in selectors:
+                    labels = f'field="{_escape_label(field)}",selector="{_escape_label(stats["selector"])}"'
+                    lines.append(f"{metric}{{{labels}}} {value_format.format(stats[key])}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path):
+        """
+        Write the metrics as a Prometheus text file (e.g. for node_exporter's textfile collector)
+
+        Args:
+            path (str): Output file, conventionally ending in .prom
+        """
+        _write_atomically(path, self.prometheus_text())
+
+    def print_report(self):
+        """
+        Print time per phase and any selectors that never or rarely match
+        """
+        report = self.report()
+        if report['spans']:
+            print("📈 Time per phase:")
+            for name, stats in sorted(report['spans'].items(), key=lambda item: -item[1]['total']):
+                print(f"  {name}: {stats['total']:.2f}s over {stats['count']} runs "
+                      f"(avg {stats['average'] * 1000:.1f}ms, max {stats['max'] * 1000:.1f}ms)")
+        for field, selectors in sorted(report['selectors'].items()):
+            for stats in selectors:
+                if stats['misses'] and stats['hit_rate'] < 0.5:
+                    print(f"  ⚠️ {field} selector {stats['selector']} matched {stats['hits']}/"
+                          f"{stats['hits'] + stats['misses']} times, misses cost {stats['miss_seconds']:.2f}s")
@@ -0,0 +1,310 @@
+from naukri_job import Job
+import re
+import time
+
+
+# "2-5 Yrs", "10 to 15 Years", "5 Yrs", "5+ Yrs"
+_EXPERIENCE_RANGE = re.compile(r'(\d+)\s*(?:-|to)\s*(\d+)', re.IGNORECASE)
+_EXPERIENCE_SINGLE = re.compile(r'(\d+)\s*(\+)?', re.IGNORECASE)
+_FRESHER = re.compile(r'\bfresher', re.IGNORECASE)
+
+# "Just Now", "Today", "Few Hours Ago", "3 Days Ago", "30+ Days Ago", "1 Week Ago"
+_POSTED_NOW = re.compile(r'\b(?:just now|today|few hours?|few minutes?)\b', re.IGNORECASE)
+_POSTED_AGO = re.compile(r'(\d+)\s*\+?\s*(minute|min|hour|hr|day|week|month)s?\b', re.IGNORECASE)
+_POSTED_YESTERDAY = re.compile(r'\byesterday\b', re.IGNORECASE)
+
+# "4.1", "3.8 (1.2k Reviews)"
+_RATING = re.compile(r'\d+(?:\.\d+)?')
+
+# "Hybrid - Bengaluru", "Mumbai (All Areas)", "Bangalore/Bengaluru, Pune"
+_CITY_SEPARATORS = re.compile(r'\s*[,/;|]\s*')
+_CITY_PREFIX = re.compile(r'^(?:hybrid|remote|wfh|work from home)\s*-\s*', re.IGNORECASE)
+_CITY_QUALIFIER = re.compile(r'\s*\([^)]*\)?')
+_DELHI_NCR = re.compile(r'\bdelhi\s*/\s*ncr\b', re.IGNORECASE)
+
+# "3-5 Lacs PA", "12.5 Lakhs", "1-1.5 Cr", "INR 300000-500000 YEAR", "₹25,000 - 40,000 per month"
+_SALARY_AMOUNT = re.compile(r'\d+(?:\.\d+)?')
+_SALARY_LAKH = re.compile(r'\b(?:lacs?|lakhs?|lpa|l)\b', re.IGNORECASE)
+_SALARY_CRORE = re.compile(r'\b(?:crores?|cr)\b', re.IGNORECASE)
+_SALARY_THOUSAND = re.compile(r'\d\s*k\b', re.IGNORECASE)
+_SALARY_MONTHLY = re.compile(r'\b(?:month|monthly|pm|p\.m\.?)\b', re.IGNORECASE)
+_SALARY_HOURLY = re.compile(r'\bhour(?:ly)?\b', re.IGNORECASE)
+
+_UNIT_SECONDS = {
+    'minute': 60,
+    'min': 60,
+    'hour': 3600,
+    'hr': 3600,
+    'day': 86400,
+    'week': 7 * 86400,
+    'month': 30 * 86400
+}
+
+# Spellings that should count as the same city, keyed by lowercase name
+CITY_ALIASES = {
+    'bangalore': 'Bengaluru',
+    'bengaluru': 'Bengaluru',
+    'bombay': 'Mumbai',
+    'gurgaon': 'Gurugram',
+    'gurugram': 'Gurugram',
+    'new delhi': 'Delhi',
+    'delhi': 'Delhi',
+    'delhi ncr': 'Delhi NCR',
+    'ncr': 'Delhi NCR',
+    'madras': 'Chennai',
+    'calcutta': 'Kolkata',
+    'poona': 'Pune',
+    'trivandrum': 'Thiruvananthapuram',
+    'cochin': 'Kochi',
+    'mysore': 'Mysuru',
+    'vizag': 'Visakhapatnam',
+    'baroda': 'Vadodara',
+    'secunderabad': 'Hyderabad',
+    'work from home': 'Remote',
+    'wfh': 'Remote',
+    'remote': 'Remote'
+}
+
+
+def parse_experience(text):
+    """
+    Parse an experience range such as "2-5 Yrs"
+
+    Args:
+        text (str): Experience text from a job card
+
+    Returns:
+        tuple: (min_years, max_years) as ints, max_years None for open-ended
+            ranges such as "5+ Yrs"; (None, None) if there is no number
+    """
+    if not text:
+        return None, None
+    match = _EXPERIENCE_RANGE.search(text)
+    if match:
+        low, high = int(match.group(1)), int(match.group(2))
+        return min(low, high), max(low, high)
+    match = _EXPERIENCE_SINGLE.search(text)
+    if match:
+        years = int(match.group(1))
+        return years, None if match.group(2) else years
+    if _FRESHER.search(text):
+        return 0, 0
+    return None, None
+
+
+def parse_posted_age(text):
+    """
+    How long ago a job was posted, from text such as "3 Days Ago"
+
+    "30+ Days Ago" is taken as exactly 30 days, the most recent it can be.
+
+    Args:
+        text (str): Posted date text from a job card
+
+    Returns:
+        int: Age in seconds, or None if the text is not understood
+    """
+    if not text:
+        return None
+    if _POSTED_NOW.search(text):
+        return 0
+    match = _POSTED_AGO.search(text)
+    if match:
+        return int(match.group(1)) * _UNIT_SECONDS[match.group(2).lower()]
+    if _POSTED_YESTERDAY.search(text):
+        return _UNIT_SECONDS['day']
+    return None
+
+
+def parse_posted_date(text, scraped_at=None):
+    """
+    Turn a relative posting date such as "3 Days Ago" into a timestamp
+
+    Args:
+        text (str): Posted date text from a job card
+        scraped_at (float, optional): Unix time the card was scraped, now by default
+
+    Returns:
+        float: Unix time the job was posted, or None if the text is not understood
+    """
+    age = parse_posted_age(text)
+    if age is None:
+        return None
+    return (time.time() if scraped_at is None else scraped_at) - age
+
+
+def parse_rating(text):
+    """
+    Parse a company rating such as "4.1"
+
+    Args:
+        text (str): Rating text from a job card
+
+    Returns:
+        float: Rating, or None if there is none
+    """
+    if not text:
+        return None
+    match = _RATING.search(text)
+    return float(match.group()) if match else None
+
+
+def parse_cities(text):
+    """
+    Split a location into canonical city names
+
+    Args:
+        text (str): Location text such as "Bangalore/Bengaluru, Hybrid - Pune"
+
+    Returns:
+        list: City names without repeats, in the order they appear
+    """
+    if not text or text == 'N/A':
+        return []
+    cities = []
+    text = _DELHI_NCR.sub('Delhi NCR', _CITY_QUALIFIER.sub('', text))
+    for part in _CITY_SEPARATORS.split(text):
+        name = _CITY_PREFIX.sub('', part).strip(' -.')
+        if not name:
+            continue
+        city = CITY_ALIASES.get(name.lower()) or (name.title() if name.islower() or name.isupper() else name)
+        if city not in cities:
+            cities.append(city)
+    return cities
+
+
+def parse_salary(text):
+    """
+    Parse a salary range into yearly amounts in rupees
+
+    Understands lakh and crore amounts ("3-5 Lacs PA", "1-1.5 Cr"), plain
+    amounts ("INR 300000-500000 YEAR") and monthly or hourly pay.
+
+    Args:
+        text (str): Salary text from a job card or detail page
+
+    Returns:
+        tuple: (min_salary, max_salary) as ints, (None, None) if not disclosed
+    """
+    if not text:
+        return None, None
+    amounts = [float(amount) for amount in _SALARY_AMOUNT.findall(text.replace(',', ''))]
+    if not amounts:
+        return None, None
+
+    if _SALARY_CRORE.search(text):
+        multiplier = 10_000_000
+    elif _SALARY_LAKH.search(text):
+        multiplier = 100_000
+    elif _SALARY_THOUSAND.search(text):
+        multiplier = 1_000
+    else:
+        multiplier = 1
+    if _SALARY_MONTHLY.search(text):
+        multiplier *= 12
+    elif _SALARY_HOURLY.search(text):
+        # Roughly 40 hours a week, 52 weeks a year
+        multiplier *= 2080
+
+    low, high = amounts[0], amounts[1] if len(amounts) > 1 else amounts[0]
+    return int(min(low, high) * multiplier), int(max(low, high) * multiplier)
+
+
+class Normalizer:
+    """
+    Converts the raw card strings of many jobs into typed, sortable fields
+
+    Experience, posted date, rating, location and salary texts repeat across
+    thousands of jobs, so each distinct text is parsed once per run and the
+    result is reused. Posting dates are memoized as ages, so jobs scraped at
+    different times during a run still get their own absolute timestamps.
+    """
+
+    def __init__(self):
+        self.experience = {}
+        self.posted_age = {}
+        self.rating = {}
+        self.cities = {}
+        self.salary = {}
+        self.parsed = 0
+        self.reused = 0
+
+    def _lookup(self, memo, parse, text):
+        if text in memo:
+            self.reused += 1
+            return memo[text]
+        self.parsed += 1
+        value = memo[text] = parse(text)
+        return value
+
+    def normalize(self, job, scraped_at=None):
+        """
+        Typed fields for one job
+
+        Args:
+            job (dict or Job): Job with raw card fields
+            scraped_at (float, optional): Unix time the job was scraped, now by default
+
+        Returns:
+            dict: experience_min, experience_max, posted_at, rating_value, cities,
+                salary_min and salary_max, None where the text is missing or not understood
+        """
+        experience_min, experience_max = self._lookup(self.experience, parse_experience, job.get('experience'))
+        age = self._lookup(self.posted_age, parse_posted_age, job.get('posted_date'))
+        salary_min, salary_max = self._lookup(self.salary, parse_salary, job.get('salary'))
+        if age is not None and scraped_at is None:
+            scraped_at = time.time()
+        return {
+            'experience_min': experience_min,
+            'experience_max': experience_max,
+            'posted_at': None if age is None else scraped_at - age,
+            'rating_value': self._lookup(self.rating, parse_rating, job.get('rating')),
+            'cities': list(self._lookup(self.cities, parse_cities, job.get('location'))),
+            'salary_min': salary_min,
+            'salary_max': salary_max
+        }
+
+    def normalize_jobs(self, jobs, scraped_at=None):
+        """
+        Store typed fields on every job, in place
+
+        Args:
+            jobs (list): Job dictionaries or Job records
+            scraped_at (float, optional): Unix time the jobs were scraped, now by default
+
+        Returns:
+            list: The same jobs
+        """
+        if scraped_at is None:
+            scraped_at = time.time()
+        for job in jobs:
+            fields = self.normalize(job, scraped_at)
+            if isinstance(job, Job):
+                for field, value in fields.items():
+                    setattr(job, field, tuple(value) if field == 'cities' else value)
+            else:
+                job.update(fields)
+        return jobs
+
+    def stats(self):
+        """
+        Memoization counts for the run so far
+
+        Returns:
+            dict: 'parsed' (distinct texts parsed) and 'reused' (lookups served from memory)
+        """
+        return {'parsed': self.parsed, 'reused': self.reused}
+
+
+def normalize_jobs(jobs, scraped_at=None):
+    """
+    Store typed fields on a batch of jobs with a one-off Normalizer
+
+    Args:
+        jobs (list): Job dictionaries or Job records
+        scraped_at (float, optional): Unix time the jobs were scraped, now by default
+
+    Returns:
+        list: The same jobs
+    """
+    return Normalizer().normalize_jobs(jobs, scraped_at)
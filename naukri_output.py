@@ -0,0 +1,123 @@
+from datetime import datetime
+from naukri_job import Job
+import json
+import os
+
+
+def output_timestamp():
+    """Timestamp used in output filenames"""
+    return datetime.now().strftime("%Y%m%d_%H%M%S")
+
+
+class JsonlJobWriter:
+    """
+    Appends jobs to a JSON Lines file as pages are extracted
+
+    Each page is flushed and fsynced before the next one is scraped, so a
+    crash loses at most the page in progress and nothing is held in memory.
+    """
+
+    def __init__(self, path=None):
+        """
+        Args:
+            path (str, optional): Output file, defaults to naukri_jobs_<timestamp>.jsonl
+        """
+        self.path = path or f"naukri_jobs_{output_timestamp()}.jsonl"
+        self.file = open(self.path, 'a', encoding='utf-8')
+        self.count = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write_page(self, jobs):
+        """
+        Append one page of jobs and make sure they reach the disk
+
+        Args:
+            jobs (list): Job dictionaries or Job records
+        """
+        for job in jobs:
+            if isinstance(job, Job):
+                job = job.to_dict()
+            self.file.write(json.dumps(job, ensure_ascii=False) + "\n")
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.count += len(jobs)
+
+    def close(self):
+        if not self.file.closed:
+            self.file.close()
+
+
+def iter_jsonl(path):
+    """
+    Read jobs back from a JSON Lines file one at a time
+
+    A truncated last line, left behind by a crash mid-write, is skipped.
+
+    Args:
+        path (str): JSON Lines file
+
+    Yields:
+        dict: Job dictionaries
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                print(f"⚠️ Skipping incomplete line in {path}")
+
+
+def write_summary(jobs, summary_filename):
+    """
+    Write the human-readable text summary of a job list
+
+    Args:
+        jobs (iterable): Job dictionaries, consumed one at a time
+        summary_filename (str): Output filename
+
+    Returns:
+        int: Number of jobs written
+    """
+    count = 0
+    with open(summary_filename, 'w', encoding='utf-8') as f:
+        f.write("NAUKRI JOB SEARCH RESULTS\n")
+        f.write("=" * 50 + "\n\n")
+
+        for i, job in enumerate(jobs, 1):
+            f.write(f"Job {i}:\n")
+            f.write(f"  Title: {job.get('title', 'N/A')}\n")
+            f.write(f"  Company: {job.get('company', 'N/A')}\n")
+            f.write(f"  Experience: {job.get('experience', 'N/A')}\n")
+            f.write(f"  Location: {job.get('location', 'N/A')}\n")
+            f.write(f"  Rating: {job.get('rating', 'N/A')}\n")
+            f.write(f"  Posted: {job.get('posted_date', 'N/A')}\n")
+            f.write(f"  Skills: {', '.join(job.get('skills', []))}\n")
+            f.write(f"  Link: {job.get('link', 'N/A')}\n")
+            f.write(f"  Job ID: {job.get('job_id', 'N/A')}\n")
+            f.write("-" * 30 + "\n\n")
+            count = i
+    return count
+
+
+def write_summary_from_jsonl(jsonl_path, summary_filename=None):
+    """
+    Build the text summary by streaming a JSON Lines file
+
+    Args:
+        jsonl_path (str): JSON Lines file written by JsonlJobWriter
+        summary_filename (str, optional): Output filename, derived from jsonl_path by default
+
+    Returns:
+        str: Summary filename
+    """
+    summary_filename = summary_filename or os.path.splitext(jsonl_path)[0] + "_summary.txt"
+    write_summary(iter_jsonl(jsonl_path), summary_filename)
+    return summary_filename
@@ -0,0 +1,172 @@
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+import re
+
+
+NAUKRI_BASE_URL = "https://www.naukri.com"
+
+# Results pages are addressed by a numeric suffix on the last path segment:
+#   /python-developer-jobs-in-bangalore      -> page 1
+#   /python-developer-jobs-in-bangalore-7    -> page 7
+_PAGE_SUFFIX = re.compile(r'^(?P<slug>(?:.+?-)?jobs(?:-in-[a-z-]+?)?)-(?P<page>\d+)$')
+_SLUG_CHARS = re.compile(r'[^a-z0-9]+')
+
+# Some result URLs carry the page in the query string instead
+PAGE_QUERY_PARAM = "pageNo"
+
+RESULTS_PER_PAGE = 20
+
+
+def slugify(text):
+    """
+    Turn free text into the hyphenated form Naukri uses in result URLs
+
+    Args:
+        text (str): Job title or location
+
+    Returns:
+        str: Slug such as "python-developer"
+    """
+    return _SLUG_CHARS.sub('-', text.lower()).strip('-')
+
+
+def build_search_url(job_title="", location="", experience=None, base_url=NAUKRI_BASE_URL):
+    """
+    Build the canonical URL of the first results page for a search
+
+    Args:
+        job_title (str): Job title or keywords
+        location (str): City to search in
+        experience (str, optional): Years of experience
+        base_url (str): Site root
+
+    Returns:
+        str: Results page URL
+    """
+    keyword_slug = slugify(job_title) or "all"
+    location_slug = slugify(location)
+    path = f"/{keyword_slug}-jobs-in-{location_slug}" if location_slug else f"/{keyword_slug}-jobs"
+
+    query = []
+    if job_title:
+        query.append(('k', job_title.lower()))
+    if location:
+        query.append(('l', location.lower()))
+    if experience is not None and str(experience).isdigit():
+        query.append(('experience', str(experience)))
+
+    return f"{base_url.rstrip('/')}{path}" + (f"?{urlencode(query)}" if query else "")
+
+
+def _split_path(path):
+    """
+    Split a results URL path into its directory, slug and page number
+
+    Returns:
+        tuple: (prefix, slug, page)
+    """
+    prefix, _, segment = path.rstrip('/').rpartition('/')
+    match = _PAGE_SUFFIX.match(segment)
+    if match:
+        return prefix, match.group('slug'), int(match.group('page'))
+    return prefix, segment, 1
+
+
+def page_number_from_url(url):
+    """
+    Work out which results page a URL points at
+
+    Args:
+        url (str): Results page URL
+
+    Returns:
+        int: Page number, 1 for the first page
+    """
+    parts = urlsplit(url)
+    query = dict(parse_qsl(parts.query))
+    if query.get(PAGE_QUERY_PARAM, '').isdigit():
+        return int(query[PAGE_QUERY_PARAM])
+    return _split_path(parts.path)[2]
+
+
+def page_url(url, page_number):
+    """
+    Canonical URL of a given results page
+
+    Args:
+        url (str): URL of any page of the same search
+        page_number (int): Page to address, starting at 1
+
+    Returns:
+        str: URL of that page
+    """
+    if page_number < 1:
+        raise ValueError(f"Page numbers start at 1, got {page_number}")
+
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+
+    if any(key == PAGE_QUERY_PARAM for key, _ in query):
+        query = [(key, str(page_number) if key == PAGE_QUERY_PARAM else value) for key, value in query]
+        path = parts.path
+    else:
+        prefix, slug, _ = _split_path(parts.path)
+        segment = slug if page_number == 1 else f"{slug}-{page_number}"
+        path = f"{prefix}/{segment}"
+
+    return urlunsplit((parts.scheme, parts.netloc, path, urlencode(query), ''))
+
+
+def base_results_url(url):
+    """
+    URL of the first page of the search a results URL belongs to
+
+    Args:
+        url (str): URL of any page of the search
+
+    Returns:
+        str: URL of page 1
+    """
+    return page_url(url, 1)
+
+
+def page_range(start_page=1, max_pages=None):
+    """
+    Page numbers to visit, open-ended when max_pages is None
+
+    Args:
+        start_page (int): First page to visit
+        max_pages (int, optional): Number of pages to visit
+
+    Yields:
+        int: Page numbers in order
+    """
+    page_number = start_page
+    while max_pages is None or page_number < start_page + max_pages:
+        yield page_number
+        page_number += 1
+
+
+def normalize_query(query):
+    """
+    Turn a query spec into a dict with every search field filled in
+
+    Args:
+        query (dict or tuple): {'job_title', 'location', 'experience', 'max_jobs',
+            'max_pages', 'name'} or a (job_title, location, experience) tuple
+
+    Returns:
+        dict: Normalized query with a readable 'name'
+    """
+    if not isinstance(query, dict):
+        query = dict(zip(('job_title', 'location', 'experience'), query))
+    normalized = {
+        'job_title': query.get('job_title', ''),
+        'location': query.get('location', ''),
+        'experience': query.get('experience'),
+        'max_jobs': query.get('max_jobs', 100),
+        'max_pages': query.get('max_pages')
+    }
+    default_name = " / ".join(str(normalized[key]) for key in ('job_title', 'location', 'experience')
+                              if normalized[key] not in (None, ''))
+    normalized['name'] = query.get('name') or default_name
+    return normalized
@@ -0,0 +1,257 @@
+from lxml import etree, html as lxml_html
+from urllib.parse import urljoin
+import json
+import sys
+import time
+
+
+# XPath fallback lists for each job card field, tried in order.
+# These are shared by every extraction engine so they stay in sync.
+JOB_CARD_CLASS = "srp-jobtuple-wrapper"
+
+SELECTORS = {
+    'title': [
+        ".//h2/a[@class='title']",
+        ".//h2/a[contains(@class, 'title')]",
+        ".//a[contains(@class, 'title')]",
+        ".//h2//a",
+        ".//a[contains(@href, 'job-listings')]"
+    ],
+    'company': [
+        ".//a[@class='comp-name mw-25']",
+        ".//a[contains(@class, 'comp-name')]",
+        ".//span[contains(@class, 'comp-name')]",
+        ".//a[contains(@href, 'company')]"
+    ],
+    'rating': [
+        ".//span[@class='main-2']"
+    ],
+    'experience': [
+        ".//span[@class='expwdth']",
+        ".//span[contains(@class, 'exp')]",
+        ".//span[contains(@title, 'Yrs')]",
+        ".//span[contains(text(), 'Yrs')]"
+    ],
+    'location': [
+        ".//span[@class='locWdth']",
+        ".//span[contains(@class, 'loc')]",
+        ".//span[contains(@title, ',')]"
+    ],
+    'description': [
+        ".//span[@class='job-desc ni-job-tuple-icon ni-job-tuple-icon-srp-description']",
+        ".//span[contains(@class, 'job-desc')]",
+        ".//div[contains(@class, 'description')]",
+        ".//span[contains(@class, 'description')]"
+    ],
+    'skills': [
+        ".//li[@class='dot-gt tag-li ']"
+    ],
+    'posted_date': [
+        ".//span[@class='job-post-day ']",
+        ".//span[contains(@class, 'job-post-day')]",
+        ".//span[contains(text(), 'days ago')]",
+        ".//span[contains(text(), 'day ago')]"
+    ]
+}
+
+CARDS_XPATH = f"//*[contains(concat(' ', normalize-space(@class), ' '), ' {JOB_CARD_CLASS} ')]"
+
+# Compile every XPath once at import time; evaluation is then pure C inside lxml
+_COMPILED_CARDS = etree.XPath(CARDS_XPATH)
+_COMPILED = {
+    field: [(selector, etree.XPath(selector)) for selector in selectors]
+    for field, selectors in SELECTORS.items()
+}
+_COMPILED_BY_SELECTOR = {selector: compiled for pairs in _COMPILED.values() for selector, compiled in pairs}
+
+
+def clean_text(value):
+    """
+    Collapse runs of whitespace the way a rendered page would show them
+
+    Args:
+        value (str): Raw text
+
+    Returns:
+        str: Text with whitespace normalized and stripped
+    """
+    if not value:
+        return ""
+    return " ".join(value.split())
+
+
+def is_experience_text(text):
+    """Check that a candidate experience string looks like an experience range"""
+    return bool(text) and ('yr' in text.lower() or 'exp' in text.lower())
+
+
+def is_location_text(text):
+    """Check that a candidate location string is long enough to be a place name"""
+    return bool(text) and len(text) > 2
+
+
+def _element_text(element):
+    return clean_text(element.text_content())
+
+
+def _candidates(field, resolver):
+    """(selector, compiled XPath) pairs for a field, in the resolver's learned order if given"""
+    if resolver is None:
+        return _COMPILED[field]
+    return [(selector, _COMPILED_BY_SELECTOR.get(selector) or etree.XPath(selector))
+            for selector in resolver.candidates(field)]
+
+
+def _first_match(card, field, accept=None, use_title=False, metrics=None, resolver=None):
+    """
+    Walk a field's fallback list and return the first accepted element and value
+
+    Args:
+        card: lxml element for the job card
+        field (str): Key into SELECTORS
+        accept (callable, optional): Extra check on the extracted text
+        use_title (bool): Prefer the element's title attribute over its text
+        metrics (ScrapeMetrics, optional): Records each selector's hits and misses
+        resolver (SelectorResolver, optional): Supplies the order to try selectors
+            in and learns which one matched
+
+    Returns:
+        tuple: (element, text) or (None, None) if nothing matched
+    """
+    for selector, compiled in _candidates(field, resolver):
+        start = time.perf_counter() if metrics else None
+        matches = compiled(card)
+        element, text = None, None
+        if matches:
+            element = matches[0]
+            if use_title:
+                text = clean_text(element.get('title')) or _element_text(element)
+            else:
+                text = _element_text(element)
+        hit = bool(matches) and (bool(text) if accept is None else accept(text))
+        if metrics:
+            metrics.record_selector(field, selector, hit, time.perf_counter() - start)
+        if hit:
+            if resolver is not None:
+                resolver.record(field, selector)
+            return element, text
+    return None, None
+
+
+def parse_job_card(card, base_url=None, metrics=None, resolver=None):
+    """
+    Extract details from a single parsed job card
+
+    Mirrors NaukriLogin.extract_job_details but works on an lxml element,
+    so no WebDriver round trips are made.
+
+    Args:
+        card: lxml element for one srp-jobtuple-wrapper card
+        base_url (str, optional): URL used to resolve relative job links
+        metrics (ScrapeMetrics, optional): Records selector hits and misses
+        resolver (SelectorResolver, optional): Adaptive selector order
+
+    Returns:
+        dict: Job details dictionary
+    """
+    job_data = {}
+
+    title_element, title = _first_match(card, 'title', metrics=metrics, resolver=resolver)
+    if title_element is not None:
+        link = title_element.get('href')
+        job_data['title'] = title
+        job_data['link'] = urljoin(base_url, link) if base_url and link else link
+    else:
+        job_data['title'] = "N/A"
+        job_data['link'] = "N/A"
+
+    _, company = _first_match(card, 'company', metrics=metrics, resolver=resolver)
+    job_data['company'] = company or "N/A"
+
+    rating_matches = _COMPILED['rating'][0][1](card)
+    job_data['rating'] = _element_text(rating_matches[0]) if rating_matches else "N/A"
+
+    _, experience = _first_match(card, 'experience', accept=is_experience_text, use_title=True, metrics=metrics, resolver=resolver)
+    job_data['experience'] = experience or "N/A"
+
+    _, location = _first_match(card, 'location', accept=is_location_text, use_title=True, metrics=metrics, resolver=resolver)
+    job_data['location'] = location or "N/A"
+
+    _, description = _first_match(card, 'description', metrics=metrics, resolver=resolver)
+    job_data['description'] = description or "N/A"
+
+    skill_elements = _COMPILED['skills'][0][1](card)
+    job_data['skills'] = [text for text in (_element_text(skill) for skill in skill_elements) if text]
+
+    _, posted_date = _first_match(card, 'posted_date', metrics=metrics, resolver=resolver)
+    job_data['posted_date'] = posted_date or "N/A"
+
+    job_data['job_id'] = card.get('data-job-id')
+
+    return job_data
+
+
+def parse_job_cards(page_html, max_results=None, base_url=None, metrics=None, resolver=None):
+    """
+    Parse every job card out of a results page snapshot
+
+    Args:
+        page_html (str): Full HTML of a search results page
+        max_results (int, optional): Maximum number of jobs to return
+        base_url (str, optional): URL used to resolve relative job links
+        metrics (ScrapeMetrics, optional): Records a card_extraction span per card
+            and selector hits and misses
+        resolver (SelectorResolver, optional): Adaptive selector order
+
+    Returns:
+        list: List of job dictionaries in page order
+    """
+    if not page_html or not page_html.strip():
+        return []
+
+    document = lxml_html.fromstring(page_html)
+    cards = _COMPILED_CARDS(document)
+    if max_results is not None:
+        cards = cards[:max_results]
+
+    if metrics is None:
+        return [parse_job_card(card, base_url, resolver=resolver) for card in cards]
+
+    jobs = []
+    for card in cards:
+        with metrics.span('card_extraction'):
+            jobs.append(parse_job_card(card, base_url, metrics, resolver))
+    return jobs
+
+
+def parse_job_file(path, max_results=None):
+    """
+    Parse job cards from a saved results page on disk
+
+    Args:
+        path (str): Path to a saved HTML file
+        max_results (int, optional): Maximum number of jobs to return
+
+    Returns:
+        list: List of job dictionaries
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return parse_job_cards(f.read(), max_results)
+
+
+def main():
+    """
+    Parse saved results pages given on the command line and print the jobs as JSON
+    """
+    if len(sys.argv) < 2:
+        print("Usage: python naukri_parser.py saved_page.html [more_pages.html ...]")
+        return
+
+    jobs = []
+    for path in sys.argv[1:]:
+        jobs.extend(parse_job_file(path))
+    print(json.dumps(jobs, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
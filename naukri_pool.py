@@ -0,0 +1,357 @@
+from naukri import NaukriLogin
+from naukri_pagination import build_search_url, normalize_query
+import psutil
+import queue
+import threading
+import time
+
+
+class _Batch:
+    """
+    Bookkeeping for one group of tasks submitted to the pool
+
+    Results are kept per task key (page number or query index) so they can be
+    merged in a stable order no matter which worker finished first.
+    """
+
+    def __init__(self):
+        self.results = {}
+        self.failed = []
+        self.pending = 0
+        self.done = threading.Event()
+        # Optional queue of (key, jobs, failed, seconds) for callers streaming results
+        self.completed = None
+
+    def merged_jobs(self, max_jobs=None):
+        """
+        Merge task results in key order, dropping duplicate job ids
+
+        Args:
+            max_jobs (int, optional): Maximum number of jobs to return
+
+        Returns:
+            list: Deduplicated job dictionaries
+        """
+        jobs = []
+        seen_job_ids = set()
+        for key in sorted(self.results):
+            for job in self.results[key]:
+                job_id = job.get('job_id')
+                if job_id:
+                    if job_id in seen_job_ids:
+                        continue
+                    seen_job_ids.add(job_id)
+                jobs.append(job)
+        return jobs[:max_jobs] if max_jobs is not None else jobs
+
+
+class _SearchBatch(_Batch):
+    """
+    Pages of a single search, scheduled a few at a time until the results run out
+    """
+
+    def __init__(self, results_url, max_jobs, max_pages):
+        super().__init__()
+        self.results_url = results_url
+        self.max_jobs = max_jobs
+        self.max_pages = max_pages
+        self.next_page = 1
+        self.last_page = None
+        self.job_count = 0
+
+    def wants_more_pages(self):
+        if self.job_count >= self.max_jobs:
+            return False
+        if self.last_page is not None and self.next_page >= self.last_page:
+            return False
+        return self.max_pages is None or self.next_page <= self.max_pages
+
+
+class NaukriWorkerPool:
+    """
+    Runs several logged-in browsers in parallel, fed from one shared task queue
+    """
+
+    def __init__(self, email, password, workers=4, headless=True, extraction_engine="html",
+                 max_worker_memory_mb=None, **scraper_options):
+        """
+        Args:
+            email (str): Naukri email/username used by every worker
+            password (str): Naukri password used by every worker
+            workers (int): Number of Chrome instances to run
+            headless (bool): Run the browsers in headless mode
+            extraction_engine (str): Extraction engine used by every worker
+            max_worker_memory_mb (int, optional): Restart a worker's browser once its
+                process tree uses more than this much resident memory
+            **scraper_options: Extra keyword arguments for each NaukriLogin
+        """
+        if workers < 1:
+            raise ValueError("A worker pool needs at least one worker")
+
+        self.email = email
+        self.password = password
+        self.workers = workers
+        self.max_worker_memory_mb = max_worker_memory_mb
+        self.scraper_options = dict(scraper_options, headless=headless, extraction_engine=extraction_engine)
+
+        self.tasks = queue.Queue()
+        self.lock = threading.Lock()
+        self.closing = threading.Event()
+        self.threads = []
+        self.worker_stats = {}
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def start(self):
+        """
+        Start the worker threads, each of which launches and logs in its own browser
+        """
+        if self.threads:
+            return
+        self.closing.clear()
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._worker, args=(index,), name=f"naukri-worker-{index}")
+            thread.daemon = True
+            thread.start()
+            self.threads.append(thread)
+        print(f"🚀 Started {self.workers} workers")
+
+    def close(self):
+        """
+        Stop the workers and close their browsers
+        """
+        self.closing.set()
+        for _ in self.threads:
+            self.tasks.put(None)
+        for thread in self.threads:
+            thread.join()
+        self.threads = []
+        print("🔒 Worker pool closed")
+
+    def scrape_search(self, job_title, location="", experience=None, max_jobs=1000, max_pages=None):
+        """
+        Spread the pages of one search across the workers
+
+        Args:
+            job_title (str): Job title to search for
+            location (str): Location to search in
+            experience (str, optional): Years of experience
+            max_jobs (int): Maximum number of jobs to collect
+            max_pages (int, optional): Maximum number of pages to visit
+
+        Returns:
+            list: Deduplicated job dictionaries in page order
+        """
+        self.start()
+        batch = _SearchBatch(build_search_url(job_title, location, experience), max_jobs, max_pages)
+
+        with self.lock:
+            # Keep every worker busy but don't run far past the end of the results
+            for _ in range(self.workers):
+                if not batch.wants_more_pages():
+                    break
+                self._schedule_page(batch)
+            if not batch.pending:
+                batch.done.set()
+
+        batch.done.wait()
+        jobs = batch.merged_jobs(max_jobs)
+        print(f"✅ Collected {len(jobs)} unique jobs from {len(batch.results)} pages")
+        if batch.failed:
+            print(f"⚠️ Failed pages: {sorted(batch.failed)}")
+        return jobs
+
+    def search_many(self, queries):
+        """
+        Run several searches at once and yield each one's results as it finishes
+
+        Args:
+            queries (list): Query specs, see naukri_pagination.normalize_query
+
+        Yields:
+            dict: 'index', 'query' (normalized spec), 'jobs', 'ok' and 'timings'
+        """
+        self.start()
+        queries = [normalize_query(query) for query in queries]
+        batch = _Batch()
+        batch.completed = queue.Queue()
+
+        with self.lock:
+            for index, query in enumerate(queries):
+                batch.pending += 1
+                self.tasks.put(('query', batch, index, query))
+
+        for _ in queries:
+            index, jobs, failed, seconds = batch.completed.get()
+            query = queries[index]
+            print(f"⏱️ Query '{query['name']}': {len(jobs)} jobs in {seconds:.1f}s")
+            yield {'index': index, 'query': query, 'jobs': jobs, 'ok': not failed, 'timings': {'total': seconds}}
+
+    def scrape_queries(self, queries):
+        """
+        Run several searches at once, one query per worker at a time
+
+        Args:
+            queries (list): Query specs, see naukri_pagination.normalize_query
+
+        Returns:
+            list: Deduplicated job dictionaries from every query, in query order
+        """
+        merged = _Batch()
+        for result in self.search_many(queries):
+            if result['ok']:
+                merged.results[result['index']] = result['jobs']
+            else:
+                merged.failed.append(result['index'])
+
+        jobs = merged.merged_jobs()
+        print(f"✅ Collected {len(jobs)} unique jobs from {len(queries)} queries")
+        if merged.failed:
+            print(f"⚠️ Failed queries: {sorted(merged.failed)}")
+        return jobs
+
+    def _schedule_page(self, batch):
+        """Queue the batch's next page; caller holds the lock"""
+        batch.pending += 1
+        self.tasks.put(('page', batch, batch.next_page, None))
+        batch.next_page += 1
+
+    def _task_finished(self, batch, key, jobs, failed=False, seconds=0.0):
+        """
+        Record a task's result and schedule follow-up pages
+
+        Args:
+            batch (_Batch): Batch the task belongs to
+            key: Page number or query index
+            jobs (list): Jobs the task extracted
+            failed (bool): Whether the task raised an error
+            seconds (float): Time the task took
+        """
+        if batch.completed is not None:
+            batch.completed.put((key, jobs, failed, seconds))
+
+        with self.lock:
+            batch.pending -= 1
+            if failed:
+                batch.failed.append(key)
+            else:
+                batch.results[key] = jobs
+
+            if isinstance(batch, _SearchBatch) and not failed:
+                batch.job_count += len(jobs)
+                if not jobs and (batch.last_page is None or key < batch.last_page):
+                    batch.last_page = key
+                if batch.wants_more_pages():
+                    self._schedule_page(batch)
+
+            if batch.pending == 0:
+                batch.done.set()
+
+    def _start_scraper(self, index):
+        """
+        Launch and log in one worker's browser
+
+        Returns:
+            NaukriLogin: Logged-in scraper, or None if the browser could not start or log in
+        """
+        try:
+            scraper = NaukriLogin(self.email, self.password, **self.scraper_options)
+        except Exception as e:
+            print(f"❌ Worker {index} could not start a browser: {e}")
+            return None
+        if scraper.login():
+            return scraper
+        print(f"❌ Worker {index} could not log in")
+        scraper.close()
+        return None
+
+    def _browser_memory_mb(self, scraper):
+        """
+        Resident memory of a worker's chromedriver and Chrome processes
+
+        Returns:
+            float: Memory in MB, or None if it can't be measured
+        """
+        try:
+            process = psutil.Process(scraper.driver.service.process.pid)
+            processes = [process] + process.children(recursive=True)
+            return sum(p.memory_info().rss for p in processes) / (1024 * 1024)
+        except (psutil.Error, AttributeError):
+            return None
+
+    def _run_task(self, scraper, kind, batch, key, payload):
+        """
+        Execute one page or query task on a worker's browser
+
+        Returns:
+            list: Extracted jobs
+        """
+        if kind == 'page':
+            scraper.results_url = batch.results_url
+            return scraper.scrape_page(key, max_results=batch.max_jobs)
+
+        scraper.results_url = build_search_url(payload['job_title'], payload['location'], payload['experience'])
+        return scraper.extract_job_listings_with_pagination(
+            max_jobs=payload['max_jobs'],
+            max_pages=payload['max_pages']
+        )
+
+    def _worker(self, index):
+        """
+        Worker thread: owns one browser and processes tasks until told to stop
+        """
+        stats = {'tasks': 0, 'failed': 0, 'jobs': 0, 'busy': 0.0, 'restarts': 0}
+        self.worker_stats[index] = stats
+        scraper = None
+        # Log in straight away so the browser is warm when the first task arrives
+        restart_needed = True
+
+        try:
+            while True:
+                # Once close() was called the next item may be the stop sentinel, so don't start a browser for it
+                if restart_needed and not self.closing.is_set():
+                    restart_needed = False
+                    scraper = self._start_scraper(index)
+
+                task = self.tasks.get()
+                if task is None:
+                    break
+                if restart_needed:
+                    restart_needed = False
+                    scraper = self._start_scraper(index)
+                kind, batch, key, payload = task
+
+                # A worker that can't log in still drains its share of the queue
+                if scraper is None:
+                    stats['failed'] += 1
+                    self._task_finished(batch, key, [], failed=True)
+                    continue
+
+                start = time.perf_counter()
+                try:
+                    jobs = self._run_task(scraper, kind, batch, key, payload)
+                    stats['jobs'] += len(jobs)
+                    self._task_finished(batch, key, jobs, seconds=time.perf_counter() - start)
+                except Exception as e:
+                    print(f"❌ Worker {index} failed on {kind} {key}: {e}")
+                    stats['failed'] += 1
+                    self._task_finished(batch, key, [], failed=True, seconds=time.perf_counter() - start)
+                stats['tasks'] += 1
+                stats['busy'] += time.perf_counter() - start
+
+                if self.max_worker_memory_mb:
+                    memory_mb = self._browser_memory_mb(scraper)
+                    if memory_mb is not None and memory_mb > self.max_worker_memory_mb:
+                        print(f"♻️ Worker {index} uses {memory_mb:.0f} MB, restarting its browser")
+                        scraper.close()
+                        scraper = None
+                        stats['restarts'] += 1
+                        restart_needed = True
+        finally:
+            if scraper:
+                scraper.close()
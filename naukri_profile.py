@@ -0,0 +1,167 @@
+from selenium.webdriver.chrome.options import Options
+
+
+# URL patterns Chrome refuses to load in the lean profile. The scraper only
+# reads the DOM, so images, fonts, media and third-party trackers are dead weight.
+LEAN_BLOCKED_URL_PATTERNS = [
+    # Images
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico", "*.avif",
+    # Fonts
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    # Media
+    "*.mp4", "*.webm", "*.mp3", "*.m4a", "*.ogg",
+    # Ads and analytics
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*googlesyndication.com*", "*facebook.net*", "*hotjar.com*", "*clarity.ms*",
+    "*newrelic.com*", "*nr-data.net*", "*bat.bing.com*"
+]
+
+LEAN_WINDOW_SIZE = (1024, 768)
+
+PAGE_LOAD_STATS_SCRIPT = """
+var navigation = performance.getEntriesByType('navigation')[0];
+var resources = performance.getEntriesByType('resource');
+var bytes = navigation ? navigation.transferSize || 0 : 0;
+resources.forEach(function (resource) {
+    bytes += resource.transferSize || 0;
+});
+return {
+    url: location.href,
+    bytes: bytes,
+    resources: resources.length,
+    dom_ready_ms: navigation ? navigation.domContentLoadedEventEnd - navigation.startTime : null
+};
+"""
+
+
+def build_chrome_options(headless=False, lean=False):
+    """
+    Chrome options used by NaukriLogin
+
+    Args:
+        headless (bool): Run browser in headless mode
+        lean (bool): Trim everything the scraper doesn't need - eager page loads,
+            no images, extensions or GPU and a small window
+
+    Returns:
+        Options: Chrome options
+    """
+    chrome_options = Options()
+    if headless:
+        chrome_options.add_argument("--headless")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+
+    if lean:
+        # Hand control back as soon as the DOM is ready instead of waiting for every subresource
+        chrome_options.page_load_strategy = 'eager'
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_argument(f"--window-size={LEAN_WINDOW_SIZE[0]},{LEAN_WINDOW_SIZE[1]}")
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.media_stream": 2,
+            "profile.default_content_setting_values.notifications": 2
+        })
+
+    return chrome_options
+
+
+def enable_request_blocking(driver, patterns=LEAN_BLOCKED_URL_PATTERNS):
+    """
+    Make Chrome drop requests matching URL patterns through the DevTools protocol
+
+    Args:
+        driver: Chrome WebDriver
+        patterns (list): URL patterns with * wildcards
+
+    Returns:
+        bool: True if blocking was enabled
+    """
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns)})
+        print(f"🚫 Blocking {len(patterns)} resource patterns")
+        return True
+    except Exception as e:
+        print(f"⚠️ Could not enable request blocking: {e}")
+        return False
+
+
+class PageLoadStats:
+    """
+    Per-run counters for bytes downloaded and page load time
+
+    A page is recorded just before the browser navigates away from it, so the
+    counts include resources that finished loading after the DOM was ready.
+    """
+
+    def __init__(self):
+        self.pages = []
+
+    def snapshot(self, driver):
+        """
+        Transfer size and load time of the page currently open
+
+        Args:
+            driver: WebDriver on the page to measure
+
+        Returns:
+            dict: url, bytes, resources and dom_ready_ms, or None for non-web pages
+        """
+        try:
+            stats = driver.execute_script(PAGE_LOAD_STATS_SCRIPT)
+        except Exception:
+            return None
+        if stats and stats.get('url', '').startswith('http'):
+            return stats
+        return None
+
+    def record(self, driver):
+        """
+        Record the page currently open
+
+        Args:
+            driver: WebDriver on the page to record
+        """
+        stats = self.snapshot(driver)
+        if stats:
+            self.pages.append(stats)
+
+    def report(self, current_page=None):
+        """
+        Totals for the run
+
+        Args:
+            current_page (dict, optional): Snapshot of a page not recorded yet
+
+        Returns:
+            dict: pages, bytes, resources, average and total DOM ready time in ms
+        """
+        pages = self.pages + [current_page] if current_page else self.pages
+        load_times = [page['dom_ready_ms'] for page in pages if page.get('dom_ready_ms') is not None]
+        return {
+            'pages': len(pages),
+            'bytes': sum(page['bytes'] for page in pages),
+            'resources': sum(page['resources'] for page in pages),
+            'total_load_ms': sum(load_times),
+            'average_load_ms': sum(load_times) / len(load_times) if load_times else None
+        }
+
+    def print_report(self, current_page=None):
+        """
+        Print the run's page load totals
+
+        Args:
+            current_page (dict, optional): Snapshot of a page not recorded yet
+        """
+        report = self.report(current_page)
+        if not report['pages']:
+            return
+        average = f"{report['average_load_ms']:.0f} ms" if report['average_load_ms'] is not None else "n/a"
+        print(f"📦 {report['pages']} pages, {report['bytes'] / 1024:.0f} KB downloaded over "
+              f"{report['resources']} resources, average DOM ready {average}")
@@ -0,0 +1,241 @@
+import tkinter as tk
+from tkinter import ttk
+import queue
+from naukri_index import bitmap_ids
+
+
+# (heading, job field) for each table column
+RESULT_COLUMNS = (
+    ('Job Title', 'title'),
+    ('Company', 'company'),
+    ('Experience', 'experience'),
+    ('Location', 'location'),
+    ('Rating', 'rating'),
+    ('Posted Date', 'posted_date'),
+    ('Job ID', 'job_id')
+)
+
+# Queue marker that empties the table
+_CLEAR = object()
+
+
+class VirtualJobTable:
+    """
+    Results table that stays responsive with hundreds of thousands of rows
+
+    Jobs are handed over through a thread-safe queue, so any thread may call
+    add_jobs/set_jobs/clear. The Tk thread drains the queue in bounded
+    batches from root.after. The Treeview only ever holds as many items as
+    fit on screen; scrolling rewrites their values from the stored rows
+    instead of inserting one Tk item per job.
+    """
+
+    def __init__(self, parent, batch_size=2000, poll_ms=50, height=10, index=None):
+        """
+        Args:
+            parent: Tk container to build the table in
+            batch_size (int): Maximum jobs moved from the queue per poll
+            poll_ms (int): Milliseconds between queue polls
+            height (int): Initial number of visible rows
+            index (JobIndex, optional): Index kept in step with the rows, needed
+                for set_filter
+        """
+        self.batch_size = batch_size
+        self.poll_ms = poll_ms
+        self.index = index
+        self.filter_query = ''
+        # "Showing x of y jobs", kept up to date for a label to display
+        self.count_var = tk.StringVar(value="")
+        self.frame = ttk.Frame(parent)
+        self.frame.columnconfigure(0, weight=1)
+        self.frame.rowconfigure(0, weight=1)
+
+        columns = [heading for heading, _ in RESULT_COLUMNS]
+        self.tree = ttk.Treeview(self.frame, columns=columns, show='headings', height=height)
+        for col in columns:
+            self.tree.heading(col, text=col)
+            self.tree.column(col, width=120, minwidth=80)
+
+        # The vertical scrollbar tracks the whole job list, not the Treeview's few items
+        self.v_scrollbar = ttk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self._on_scrollbar)
+        h_scrollbar = ttk.Scrollbar(self.frame, orient=tk.HORIZONTAL, command=self.tree.xview)
+        self.tree.configure(xscrollcommand=h_scrollbar.set)
+
+        self.tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.v_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        h_scrollbar.grid(row=1, column=0, sticky=(tk.W, tk.E))
+
+        self.jobs = []
+        self.rows = []
+        # Row indices currently shown, or None to show every row
+        self.view = None
+        self.offset = 0
+        self.slots = []
+        self.queue = queue.Queue()
+
+        self.tree.bind('<Configure>', self._on_resize)
+        self.tree.bind('<MouseWheel>', self._on_mousewheel)
+        self.tree.bind('<Button-4>', lambda event: self.scroll(-3))
+        self.tree.bind('<Button-5>', lambda event: self.scroll(3))
+        self._set_slot_count(height)
+        self.frame.after(self.poll_ms, self._drain)
+
+    def add_jobs(self, jobs):
+        """
+        Queue jobs to be appended to the table; safe to call from any thread
+
+        Args:
+            jobs (list): Job dictionaries or Job records
+        """
+        jobs = list(jobs)
+        for start in range(0, len(jobs), self.batch_size):
+            self.queue.put(jobs[start:start + self.batch_size])
+
+    def set_jobs(self, jobs):
+        """
+        Queue a full replacement of the table's contents; safe to call from any thread
+
+        Args:
+            jobs (list): Job dictionaries or Job records
+        """
+        self.clear()
+        self.add_jobs(jobs)
+
+    def clear(self):
+        """
+        Queue emptying the table; safe to call from any thread
+        """
+        self.queue.put(_CLEAR)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def _drain(self):
+        """Move a bounded batch of queued jobs into the table, then poll again"""
+        changed = False
+        moved = 0
+        while moved < self.batch_size:
+            try:
+                item = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            changed = True
+            if item is _CLEAR:
+                self.jobs = []
+                self.rows = []
+                self.view = [] if self.filter_query else None
+                self.offset = 0
+                if self.index is not None:
+                    self.index.clear()
+                continue
+            self.jobs.extend(item)
+            self.rows.extend(
+                tuple(job.get(field, 'N/A') for _, field in RESULT_COLUMNS) for job in item
+            )
+            if self.index is not None:
+                # Row numbers and index ids stay equal, both count jobs in arrival order
+                self.index.add_many(item)
+            if self.view is not None:
+                self._extend_view(len(self.rows) - len(item))
+            moved += len(item)
+
+        if changed:
+            self.refresh()
+        try:
+            self.frame.after(self.poll_ms, self._drain)
+        except tk.TclError:
+            # The window was closed
+            pass
+
+    def _extend_view(self, first_new_row):
+        """Take newly added rows into a filtered view"""
+        if self.filter_query and self.index is not None:
+            # Only the new rows' bits are turned into row numbers
+            new_matches = self.index.search_bitmap(self.filter_query) >> first_new_row
+            self.view.extend(bitmap_ids(new_matches, first_new_row))
+        else:
+            self.view.extend(range(first_new_row, len(self.rows)))
+
+    def set_filter(self, query):
+        """
+        Show only the rows matching an index query; call from the Tk thread
+
+        Rows that arrive later are filtered as they are added.
+
+        Args:
+            query (str): JobIndex query, empty to show every row
+
+        Returns:
+            int: Number of rows shown
+        """
+        if self.index is None:
+            raise RuntimeError("Filtering needs a JobIndex, pass index= when creating the table")
+        self.filter_query = query.strip()
+        self.view = self.index.search(self.filter_query) if self.filter_query else None
+        self.offset = 0
+        self.refresh()
+        return self._row_count()
+
+    def _row_count(self):
+        return len(self.rows) if self.view is None else len(self.view)
+
+    def _set_slot_count(self, count):
+        """Create or remove Treeview items so exactly count rows are on screen"""
+        count = max(1, count)
+        while len(self.slots) < count:
+            self.slots.append(self.tree.insert('', 'end', values=()))
+        while len(self.slots) > count:
+            self.tree.delete(self.slots.pop())
+
+    def refresh(self):
+        """
+        Redraw the visible window of rows and the scrollbar
+        """
+        total = self._row_count()
+        visible = len(self.slots)
+        self.offset = max(0, min(self.offset, total - visible))
+        for position, item in enumerate(self.slots):
+            index = self.offset + position
+            if index < total:
+                row = self.rows[index if self.view is None else self.view[index]]
+                self.tree.item(item, values=row)
+            else:
+                self.tree.item(item, values=())
+        if total:
+            self.v_scrollbar.set(self.offset / total, min(1.0, (self.offset + visible) / total))
+        else:
+            self.v_scrollbar.set(0.0, 1.0)
+        if self.view is None:
+            self.count_var.set(f"{total} jobs")
+        else:
+            self.count_var.set(f"Showing {total} of {len(self.rows)} jobs")
+
+    def scroll(self, rows):
+        """
+        Move the visible window
+
+        Args:
+            rows (int): Rows to move, negative to scroll up
+        """
+        self.offset += rows
+        self.refresh()
+
+    def _on_scrollbar(self, action, *args):
+        if action == 'moveto':
+            self.offset = int(float(args[0]) * self._row_count())
+            self.refresh()
+        elif action == 'scroll':
+            amount, unit = int(args[0]), args[1]
+            self.scroll(amount * len(self.slots) if unit == 'pages' else amount)
+
+    def _on_mousewheel(self, event):
+        # Windows reports multiples of 120 per notch, macOS small deltas
+        step = event.delta // 120 if abs(event.delta) >= 120 else event.delta
+        self.scroll(-step * 3)
+
+    def _on_resize(self, event):
+        style = ttk.Style()
+        row_height = int(style.lookup('Treeview', 'rowheight') or 20)
+        # Leave room for the heading row
+        self._set_slot_count((event.height - row_height - 4) // row_height)
+        self.refresh()
@@ -0,0 +1,322 @@
+"""
+Long-running scheduler for saved Naukri searches
+
+Usage:
+    python3 naukri_scheduler.py scheduler.json          # run until stopped
+    python3 naukri_scheduler.py scheduler.json --once   # run every search once and exit
+
+Example config:
+    {
+        "email": "you@example.com",
+        "password": "...",
+        "max_concurrent": 2,
+        "store": "naukri_jobs.db",
+        "output_dir": "scheduled_jobs",
+        "status_file": "naukri_scheduler_status.json",
+        "scraper_options": {"headless": true, "session_file": "~/.naukri_session.json"},
+        "searches": [
+            {"name": "python-blr", "job_title": "Python Developer", "location": "Bangalore",
+             "experience": "3", "max_jobs": 100, "max_pages": 5, "interval_minutes": 60}
+        ]
+    }
+
+Credentials can also come from the NAUKRI_EMAIL and NAUKRI_PASSWORD
+environment variables.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from naukri import NaukriLogin
+from naukri_output import JsonlJobWriter
+from naukri_pagination import normalize_query, slugify
+from naukri_store import JobStore, DEFAULT_STORE_FILE
+import argparse
+import json
+import os
+import random
+import signal
+import sys
+import threading
+import time
+
+
+DEFAULT_STATUS_FILE = "naukri_scheduler_status.json"
+DEFAULT_INTERVAL_MINUTES = 60
+DEFAULT_JITTER = 0.1
+
+
+def load_config(path):
+    """
+    Read a scheduler config file and fill in defaults
+
+    Args:
+        path (str): JSON config file
+
+    Returns:
+        dict: Config with credentials, limits and normalized searches
+
+    Raises:
+        ValueError: If the config has no searches or no credentials
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+
+    config.setdefault('email', os.environ.get('NAUKRI_EMAIL'))
+    config.setdefault('password', os.environ.get('NAUKRI_PASSWORD'))
+    if not config['email'] or not config['password']:
+        raise ValueError("Config needs email and password (or NAUKRI_EMAIL / NAUKRI_PASSWORD)")
+
+    searches = []
+    for spec in config.get('searches', []):
+        search = normalize_query(spec)
+        search['interval'] = float(spec.get('interval_minutes', DEFAULT_INTERVAL_MINUTES)) * 60
+        search['jitter'] = float(spec.get('jitter', DEFAULT_JITTER))
+        searches.append(search)
+    if not searches:
+        raise ValueError("Config has no searches")
+    names = [search['name'] for search in searches]
+    if len(set(names)) != len(names):
+        raise ValueError("Search names must be unique")
+
+    config['searches'] = searches
+    config.setdefault('max_concurrent', 1)
+    config.setdefault('store', DEFAULT_STORE_FILE)
+    config.setdefault('output_dir', "scheduled_jobs")
+    config.setdefault('status_file', DEFAULT_STATUS_FILE)
+    config.setdefault('scraper_options', {})
+    return config
+
+
+class SearchScheduler:
+    """
+    Runs saved searches on their own intervals with warm, reused browser sessions
+
+    Each search is scheduled interval +/- jitter after its last run finished.
+    At most max_concurrent searches run at once, each on a logged-in browser
+    that is kept open between runs. Only jobs that are new or changed since
+    they were last stored are appended to the search's JSON Lines file, and
+    the scheduler state is written to a status file after every change.
+    """
+
+    def __init__(self, config):
+        """
+        Args:
+            config (dict): Config as returned by load_config
+        """
+        self.config = config
+        self.searches = {search['name']: search for search in config['searches']}
+        self.max_concurrent = max(1, int(config['max_concurrent']))
+        self.status_file = config['status_file']
+        self.output_dir = config['output_dir']
+        self.scraper_options = dict(config['scraper_options'])
+        # The scheduler compares against the store before writing to it itself
+        self.scraper_options.pop('job_store', None)
+        self.scraper_options.setdefault('headless', True)
+
+        self.store = JobStore(config['store'])
+        self.stop_event = threading.Event()
+        self.lock = threading.Lock()
+        self.status_write_lock = threading.Lock()
+        self.idle_scrapers = []
+        self.running = set()
+        self.next_run = {}
+        self.status = {
+            name: {'runs': 0, 'failures': 0, 'last_started': None, 'last_finished': None,
+                   'last_duration': None, 'last_status': None, 'last_jobs': None,
+                   'last_new_or_changed': None, 'next_run': None}
+            for name in self.searches
+        }
+        self.started = time.time()
+        os.makedirs(self.output_dir, exist_ok=True)
+
+    def _jittered(self, search):
+        """Seconds until a search's next run"""
+        return search['interval'] * (1 + random.uniform(-search['jitter'], search['jitter']))
+
+    def _checkout_scraper(self):
+        """
+        Take an idle logged-in browser, or start and log in a new one
+
+        Returns:
+            NaukriLogin: Scraper reserved for the caller
+
+        Raises:
+            RuntimeError: If a new browser could not log in
+        """
+        with self.lock:
+            if self.idle_scrapers:
+                return self.idle_scrapers.pop()
+
+        scraper = NaukriLogin(self.config['email'], self.config['password'],
+                              stop_event=self.stop_event, **self.scraper_options)
+        if not scraper.login():
+            scraper.close()
+            raise RuntimeError("Login failed")
+        return scraper
+
+    def _return_scraper(self, scraper, healthy):
+        """Keep a browser warm for the next run, or close it after a failure"""
+        if healthy and not self.stop_event.is_set():
+            with self.lock:
+                self.idle_scrapers.append(scraper)
+        else:
+            scraper.close()
+
+    def run_search(self, name):
+        """
+        Scrape one saved search and store what changed
+
+        Args:
+            name (str): Search name
+
+        Returns:
+            tuple: (jobs scraped, jobs new or changed)
+        """
+        search = self.searches[name]
+        scraper = self._checkout_scraper()
+        healthy = False
+        try:
+            if not scraper.open_search(search['job_title'], search['location'], search['experience']):
+                raise RuntimeError("Results page did not load")
+            jobs = scraper.extract_job_listings_with_pagination(max_jobs=search['max_jobs'],
+                                                                max_pages=search['max_pages'])
+            changed = self.store.changed_jobs(jobs)
+            if changed:
+                path = os.path.join(self.output_dir, f"{slugify(name) or 'search'}.jsonl")
+                with JsonlJobWriter(path) as writer:
+                    writer.write_page(changed)
+            self.store.save_jobs(jobs)
+            healthy = True
+            return len(jobs), len(changed)
+        finally:
+            self._return_scraper(scraper, healthy)
+
+    def _run_and_record(self, name):
+        """Run a search in a worker thread and update its status and next run time"""
+        started = time.time()
+        with self.lock:
+            self.status[name]['last_started'] = started
+        self.write_status()
+
+        try:
+            jobs, changed = self.run_search(name)
+            outcome = {'last_status': 'ok', 'last_jobs': jobs, 'last_new_or_changed': changed}
+            print(f"✅ Search '{name}': {jobs} jobs, {changed} new or changed")
+        except Exception as e:
+            outcome = {'last_status': f"error: {e}"}
+            print(f"❌ Search '{name}' failed: {e}")
+
+        finished = time.time()
+        with self.lock:
+            status = self.status[name]
+            status.update(outcome)
+            status['runs'] += 1
+            if outcome['last_status'] != 'ok':
+                status['failures'] += 1
+            status['last_finished'] = finished
+            status['last_duration'] = finished - started
+            self.next_run[name] = finished + self._jittered(self.searches[name])
+            status['next_run'] = self.next_run[name]
+            self.running.discard(name)
+        self.write_status()
+
+    def write_status(self):
+        """
+        Write scheduler and per-search state to the status file
+        """
+        with self.lock:
+            snapshot = {
+                'pid': os.getpid(),
+                'started': self.started,
+                'updated': time.time(),
+                'stopping': self.stop_event.is_set(),
+                'running': sorted(self.running),
+                'warm_browsers': len(self.idle_scrapers),
+                'searches': {name: dict(status) for name, status in self.status.items()}
+            }
+        temp_path = f"{self.status_file}.tmp"
+        with self.status_write_lock:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f, indent=2)
+            os.replace(temp_path, self.status_file)
+
+    def stop(self, *_):
+        """
+        Ask the scheduler to stop; running searches bail out at their next wait
+        """
+        if not self.stop_event.is_set():
+            print("🛑 Stopping scheduler...")
+        self.stop_event.set()
+
+    def run(self, once=False):
+        """
+        Run searches until stopped
+
+        Args:
+            once (bool): Run every search a single time and return
+        """
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGINT, self.stop)
+            signal.signal(signal.SIGTERM, self.stop)
+
+        # Spread the first runs out a little so the searches don't all start together
+        now = time.time()
+        for name, search in self.searches.items():
+            self.next_run[name] = now + random.uniform(0, search['interval'] * search['jitter'])
+            self.status[name]['next_run'] = self.next_run[name]
+        completed = set()
+
+        print(f"🗓️ Scheduling {len(self.searches)} searches, at most {self.max_concurrent} at once")
+        executor = ThreadPoolExecutor(max_workers=self.max_concurrent, thread_name_prefix="naukri-scheduler")
+        try:
+            while not self.stop_event.is_set():
+                now = time.time()
+                with self.lock:
+                    due = [name for name, when in self.next_run.items()
+                           if when <= now and name not in self.running and not (once and name in completed)]
+                    self.running.update(due)
+                    completed.update(due)
+                for name in due:
+                    executor.submit(self._run_and_record, name)
+                if due:
+                    self.write_status()
+
+                with self.lock:
+                    if once and completed == set(self.searches) and not self.running:
+                        break
+                    waiting = [when for name, when in self.next_run.items() if name not in self.running]
+                # Wake at least once a second to pick up searches that just finished
+                self.stop_event.wait(min(max(min(waiting, default=now + 1) - now, 0.1), 1.0))
+        finally:
+            self.stop_event.set()
+            executor.shutdown(wait=True)
+            self.close()
+
+    def close(self):
+        """
+        Close every warm browser and the job store
+        """
+        with self.lock:
+            scrapers, self.idle_scrapers = self.idle_scrapers, []
+        for scraper in scrapers:
+            scraper.close()
+        self.write_status()
+        self.store.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run saved Naukri searches on a schedule")
+    parser.add_argument("config", help="JSON config file with credentials and saved searches")
+    parser.add_argument("--once", action="store_true", help="Run every search once and exit")
+    args = parser.parse_args(argv)
+
+    try:
+        config = load_config(args.config)
+    except (OSError, ValueError) as e:
+        print(f"❌ Could not load {args.config}: {e}")
+        return 1
+
+    SearchScheduler(config).run(once=args.once)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
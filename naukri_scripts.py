@@ -0,0 +1,98 @@
+# JavaScript snippets executed inside the browser through driver.execute_script
+
+
+# Walks every job card in one call and returns plain objects shaped like the
+# job dictionaries built by naukri_parser.parse_job_card.
+#   arguments[0]: field -> list of XPath fallbacks (naukri_parser.SELECTORS)
+#   arguments[1]: maximum number of cards to read
+#   arguments[2]: job card class name
+EXTRACT_JOBS_SCRIPT = """
+var selectors = arguments[0];
+var maxResults = arguments[1];
+var cardClass = arguments[2];
+
+function clean(value) {
+    return value ? String(value).split(/\\s+/).filter(Boolean).join(' ') : '';
+}
+
+function first(card, xpath) {
+    return document.evaluate(xpath, card, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+}
+
+function all(card, xpath) {
+    var result = document.evaluate(xpath, card, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    var nodes = [];
+    for (var i = 0; i < result.snapshotLength; i++) {
+        nodes.push(result.snapshotItem(i));
+    }
+    return nodes;
+}
+
+function match(card, field, accept, useTitle) {
+    var candidates = selectors[field];
+    for (var i = 0; i < candidates.length; i++) {
+        var element = first(card, candidates[i]);
+        if (!element) {
+            continue;
+        }
+        var value = useTitle ? (clean(element.getAttribute('title')) || clean(element.textContent)) : clean(element.textContent);
+        if (accept ? accept(value) : value) {
+            return {element: element, value: value};
+        }
+    }
+    return null;
+}
+
+function isExperience(text) {
+    var lower = text.toLowerCase();
+    return !!text && (lower.indexOf('yr') !== -1 || lower.indexOf('exp') !== -1);
+}
+
+function isLocation(text) {
+    return !!text && text.length > 2;
+}
+
+var cards = Array.prototype.slice.call(document.getElementsByClassName(cardClass));
+if (maxResults !== null && maxResults !== undefined) {
+    cards = cards.slice(0, maxResults);
+}
+
+return cards.map(function (card) {
+    var job = {};
+
+    var title = match(card, 'title');
+    if (title) {
+        job.title = title.value;
+        job.link = title.element.getAttribute('href') !== null ? title.element.href : null;
+    } else {
+        job.title = 'N/A';
+        job.link = 'N/A';
+    }
+
+    var company = match(card, 'company');
+    job.company = company ? company.value : 'N/A';
+
+    var rating = first(card, selectors.rating[0]);
+    job.rating = rating ? clean(rating.textContent) : 'N/A';
+
+    var experience = match(card, 'experience', isExperience, true);
+    job.experience = experience ? experience.value : 'N/A';
+
+    var location = match(card, 'location', isLocation, true);
+    job.location = location ? location.value : 'N/A';
+
+    var description = match(card, 'description');
+    job.description = description ? description.value : 'N/A';
+
+    job.skills = all(card, selectors.skills[0])
+        .map(function (skill) { return clean(skill.textContent); })
+        .filter(Boolean);
+
+    var postedDate = match(card, 'posted_date');
+    job.posted_date = postedDate ? postedDate.value : 'N/A';
+
+    job.job_id = card.getAttribute('data-job-id');
+
+    return job;
+});
+"""
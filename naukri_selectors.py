@@ -0,0 +1,118 @@
+from naukri_parser import SELECTORS
+import json
+import os
+import threading
+
+
+DEFAULT_SELECTOR_FILE = os.path.expanduser("~/.naukri_selectors.json")
+
+
+class SelectorResolver:
+    """
+    Learns which fallback selector works for each job field and tries it first
+
+    Whenever a selector further down a field's list is the one that matches,
+    it is moved to the front, so once the page layout settles every card
+    tries about one selector per field. Every recheck_every lookups the
+    field's original order from SELECTORS is used instead, so a preferred
+    selector that starts matching again wins its place back.
+    """
+
+    def __init__(self, path=None, recheck_every=100, selectors=SELECTORS):
+        """
+        Args:
+            path (str, optional): JSON file the learned order is loaded from and
+                saved to, kept in memory only if not given
+            recheck_every (int): Use the original order once every this many
+                lookups of a field, 0 to never recheck
+            selectors (dict): Field -> fallback list in preferred order
+        """
+        self.path = os.path.expanduser(path) if path else None
+        self.recheck_every = recheck_every
+        self.defaults = {field: list(candidates) for field, candidates in selectors.items()}
+        self.order = {field: list(candidates) for field, candidates in selectors.items()}
+        self.lookups = {}
+        self.promotions = 0
+        self.lock = threading.Lock()
+        if path:
+            self.load()
+
+    def candidates(self, field):
+        """
+        Selectors to try for a field, most likely match first
+
+        Args:
+            field (str): Key into SELECTORS
+
+        Returns:
+            list: Selectors in the order they should be tried
+        """
+        with self.lock:
+            count = self.lookups.get(field, 0) + 1
+            self.lookups[field] = count
+            if self.recheck_every and count % self.recheck_every == 0:
+                return list(self.defaults[field])
+            return list(self.order[field])
+
+    def record(self, field, selector):
+        """
+        Note which selector matched a field and move it to the front
+
+        Args:
+            field (str): Key into SELECTORS
+            selector (str): Selector that matched
+        """
+        with self.lock:
+            order = self.order[field]
+            if order[0] == selector or selector not in order:
+                return
+            order.remove(selector)
+            order.insert(0, selector)
+            self.promotions += 1
+
+    def ordered_selectors(self):
+        """
+        Current order of every field's selectors
+
+        Returns:
+            dict: Field -> selectors, in the same shape as SELECTORS
+        """
+        with self.lock:
+            return {field: list(order) for field, order in self.order.items()}
+
+    def load(self):
+        """
+        Load the learned order, ignoring selectors that are no longer in SELECTORS
+        """
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Could not read selector order from {self.path}: {e}")
+            return
+
+        with self.lock:
+            for field, defaults in self.defaults.items():
+                learned = [selector for selector in saved.get(field, []) if selector in defaults]
+                self.order[field] = learned + [selector for selector in defaults if selector not in learned]
+
+    def save(self):
+        """
+        Save the learned order so the next run starts from it
+        """
+        if not self.path:
+            return
+        # Pool workers may share one file, so each writes its own temp file
+        temp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.ordered_selectors(), f, indent=2)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
@@ -0,0 +1,159 @@
+from naukri_pagination import NAUKRI_BASE_URL
+import json
+import os
+import tempfile
+import time
+
+
+DEFAULT_SESSION_FILE = os.path.join(os.path.expanduser("~"), ".naukri_session.json")
+
+# Page on the Naukri domain that is cheap to load; cookies can only be set for
+# the domain the browser is currently on.
+COOKIE_DOMAIN_URL = f"{NAUKRI_BASE_URL}/robots.txt"
+
+# Logged-in landing page, redirects to the login form when the session is gone
+SESSION_CHECK_URL = f"{NAUKRI_BASE_URL}/mnjuser/homepage"
+
+READ_LOCAL_STORAGE_SCRIPT = """
+var data = {};
+for (var i = 0; i < window.localStorage.length; i++) {
+    var key = window.localStorage.key(i);
+    data[key] = window.localStorage.getItem(key);
+}
+return data;
+"""
+
+WRITE_LOCAL_STORAGE_SCRIPT = """
+var data = arguments[0];
+Object.keys(data).forEach(function (key) {
+    window.localStorage.setItem(key, data[key]);
+});
+"""
+
+
+class SessionStore:
+    """
+    Saves an authenticated browser session to disk and restores it later
+
+    The session file holds the cookies and local storage of the logged-in
+    browser. It is written with owner-only permissions since anyone who can
+    read it can act as the logged-in user.
+    """
+
+    def __init__(self, path=DEFAULT_SESSION_FILE, max_age_hours=72):
+        """
+        Args:
+            path (str): Session file location, "~" is expanded
+            max_age_hours (float): Sessions older than this are not restored
+        """
+        self.path = os.path.expanduser(path)
+        self.max_age_hours = max_age_hours
+
+    def save(self, driver, email=None):
+        """
+        Save the browser's cookies and local storage
+
+        Args:
+            driver: Selenium WebDriver on a Naukri page
+            email (str, optional): Account the session belongs to
+
+        Returns:
+            bool: True if the session was written
+        """
+        try:
+            session = {
+                'email': email,
+                'saved_at': time.time(),
+                'cookies': driver.get_cookies(),
+                'local_storage': driver.execute_script(READ_LOCAL_STORAGE_SCRIPT) or {}
+            }
+
+            # Write to a private temp file first so a crash never leaves a half-written session
+            directory = os.path.dirname(os.path.abspath(self.path))
+            fd, temp_path = tempfile.mkstemp(prefix=".naukri_session_", dir=directory)
+            try:
+                os.chmod(temp_path, 0o600)
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(session, f)
+                os.replace(temp_path, self.path)
+            except Exception:
+                os.unlink(temp_path)
+                raise
+
+            print(f"💾 Session saved to {self.path}")
+            return True
+        except Exception as e:
+            print(f"❌ Could not save session: {e}")
+            return False
+
+    def load(self, email=None):
+        """
+        Read a saved session if it is recent enough and belongs to the account
+
+        Args:
+            email (str, optional): Account the session must belong to
+
+        Returns:
+            dict: Saved session, or None
+        """
+        if not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                session = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Ignoring unreadable session file: {e}")
+            return None
+
+        if email and session.get('email') and session['email'] != email:
+            print("⚠️ Saved session belongs to a different account")
+            return None
+        age_hours = (time.time() - session.get('saved_at', 0)) / 3600
+        if age_hours > self.max_age_hours:
+            print(f"⚠️ Saved session is {age_hours:.0f} hours old, ignoring it")
+            return None
+        return session
+
+    def restore(self, driver, email=None, navigate=None):
+        """
+        Load the saved cookies and local storage into the browser
+
+        Args:
+            driver: Selenium WebDriver
+            email (str, optional): Account the session must belong to
+            navigate (callable, optional): Opens a URL, e.g. NaukriLogin.navigate so
+                the page load is counted; driver.get by default
+
+        Returns:
+            bool: True if a session was applied (it may still have expired server-side)
+        """
+        session = self.load(email)
+        if not session:
+            return False
+
+        try:
+            (navigate or driver.get)(COOKIE_DOMAIN_URL)
+            for cookie in session.get('cookies', []):
+                cookie = dict(cookie)
+                # Chrome rejects sameSite values it doesn't know and fractional expiries
+                if cookie.get('sameSite') not in ('Strict', 'Lax', 'None'):
+                    cookie.pop('sameSite', None)
+                if 'expiry' in cookie:
+                    cookie['expiry'] = int(cookie['expiry'])
+                try:
+                    driver.add_cookie(cookie)
+                except Exception as e:
+                    print(f"⚠️ Skipping cookie {cookie.get('name')}: {e}")
+            if session.get('local_storage'):
+                driver.execute_script(WRITE_LOCAL_STORAGE_SCRIPT, session['local_storage'])
+            return True
+        except Exception as e:
+            print(f"❌ Could not restore session: {e}")
+            return False
+
+    def clear(self):
+        """
+        Delete the saved session
+        """
+        if os.path.exists(self.path):
+            os.remove(self.path)
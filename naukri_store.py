@@ -0,0 +1,258 @@
+import json
+import sqlite3
+import threading
+import time
+
+
+DEFAULT_STORE_FILE = "naukri_jobs.db"
+
+# job_id is the primary key, which SQLite already backs with a unique index
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    title TEXT,
+    link TEXT,
+    company TEXT,
+    rating TEXT,
+    experience TEXT,
+    location TEXT,
+    description TEXT,
+    skills TEXT,
+    posted_date TEXT,
+    data TEXT NOT NULL,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    enriched_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs(company);
+CREATE INDEX IF NOT EXISTS idx_jobs_posted_date ON jobs(posted_date);
+"""
+
+# Columns added after the first release, created on older databases when opened
+_MIGRATIONS = {
+    'enriched_at': "ALTER TABLE jobs ADD COLUMN enriched_at REAL"
+}
+
+# SQLite caps the number of bound parameters per statement
+_MAX_PARAMS = 900
+
+# Card fields compared to decide whether a stored job changed. posted_date is
+# relative ("3 Days Ago") and changes daily on its own, so it is left out.
+CHANGE_FIELDS = ('title', 'link', 'company', 'rating', 'experience', 'location', 'description', 'skills')
+
+
+class JobStore:
+    """
+    Local SQLite database of every job seen, keyed by job_id
+
+    Safe to share between threads; all access goes through one connection
+    guarded by a lock.
+    """
+
+    def __init__(self, path=DEFAULT_STORE_FILE):
+        """
+        Args:
+            path (str): Database file, ":memory:" for a throwaway store
+        """
+        self.path = path
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.row_factory = sqlite3.Row
+        with self.lock, self.connection:
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.executescript(SCHEMA)
+            columns = {row[1] for row in self.connection.execute("PRAGMA table_info(jobs)")}
+            for column, statement in _MIGRATIONS.items():
+                if column not in columns:
+                    self.connection.execute(statement)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def known_job_ids(self, job_ids):
+        """
+        Which of the given job ids are already stored
+
+        Args:
+            job_ids (iterable): Job ids to look up
+
+        Returns:
+            set: Stored job ids
+        """
+        with self.lock:
+            return self._known_job_ids(job_ids)
+
+    def _known_job_ids(self, job_ids):
+        """known_job_ids for callers that already hold the lock"""
+        job_ids = [job_id for job_id in set(job_ids) if job_id]
+        known = set()
+        for start in range(0, len(job_ids), _MAX_PARAMS):
+            chunk = job_ids[start:start + _MAX_PARAMS]
+            placeholders = ", ".join("?" * len(chunk))
+            rows = self.connection.execute(
+                f"SELECT job_id FROM jobs WHERE job_id IN ({placeholders})", chunk
+            )
+            known.update(row[0] for row in rows)
+        return known
+
+    def save_jobs(self, jobs):
+        """
+        Insert new jobs and refresh the ones already stored
+
+        Args:
+            jobs (list): Job dictionaries; jobs without a job_id are skipped
+
+        Returns:
+            list: Job ids that were not stored before
+        """
+        jobs = [job for job in jobs if job.get('job_id')]
+        if not jobs:
+            return []
+
+        now = time.time()
+        rows = [
+            (
+                job['job_id'], job.get('title'), job.get('link'), job.get('company'), job.get('rating'),
+                job.get('experience'), job.get('location'), job.get('description'),
+                json.dumps(job.get('skills', []), ensure_ascii=False), job.get('posted_date'),
+                # Detail fields from an earlier enrichment survive card-only updates via json_patch
+                json.dumps(job, ensure_ascii=False), now, now
+            )
+            for job in jobs
+        ]
+
+        # The check and the insert share one locked transaction, so concurrent
+        # pool workers cannot both count the same job as new
+        with self.lock, self.connection:
+            known = self._known_job_ids(job['job_id'] for job in jobs)
+            self.connection.executemany("""
+                INSERT INTO jobs (job_id, title, link, company, rating, experience, location,
+                                  description, skills, posted_date, data, first_seen, last_seen)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(job_id) DO UPDATE SET
+                    title = excluded.title, link = excluded.link, company = excluded.company,
+                    rating = excluded.rating, experience = excluded.experience,
+                    location = excluded.location, description = excluded.description,
+                    skills = excluded.skills, posted_date = excluded.posted_date,
+                    data = json_patch(jobs.data, excluded.data), last_seen = excluded.last_seen
+            """, rows)
+
+        new_job_ids = []
+        for job in jobs:
+            if job['job_id'] not in known and job['job_id'] not in new_job_ids:
+                new_job_ids.append(job['job_id'])
+        return new_job_ids
+
+    def changed_jobs(self, jobs):
+        """
+        Jobs that are not stored yet or whose card fields differ from the stored copy
+
+        Args:
+            jobs (list): Job dictionaries
+
+        Returns:
+            list: New or changed jobs, in the given order
+        """
+        job_ids = list({job['job_id'] for job in jobs if job.get('job_id')})
+        stored = {}
+        with self.lock:
+            for start in range(0, len(job_ids), _MAX_PARAMS):
+                chunk = job_ids[start:start + _MAX_PARAMS]
+                placeholders = ", ".join("?" * len(chunk))
+                rows = self.connection.execute(
+                    f"SELECT job_id, data FROM jobs WHERE job_id IN ({placeholders})", chunk
+                )
+                stored.update((row['job_id'], json.loads(row['data'])) for row in rows)
+
+        changed = []
+        for job in jobs:
+            previous = stored.get(job.get('job_id'))
+            if not job.get('job_id'):
+                continue
+            if previous is None or any(job.get(field) != previous.get(field) for field in CHANGE_FIELDS):
+                changed.append(job)
+        return changed
+
+    def recently_enriched_job_ids(self, job_ids, since):
+        """
+        Which of the given jobs were enriched from their detail page after a point in time
+
+        Args:
+            job_ids (iterable): Job ids to check
+            since (float): Unix timestamp
+
+        Returns:
+            set: Job ids enriched at or after since
+        """
+        job_ids = [job_id for job_id in set(job_ids) if job_id]
+        recent = set()
+        with self.lock:
+            for start in range(0, len(job_ids), _MAX_PARAMS):
+                chunk = job_ids[start:start + _MAX_PARAMS]
+                placeholders = ", ".join("?" * len(chunk))
+                rows = self.connection.execute(
+                    f"SELECT job_id FROM jobs WHERE enriched_at >= ? AND job_id IN ({placeholders})",
+                    [since] + chunk
+                )
+                recent.update(row[0] for row in rows)
+        return recent
+
+    def save_enrichment(self, jobs):
+        """
+        Store jobs that were filled in from their detail pages
+
+        Args:
+            jobs (list): Enriched job dictionaries carrying 'enriched_at'
+        """
+        self.save_jobs(jobs)
+        rows = [(job['enriched_at'], job['job_id']) for job in jobs if job.get('job_id')]
+        with self.lock, self.connection:
+            self.connection.executemany("UPDATE jobs SET enriched_at = ? WHERE job_id = ?", rows)
+
+    def get_job(self, job_id):
+        """
+        Fetch one stored job
+
+        Args:
+            job_id (str): Job id
+
+        Returns:
+            dict: Job dictionary, or None if it isn't stored
+        """
+        with self.lock:
+            row = self.connection.execute("SELECT data FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return json.loads(row['data']) if row else None
+
+    def jobs_by_company(self, company):
+        """
+        All stored jobs posted by a company
+
+        Args:
+            company (str): Company name as scraped
+
+        Returns:
+            list: Job dictionaries
+        """
+        with self.lock:
+            rows = self.connection.execute("SELECT data FROM jobs WHERE company = ?", (company,)).fetchall()
+        return [json.loads(row['data']) for row in rows]
+
+    def count(self):
+        """
+        Number of stored jobs
+
+        Returns:
+            int: Job count
+        """
+        with self.lock:
+            return self.connection.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def close(self):
+        """
+        Close the database connection
+        """
+        with self.lock:
+            self.connection.close()
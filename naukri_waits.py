@@ -0,0 +1,248 @@
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
+import time
+
+
+# Returns how many network resources the page has requested so far and whether
+# the document has finished loading. Polled to detect network idle.
+NETWORK_ACTIVITY_SCRIPT = """
+return [performance.getEntriesByType('resource').length, document.readyState];
+"""
+
+
+class ScrapeCancelled(Exception):
+    """Raised inside a wait once the scrape has been asked to stop"""
+
+
+class WaitStrategy:
+    """
+    Condition-based waits with per-step timeouts that adapt to observed latency
+
+    Every wait belongs to a named step (e.g. "login", "results", "next_page").
+    The time spent waiting is recorded per step and the step's timeout is
+    recalculated from a moving average of how long its conditions took to hold,
+    so slow networks get longer timeouts and fast ones stop paying for them.
+    """
+
+    DEFAULT_TIMEOUTS = {
+        'login': 15,
+        'search_form': 10,
+        'dropdown': 5,
+        'results': 15,
+        'next_page': 15,
+        'network_idle': 10
+    }
+
+    def __init__(self, driver, timeouts=None, min_timeout=3, max_timeout=60,
+                 latency_factor=4, smoothing=0.3, poll_frequency=0.1, cancel_event=None):
+        """
+        Args:
+            driver: Selenium WebDriver instance
+            timeouts (dict, optional): Initial timeout in seconds per step
+            min_timeout (float): Lower bound for adapted timeouts
+            max_timeout (float): Upper bound for adapted timeouts
+            latency_factor (float): Timeout as a multiple of the average wait
+            smoothing (float): Weight of the newest sample in the moving average
+            poll_frequency (float): Seconds between condition checks
+            cancel_event (threading.Event, optional): When set, any running wait
+                raises ScrapeCancelled at its next poll
+        """
+        self.driver = driver
+        self.timeouts = dict(self.DEFAULT_TIMEOUTS)
+        if timeouts:
+            self.timeouts.update(timeouts)
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.latency_factor = latency_factor
+        self.smoothing = smoothing
+        self.poll_frequency = poll_frequency
+        self.cancel_event = cancel_event
+
+        self.average_latency = {}
+        self.stats = {}
+
+    def timeout_for(self, step):
+        """
+        Current timeout for a step
+
+        Args:
+            step (str): Step name
+
+        Returns:
+            float: Timeout in seconds
+        """
+        if step not in self.average_latency:
+            return self.timeouts.get(step, self.max_timeout)
+        adapted = self.average_latency[step] * self.latency_factor
+        return max(self.min_timeout, min(self.max_timeout, adapted))
+
+    def record(self, step, seconds, timed_out=False):
+        """
+        Record one wait and update the step's latency estimate
+
+        Args:
+            step (str): Step name
+            seconds (float): Time spent waiting
+            timed_out (bool): Whether the wait gave up
+        """
+        stats = self.stats.setdefault(step, {'waits': 0, 'total': 0.0, 'max': 0.0, 'timeouts': 0})
+        stats['waits'] += 1
+        stats['total'] += seconds
+        stats['max'] = max(stats['max'], seconds)
+
+        if timed_out:
+            stats['timeouts'] += 1
+            # The condition needed more than we allowed, so back off for next time
+            sample = seconds * 2
+        else:
+            sample = seconds
+
+        if step in self.average_latency:
+            previous = self.average_latency[step]
+            self.average_latency[step] = previous + self.smoothing * (sample - previous)
+        else:
+            self.average_latency[step] = sample
+
+    def until(self, step, condition, timeout=None):
+        """
+        Wait for a condition and record how long it took
+
+        Args:
+            step (str): Step name used for timeouts and reporting
+            condition (callable): Selenium-style condition taking the driver
+            timeout (float, optional): Override the step's adaptive timeout
+
+        Returns:
+            The condition's truthy result
+
+        Raises:
+            TimeoutException: If the condition did not hold in time
+            ScrapeCancelled: If the cancel event was set while waiting
+        """
+        timeout = timeout if timeout is not None else self.timeout_for(step)
+        cancel_event = self.cancel_event
+
+        def cancellable(driver):
+            if cancel_event is not None and cancel_event.is_set():
+                raise ScrapeCancelled(f"Cancelled while waiting for {step}")
+            return condition(driver)
+
+        start = time.perf_counter()
+        try:
+            result = WebDriverWait(self.driver, timeout, poll_frequency=self.poll_frequency).until(cancellable)
+        except TimeoutException:
+            self.record(step, time.perf_counter() - start, timed_out=True)
+            raise
+        self.record(step, time.perf_counter() - start)
+        return result
+
+    def for_element(self, step, locator, clickable=False, visible=False):
+        """
+        Wait for an element to be present, visible or clickable
+
+        Args:
+            step (str): Step name
+            locator (tuple): (By, selector)
+            clickable (bool): Require the element to be clickable
+            visible (bool): Require the element to be visible
+
+        Returns:
+            WebElement: The located element
+        """
+        if clickable:
+            condition = EC.element_to_be_clickable(locator)
+        elif visible:
+            condition = EC.visibility_of_element_located(locator)
+        else:
+            condition = EC.presence_of_element_located(locator)
+        return self.until(step, condition)
+
+    def for_elements(self, step, locator):
+        """
+        Wait until at least one element matches
+
+        Args:
+            step (str): Step name
+            locator (tuple): (By, selector)
+
+        Returns:
+            list: Matching WebElements
+        """
+        return self.until(step, EC.presence_of_all_elements_located(locator))
+
+    def for_staleness(self, step, element):
+        """
+        Wait for an element from the previous page to be detached from the DOM
+
+        Args:
+            step (str): Step name
+            element: WebElement that should go stale
+        """
+        return self.until(step, EC.staleness_of(element))
+
+    def for_url_change(self, step, old_url):
+        """
+        Wait for the browser to leave a URL
+
+        Args:
+            step (str): Step name
+            old_url (str): URL before the navigation
+
+        Returns:
+            bool: True once the URL changed
+        """
+        return self.until(step, EC.url_changes(old_url))
+
+    def for_network_idle(self, step='network_idle', idle_time=0.5):
+        """
+        Wait until the document is loaded and no new resources were requested
+        for idle_time seconds
+
+        Args:
+            step (str): Step name
+            idle_time (float): Quiet period that counts as idle
+
+        Returns:
+            bool: True once the network went idle
+        """
+        state = {'count': None, 'since': None}
+
+        def network_idle(driver):
+            try:
+                count, ready_state = driver.execute_script(NETWORK_ACTIVITY_SCRIPT)
+            except StaleElementReferenceException:
+                return False
+            now = time.perf_counter()
+            if ready_state != 'complete' or count != state['count']:
+                state['count'] = count
+                state['since'] = now
+                return False
+            return now - state['since'] >= idle_time
+
+        return self.until(step, network_idle)
+
+    def report(self):
+        """
+        Time spent waiting per step
+
+        Returns:
+            dict: step -> waits, total, max and timeouts counts plus the current timeout
+        """
+        return {
+            step: dict(stats, average=stats['total'] / stats['waits'], timeout=self.timeout_for(step))
+            for step, stats in self.stats.items()
+        }
+
+    def print_report(self):
+        """
+        Print the time spent waiting per step
+        """
+        report = self.report()
+        if not report:
+            return
+        total = sum(stats['total'] for stats in report.values())
+        print(f"⏱️ Time spent waiting: {total:.2f}s")
+        for step, stats in sorted(report.items(), key=lambda item: -item[1]['total']):
+            print(f"  {step}: {stats['total']:.2f}s over {stats['waits']} waits "
+                  f"(max {stats['max']:.2f}s, {stats['timeouts']} timeouts, timeout now {stats['timeout']:.1f}s)")